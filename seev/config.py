@@ -15,8 +15,10 @@ Backward compatibility:
 - Legacy glin.toml configuration files are still read if seev.toml is not present.
 """
 
+import functools
 import os
 import subprocess
+import time
 import tomllib
 from pathlib import Path
 
@@ -59,61 +61,95 @@ def _get_config_file_emails() -> list[str]:
     Returns:
         List of emails from config file, or empty list if file doesn't exist or has no emails.
     """
-    config_paths = [
-        # Prefer Seev config names
-        Path.cwd() / "seev.toml",
-        Path.home() / ".config" / "seev" / "seev.toml",
-        Path.home() / ".seev.toml",
-        # Backward-compatible legacy Glin locations
-        Path.cwd() / "glin.toml",
-        Path.home() / ".config" / "glin" / "glin.toml",
-        Path.home() / ".glin.toml",
-    ]
-
-    for config_path in config_paths:
-        if config_path.exists():
-            try:
-                with open(config_path, "rb") as f:
-                    data = tomllib.load(f)
-                emails = data.get("track_emails", [])
-                if emails:
-                    return emails
-            except (tomllib.TOMLDecodeError, OSError):
-                # If config file is malformed, continue to next location
-                continue
+    return _load_config().get("track_emails") or []
 
-    return []
+
+# Parsed config files keyed by path, with the (mtime_ns, size) they were parsed at. Tools
+# read config on every call; re-parsing only happens after the file changes.
+_CONFIG_FILE_CACHE: dict[str, tuple[tuple[int, int], dict | None]] = {}
+
+# Git author pattern per working directory (repo-local git config can differ), reused for
+# a few seconds like the config tools' `git config --get` answers, so an edited identity
+# is picked up without spawning git on every lookup.
+_AUTHOR_PATTERN_TTL_SECONDS = 5.0
+_AUTHOR_PATTERN_CACHE: dict[str, tuple[float, str | None]] = {}
+
+
+# Merged config and first existing config file per (cwd, home), kept for a few seconds.
+# Even unchanged files cost six stat() calls per lookup, and tools look config up
+# several times per call; a short TTL still picks up files edited outside the process.
+_CONFIG_LOOKUP_TTL_SECONDS = 5.0
+_CONFIG_LOOKUP_CACHE: dict[tuple[str, str], tuple[float, dict, Path | None]] = {}
+
+
+def clear_config_lookup_cache() -> None:
+    """Drop the short-lived merged-config lookups (e.g. after writing a config file)."""
+    _CONFIG_LOOKUP_CACHE.clear()
+
+
+def _clear_caches() -> None:
+    """Forget cached config files and git author patterns (used by tests)."""
+    _CONFIG_FILE_CACHE.clear()
+    _AUTHOR_PATTERN_CACHE.clear()
+    clear_config_lookup_cache()
+
+
+def _read_config_file(path: str) -> tuple[bool, dict | None]:
+    """Return whether ``path`` exists and its parsed TOML (None when missing or malformed)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, None
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return True, cached[1]
+    data: dict | None
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except (tomllib.TOMLDecodeError, OSError):
+        data = None
+    _CONFIG_FILE_CACHE[path] = (signature, data)
+    return True, data
 
 
 def _get_git_author_pattern() -> str | None:
     """
     Return the git-configured author pattern to filter commits.
     Prefers user.email; falls back to user.name. Returns None if neither is set.
+
+    The result is cached per working directory for a few seconds.
     """
+    cwd = os.getcwd()
+    now = time.monotonic()
+    cached = _AUTHOR_PATTERN_CACHE.get(cwd)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    pattern = _read_git_author_pattern()
+    _AUTHOR_PATTERN_CACHE[cwd] = (now + _AUTHOR_PATTERN_TTL_SECONDS, pattern)
+    return pattern
+
+
+def _read_git_author_pattern() -> str | None:
+    # One git process for both keys; exit status 1 means neither is set.
     try:
-        email = subprocess.run(
-            ["git", "config", "--get", "user.email"],
+        output = subprocess.run(
+            ["git", "config", "--get-regexp", r"^user\.(email|name)$"],
             capture_output=True,
             text=True,
             check=True,
-        ).stdout.strip()
+        ).stdout
     except subprocess.CalledProcessError:
-        email = ""
+        return None
 
-    if email:
-        return email
-
-    try:
-        name = subprocess.run(
-            ["git", "config", "--get", "user.name"],
-            capture_output=True,
-            text=True,
-            check=True,
-        ).stdout.strip()
-    except subprocess.CalledProcessError:
-        name = ""
+    values: dict[str, str] = {}
+    for line in output.splitlines():
+        key, _, value = line.partition(" ")
+        # Later entries (more specific config scopes) win, matching `git config --get`
+        values[key.lower()] = value.strip()
 
-    return name or None
+    return values.get("user.email") or values.get("user.name") or None
 
 
 def set_tracked_emails_env(emails: list[str]) -> None:
@@ -151,6 +187,8 @@ track_emails = {emails_array}
 """
 
     config_path.write_text(content)
+    # The new file must win over lookups cached before it existed
+    clear_config_lookup_cache()
     return config_path
 
 
@@ -212,30 +250,83 @@ def get_markdown_path() -> str:
     2. seev.toml key `markdown_path` (with glin.toml fallback)
     3. Default: ./WORKLOG.md
     """
+    return _resolve_markdown_path()[0]
+
+
+def _resolve_markdown_path() -> tuple[str, bool]:
+    """Return the Markdown worklog path and whether it came from SEEV_MD_PATH.
+
+    Lets callers that report the path's source avoid reading the environment again.
+    """
     value = os.getenv("SEEV_MD_PATH")
     if value and value.strip():
-        return value.strip()
+        return value.strip(), True
     file_val = _get_config_file_value("markdown_path")
     if file_val and file_val.strip():
-        return file_val.strip()
-    return "WORKLOG.md"
+        return file_val.strip(), False
+    return "WORKLOG.md", False
 
 
 # --- Tracked repositories configuration -------------------------------------
 
 
-def _get_common_config_paths() -> list[Path]:
-    """Return the standard locations we search for seev.toml (with legacy glin.toml fallback)."""
-    return [
+@functools.lru_cache(maxsize=8)
+def _config_paths(cwd: str, home: str) -> tuple[str, ...]:
+    """The standard config locations for ``cwd`` and ``home`` as plain strings."""
+    return (
         # Preferred Seev locations
-        Path.cwd() / "seev.toml",
-        Path.home() / ".config" / "seev" / "seev.toml",
-        Path.home() / ".seev.toml",
+        os.path.join(cwd, "seev.toml"),
+        os.path.join(home, ".config", "seev", "seev.toml"),
+        os.path.join(home, ".seev.toml"),
         # Legacy Glin locations
-        Path.cwd() / "glin.toml",
-        Path.home() / ".config" / "glin" / "glin.toml",
-        Path.home() / ".glin.toml",
-    ]
+        os.path.join(cwd, "glin.toml"),
+        os.path.join(home, ".config", "glin", "glin.toml"),
+        os.path.join(home, ".glin.toml"),
+    )
+
+
+def _get_common_config_paths() -> list[Path]:
+    """Return the standard locations we search for seev.toml (with legacy glin.toml fallback)."""
+    return [Path(p) for p in _config_paths(str(Path.cwd()), str(Path.home()))]
+
+
+def _config_lookup() -> tuple[dict, Path | None]:
+    """Return the merged config and the first existing config file (cached briefly)."""
+    key = (str(Path.cwd()), str(Path.home()))
+    now = time.monotonic()
+    cached = _CONFIG_LOOKUP_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1], cached[2]
+
+    merged: dict = {}
+    first: Path | None = None
+    for p in _config_paths(*key):
+        # One stat per location answers both "does it exist" and "has it changed"
+        exists, data = _read_config_file(p)
+        if first is None and exists:
+            first = Path(p)
+        if not data:
+            continue
+        for k, val in data.items():
+            if val and k not in merged:
+                merged[k] = val
+    _CONFIG_LOOKUP_CACHE[key] = (now + _CONFIG_LOOKUP_TTL_SECONDS, merged, first)
+    return merged, first
+
+
+def _load_config() -> dict:
+    """Merge every config file found in the standard locations into one dict.
+
+    Each key takes the first non-empty value in ``_get_common_config_paths()`` order, which
+    is what the individual readers used to compute by walking the locations per key.
+    Missing or malformed files are skipped.
+    """
+    return _config_lookup()[0]
+
+
+def _find_config_file() -> Path | None:
+    """Return the first config file that exists in the standard locations, if any."""
+    return _config_lookup()[1]
 
 
 def _get_config_file_value(key: str) -> str | None:
@@ -243,32 +334,12 @@ def _get_config_file_value(key: str) -> str | None:
 
     Searches standard locations and returns the first matching value.
     """
-    for p in _get_common_config_paths():
-        if p.exists():
-            try:
-                with open(p, "rb") as f:
-                    data = tomllib.load(f)
-                val = data.get(key)
-                if val:
-                    return val
-            except (tomllib.TOMLDecodeError, OSError):
-                continue
-    return None
+    return _load_config().get(key)
 
 
 def _get_config_file_repositories() -> list[str]:
     """Read repository configuration from glin.toml (key: track_repositories)."""
-    for p in _get_common_config_paths():
-        if p.exists():
-            try:
-                with open(p, "rb") as f:
-                    data = tomllib.load(f)
-                repos = data.get("track_repositories", [])
-                if repos:
-                    return repos
-            except (tomllib.TOMLDecodeError, OSError):
-                continue
-    return []
+    return _load_config().get("track_repositories") or []
 
 
 def get_tracked_repositories() -> list[str]:
@@ -1,3 +1,4 @@
+from datetime import date as _date, timedelta
 from typing import Annotated, Any
 
 from pydantic import Field
@@ -5,6 +6,7 @@ from pydantic import Field
 from .mcp_app import mcp
 from .storage.conversations import (
     add_conversation,
+    first_user_message_previews,
 )
 from .storage.summaries import add_summary, list_summaries
 
@@ -75,25 +77,49 @@ async def record_conversation_summary(
     name="get_recent_conversations",
     description=(
         "Get recent conversation summaries from storage, optionally filtered by ISO date "
-        "(YYYY-MM-DD). Returns rows containing date, conversation_id, title, and summary."
+        "(YYYY-MM-DD) or an inclusive date range (date..until). Returns rows containing "
+        "date, conversation_id, title, and summary. Set include_preview to also get each "
+        "conversation's first user message excerpt as first_message."
     ),
 )
 async def get_recent_conversations(
-    date: str | None = None, limit: int = 10
+    date: str | None = None,
+    limit: int = 10,
+    until: str | None = None,
+    include_preview: bool = False,
 ) -> list[dict[str, Any]]:
     """List recent conversation summaries.
 
     Args:
-        date: Optional ISO date string (YYYY-MM-DD) to restrict results to that date.
+        date: Optional ISO date string (YYYY-MM-DD) to restrict results to that date,
+            or the first day of the range when ``until`` is given.
         limit: Max number of summaries to return.
+        until: Optional ISO date string (YYYY-MM-DD) for the last day (inclusive) of a range.
+        include_preview: When True, add ``first_message`` (an excerpt of the conversation's
+            first user message, or None) to each row. Off by default so a plain listing
+            stays a single query.
 
     Returns:
-        A list of dictionaries with keys: id, date, conversation_id, title, summary, created_at.
+        A list of dictionaries with keys: id, date, conversation_id, title, summary, created_at
+        (plus first_message when include_preview is set).
     """
     f: dict[str, Any] = {"limit": limit}
-    if date:
+    if until:
+        # Half-open range on the date column: [date, until + 1 day)
+        if date:
+            f["date_from"] = date
+        try:
+            f["date_until"] = (_date.fromisoformat(until) + timedelta(days=1)).isoformat()
+        except ValueError:
+            return [{"error": f"Invalid until date: {until!r} (expected YYYY-MM-DD)"}]
+    elif date:
         f["date"] = date
 
-    summaries = list_summaries(f)
-    # Ensure plain dicts are returned
-    return [dict(s) for s in summaries]
+    # list_summaries already returns plain dicts
+    rows: list[dict[str, Any]] = list_summaries(f)  # type: ignore[assignment]
+    if include_preview and rows:
+        # One batched query for every row's conversation instead of reading its messages
+        previews = first_user_message_previews(r["conversation_id"] for r in rows)
+        for row in rows:
+            row["first_message"] = previews.get(row["conversation_id"])
+    return rows
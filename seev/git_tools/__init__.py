@@ -13,6 +13,7 @@ from .commits import (
     CommitInfo,
     ErrorResponse,
     InfoResponse,
+    RepoCommitInfo,
     _build_git_log_command,
     _get_author_filters,
     _handle_git_error,
@@ -20,6 +21,8 @@ from .commits import (
     get_branch_commits,
     get_commits_by_date,
     get_recent_commits,
+    get_recent_commits_for_repositories,
+    parse_commit_date,
 )
 from .config_tools import (
     _check_git_config,
@@ -45,13 +48,16 @@ __all__ = [
     "CommitInfo",
     "ErrorResponse",
     "InfoResponse",
+    "RepoCommitInfo",
     "_build_git_log_command",
     "_get_author_filters",
     "_handle_git_error",
     "_parse_commit_lines",
     "get_recent_commits",
+    "get_recent_commits_for_repositories",
     "get_commits_by_date",
     "get_branch_commits",
+    "parse_commit_date",
     # config tools
     "_check_git_config",
     "_get_config_source",
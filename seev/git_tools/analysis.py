@@ -1,12 +1,19 @@
+import contextlib
+import functools
+import logging
+import os
 import re
 import subprocess
-from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from typing import Annotated, TypedDict
 
 from pydantic import Field
 
 from ..mcp_app import mcp
-from .utils import resolve_repo_root, run_git
+from .git_daemon import read_commit
+from .utils import resolve_repo_root, run_git, run_git_streaming, run_git_streaming_bytes
+
+logger = logging.getLogger("seev.git.analysis")
 
 
 class ErrorResponse(TypedDict):
@@ -81,31 +88,59 @@ _LANG_MAP = {
     ".sql": "SQL",
 }
 
-_CONVENTIONAL_TYPES = {
-    # Standard Conventional Commit types
-    "feat",
-    "fix",
-    "chore",
-    "refactor",
-    "docs",
-    "test",
-    "perf",
-    "build",
-    "ci",
-    "style",
-    "revert",
-    # Extended types requested by users/teams (accept case-insensitively)
-    "added",
-    "updated",
-    "fixed",
-    "refactored",
-    "task",
-    "wip",
-    "debugging",
-    "bugfix",
-    "investigating",
-    "investigation",
-}
+_CONVENTIONAL_TYPES = frozenset(
+    {
+        # Standard Conventional Commit types
+        "feat",
+        "fix",
+        "chore",
+        "refactor",
+        "docs",
+        "test",
+        "perf",
+        "build",
+        "ci",
+        "style",
+        "revert",
+        # Extended types requested by users/teams (accept case-insensitively)
+        "added",
+        "updated",
+        "fixed",
+        "refactored",
+        "task",
+        "wip",
+        "debugging",
+        "bugfix",
+        "investigating",
+        "investigation",
+    }
+)
+
+_PR_MERGE_RE = re.compile(r"Merge pull request #(\d+)", re.IGNORECASE)
+
+
+# A full SHA-1 or SHA-256 object id. Such a commit (and its subject) can never change,
+# unlike abbreviated hashes or names such as HEAD, so only these are cached.
+_FULL_HASH_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+
+def _show_subject(commit_hash: str, repo_root: str | None) -> str:
+    commit = read_commit(repo_root, commit_hash)
+    if commit is not None:
+        return commit.subject.strip()
+    res = run_git(["show", "--no-patch", "--pretty=%s", commit_hash], repo_root=repo_root)
+    return res.stdout.strip()
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_subject(commit_hash: str, repo_dir: str, repo_root: str | None) -> str:
+    # ``repo_dir`` keys the cache when git runs in the current directory (no repo_root)
+    return _show_subject(commit_hash, repo_root)
+
+
+def clear_commit_cache() -> None:
+    """Forget every cached commit subject."""
+    _cached_subject.cache_clear()
 
 
 def _get_commit_message(commit_hash: str, workdir: str | None = None) -> str:
@@ -115,8 +150,41 @@ def _get_commit_message(commit_hash: str, workdir: str | None = None) -> str:
         if "error" in root_res:
             raise subprocess.CalledProcessError(2, ["git", "show"], root_res["error"])  # type: ignore[arg-type]
         repo_root = root_res.get("path")
-    res = run_git(["show", "--no-patch", "--pretty=%s", commit_hash], repo_root=repo_root)
-    return res.stdout.strip()
+    if _FULL_HASH_RE.fullmatch(commit_hash):
+        return _cached_subject(commit_hash, repo_root or os.getcwd(), repo_root)
+    return _show_subject(commit_hash, repo_root)
+
+
+def _merge_info(
+    commit_hash: str,
+    parents: list[str],
+    message: str,
+    subject_match: re.Match[str] | None = None,
+) -> MergeInfo:
+    """Build MergeInfo; ``subject_match`` is a ``_SUBJECT_RE`` match of ``message``, if any."""
+    is_merge = len(parents) >= 2
+    pr_number: int | None = None
+    is_pr_merge = False
+
+    if subject_match is not None:
+        pr = subject_match.group("pr")
+    else:
+        m = _PR_MERGE_RE.search(message)
+        pr = m.group(1) if m else None
+    if pr is not None:
+        pr_number = int(pr)
+        is_pr_merge = True
+    elif is_merge and message.lower().startswith("merge branch"):
+        is_pr_merge = False
+
+    return {
+        "hash": commit_hash,
+        "parents": parents,
+        "is_merge": is_merge,
+        "is_pr_merge": is_pr_merge,
+        "pr_number": pr_number,
+        "message": message,
+    }
 
 
 def detect_merge_info(commit_hash: str, workdir: str | None = None) -> MergeInfo | ErrorResponse:
@@ -125,7 +193,7 @@ def detect_merge_info(commit_hash: str, workdir: str | None = None) -> MergeInfo
     Heuristics for PR merges:
     - Subject contains "Merge pull request #<n>" (GitHub)
     - Subject starts with "Merge branch" (generic) → not necessarily a PR
-    - Two or more parents in `git rev-list --parents -n 1`
+    - Two or more parents in `git log -1 --format=%P`
     """
     try:
         repo_root: str | None = None
@@ -135,40 +203,77 @@ def detect_merge_info(commit_hash: str, workdir: str | None = None) -> MergeInfo
                 return _err(root_res["error"])
             repo_root = root_res.get("path")
 
-        parents_res = run_git(
-            ["rev-list", "--parents", "-n", "1", commit_hash], repo_root=repo_root
-        )
-        parts = parents_res.stdout.strip().split()
+        # A warm cat-file worker answers most lookups without starting git at all
+        commit = read_commit(repo_root, commit_hash)
+        if commit is not None:
+            return _merge_info(commit_hash, commit.parents, commit.subject.strip())
+        # Hash, parents and subject from one process
+        res = run_git(["log", "-1", "--format=%H %P%n%s", commit_hash, "--"], repo_root=repo_root)
+        header, _, message = res.stdout.partition("\n")
+        parts = header.split()
         if not parts:
             return _err(f"Commit {commit_hash} not found")
         _hash, *parents = parts
-        message = _get_commit_message(commit_hash, workdir=workdir)
-
-        is_merge = len(parents) >= 2
-        pr_number: int | None = None
-        is_pr_merge = False
-
-        m = re.search(r"Merge pull request #(\d+)", message, flags=re.IGNORECASE)
-        if m:
-            pr_number = int(m.group(1))
-            is_pr_merge = True
-        elif is_merge and message.lower().startswith("merge branch"):
-            is_pr_merge = False
-
-        return {
-            "hash": commit_hash,
-            "parents": parents,
-            "is_merge": is_merge,
-            "is_pr_merge": is_pr_merge,
-            "pr_number": pr_number,
-            "message": message,
-        }
+        return _merge_info(commit_hash, parents, message.strip())
     except subprocess.CalledProcessError as e:  # noqa: BLE001
         return _err(f"Git command failed: {e.stderr}")
     except Exception as e:  # noqa: BLE001
         return _err(f"Failed to detect merge info: {str(e)}")
 
 
+def _numstat_z_lines(tokens: Iterable[str]) -> Iterator[str]:
+    """Turn ``--numstat -z`` records into ``add\tdel\tpath`` lines.
+
+    With ``-z`` git writes paths verbatim instead of C-quoting them, and a rename is an
+    ``add\tdel\t`` record followed by separate old- and new-path records; the new path
+    is kept so the language is inferred from the file as it now exists.
+    """
+    it = iter(tokens)
+    for token in it:
+        if token.split("\t", 2)[2:] == [""]:
+            next(it, None)  # old path
+            token += next(it, "")
+        yield token
+
+
+def _numstat_totals(commit_hash: str, numstat: Iterable[str]) -> CommitStats:
+    """Sum ``--numstat`` lines (blank or malformed lines are skipped) into CommitStats."""
+    additions = 0
+    deletions = 0
+    files_changed = 0
+    lang_data: dict[str, dict[str, int]] = {}
+
+    for line in numstat:
+        if not line:
+            continue
+        # maxsplit keeps tabs inside raw (``-z``) paths in the path field
+        parts = line.split("\t", 2)
+        if len(parts) < 3:
+            continue
+        add_s, del_s, path = parts[0], parts[1], parts[2]
+        add = 0 if add_s == "-" else int(add_s)
+        delete = 0 if del_s == "-" else int(del_s)
+        additions += add
+        deletions += delete
+        files_changed += 1
+
+        lang = _infer_language(path)
+        d = lang_data.get(lang)
+        if d is None:
+            d = lang_data[lang] = {"additions": 0, "deletions": 0, "files": 0}
+        d["additions"] += add
+        d["deletions"] += delete
+        d["files"] += 1
+
+    return {
+        "hash": commit_hash,
+        "additions": additions,
+        "deletions": deletions,
+        "files_changed": files_changed,
+        "by_language": lang_data,
+    }
+
+
 def get_commit_statistics(
     commit_hash: str, workdir: str | None = None
 ) -> CommitStats | ErrorResponse:
@@ -184,42 +289,13 @@ def get_commit_statistics(
                 return _err(root_res["error"])
             repo_root = root_res.get("path")
 
-        numstat = run_git(
-            ["show", "--numstat", "--pretty=format:", commit_hash], repo_root=repo_root
-        )
-        additions = 0
-        deletions = 0
-        files_changed = 0
-        lang_data: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"additions": 0, "deletions": 0, "files": 0}
+        tokens = run_git_streaming(
+            ["show", "--numstat", "--pretty=format:", "-z", commit_hash],
+            repo_root=repo_root,
+            sep="\0",
         )
-
-        for line in numstat.stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("\t")
-            if len(parts) < 3:
-                continue
-            add_s, del_s, path = parts[0], parts[1], parts[2]
-            add = 0 if add_s == "-" else int(add_s)
-            delete = 0 if del_s == "-" else int(del_s)
-            additions += add
-            deletions += delete
-            files_changed += 1
-
-            lang = _infer_language(path)
-            d = lang_data[lang]
-            d["additions"] += add
-            d["deletions"] += delete
-            d["files"] += 1
-
-        return {
-            "hash": commit_hash,
-            "additions": additions,
-            "deletions": deletions,
-            "files_changed": files_changed,
-            "by_language": dict(lang_data),
-        }
+        # Records are parsed as git writes them instead of after buffering the whole output
+        return _numstat_totals(commit_hash, _numstat_z_lines(tokens))
     except subprocess.CalledProcessError as e:  # noqa: BLE001
         return _err(f"Git command failed: {e.stderr}")
     except Exception as e:  # noqa: BLE001
@@ -227,11 +303,8 @@ def get_commit_statistics(
 
 
 def _infer_language(path: str) -> str:
-    path_lower = path.lower()
-    for ext, lang in _LANG_MAP.items():
-        if path_lower.endswith(ext):
-            return lang
-    return "Other"
+    # Every _LANG_MAP key is a single ".ext" suffix, so one dict lookup replaces the scan
+    return _LANG_MAP.get(os.path.splitext(path)[1].lower(), "Other")
 
 
 _CONVENTIONAL_RE = re.compile(
@@ -239,6 +312,63 @@ _CONVENTIONAL_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Only the known types, longest first so e.g. "fixed" is tried before "fix". A hit means
+# the subject is conventional without a separate set lookup; most subjects (plain
+# sentences, merge messages) fail on the first word without any groups being built.
+_TYPE_ALT = "|".join(sorted(_CONVENTIONAL_TYPES, key=len, reverse=True))
+_CONVENTIONAL_STRICT_RE = re.compile(
+    rf"^(?P<type>{_TYPE_ALT})(?P<bang>!)?(?:\((?P<scope>[^)]+)\))?:\s*(?P<desc>.+)",
+    re.IGNORECASE,
+)
+
+
+# Both subject checks in one pass: the lookahead finds a PR merge anywhere in the subject
+# (like _PR_MERGE_RE.search) and the rest matches a Conventional Commit prefix (like
+# _CONVENTIONAL_RE). Either part may be absent, so match() always succeeds.
+_SUBJECT_RE = re.compile(
+    r"(?=(?:.*?Merge pull request #(?P<pr>\d+))?)"
+    r"(?:(?P<type>[a-z]+)(?P<bang>!)?(?:\((?P<scope>[^)]+)\))?:\s*(?P<desc>.+))?",
+    re.IGNORECASE,
+)
+
+
+def _categorize_subject(
+    raw: str, commit_hash: str | None = None, subject_match: re.Match[str] | None = None
+) -> Categorization:
+    """Categorize ``raw``; ``subject_match`` is a ``_SUBJECT_RE`` match of it, if any."""
+    conventional: bool | None = None
+    if subject_match is not None:
+        m = subject_match
+    elif m := _CONVENTIONAL_STRICT_RE.match(raw):
+        conventional = True
+    else:
+        # Type-shaped prefix with an unknown type (e.g. "wibble: x"), or no prefix at all
+        m = _CONVENTIONAL_RE.match(raw)
+        conventional = False
+    if not m or m.group("type") is None:
+        return {
+            "type": "other",
+            "scope": None,
+            "description": raw,
+            "conventional": False,
+            "raw": raw,
+            **({"hash": commit_hash} if commit_hash is not None else {}),
+        }
+    ctype_raw = m.group("type")
+    ctype = ctype_raw.lower()
+    scope = m.group("scope")
+    desc = m.group("desc")
+    if conventional is None:
+        conventional = ctype in _CONVENTIONAL_TYPES
+    return {
+        "type": ctype,
+        "scope": scope,
+        "description": desc,
+        "conventional": conventional,
+        "raw": raw,
+        **({"hash": commit_hash} if commit_hash is not None else {}),
+    }
+
 
 def categorize_commit(
     message_or_hash: str, is_hash: bool = False, workdir: str | None = None
@@ -249,73 +379,176 @@ def categorize_commit(
     """
     try:
         raw = _get_commit_message(message_or_hash, workdir=workdir) if is_hash else message_or_hash
-        m = _CONVENTIONAL_RE.match(raw)
-        if not m:
-            return {
-                "type": "other",
-                "scope": None,
-                "description": raw,
-                "conventional": False,
-                "raw": raw,
-                **({"hash": message_or_hash} if is_hash else {}),
-            }
-        ctype_raw = m.group("type")
-        ctype = ctype_raw.lower()
-        scope = m.group("scope")
-        desc = m.group("desc")
-        conventional = ctype in _CONVENTIONAL_TYPES
-        return {
-            "type": ctype,
-            "scope": scope,
-            "description": desc,
-            "conventional": conventional,
-            "raw": raw,
-            **({"hash": message_or_hash} if is_hash else {}),
-        }
+        return _categorize_subject(raw, message_or_hash if is_hash else None)
     except subprocess.CalledProcessError as e:  # noqa: BLE001
         return _err(f"Git command failed: {e.stderr}")
     except Exception as e:  # noqa: BLE001
         return _err(f"Failed to categorize commit: {str(e)}")
 
 
-def blame_file(
-    path: str,
-    start_line: int = 1,
-    end_line: int | None = None,
-    rev: str = "HEAD",
-    workdir: str | None = None,
-) -> dict:
-    """Run git blame on a file or a line range.
+class CommitAnalysis(TypedDict):
+    hash: str
+    statistics: CommitStats | ErrorResponse
+    category: Categorization | ErrorResponse
+    merge_info: MergeInfo | ErrorResponse
 
-    Returns a structured list with commit, author, date and code for each line.
+
+# One record per commit: RS, then hash, parents and subject separated by US, then the
+# commit's --numstat lines
+_RECORD_START = "\x1e"
+_ANALYZE_PRETTY_FORMAT = "--pretty=format:%x1e%H%x1f%P%x1f%s"
+
+
+def _analyze_one(commit_hash: str, workdir: str | None) -> CommitAnalysis:
+    return {
+        "hash": commit_hash,
+        "statistics": get_commit_statistics(commit_hash, workdir=workdir),
+        "category": categorize_commit(commit_hash, is_hash=True, workdir=workdir),
+        "merge_info": detect_merge_info(commit_hash, workdir=workdir),
+    }
+
+
+def analyze_commits(hashes: list[str], workdir: str | None = None) -> list[CommitAnalysis]:
+    """Statistics, categorization and merge info for several commits from one ``git log``.
+
+    Produces, per input hash and in input order, what ``get_commit_statistics``,
+    ``categorize_commit(is_hash=True)`` and ``detect_merge_info`` return, but with a
+    single ``git log --no-walk`` process instead of three per commit. If the batched
+    query fails (e.g. one hash does not exist), each commit is analyzed on its own so
+    the errors stay per commit.
     """
+    if not hashes:
+        return []
     try:
         repo_root: str | None = None
         if workdir is not None:
             root_res = resolve_repo_root(workdir)
             if "error" in root_res:
-                return _err(root_res["error"])
+                err = _err(root_res["error"])
+                return [
+                    {"hash": h, "statistics": err, "category": err, "merge_info": err}
+                    for h in hashes
+                ]
             repo_root = root_res.get("path")
 
-        args = ["blame", rev, "--line-porcelain"]
-        if end_line is not None:
-            args += [f"-L{start_line},{end_line}"]
-        elif start_line != 1:
-            args += [f"-L{start_line},+999999"]
-        args.append(path)
-        res = run_git(args, repo_root=repo_root)
-        lines = res.stdout.splitlines()
-
-        entries: list[dict] = []
-        cur: dict | None = None
+        args = [
+            "log",
+            "--no-walk=unsorted",
+            # Merges get a numstat against their first parent, like `git show`
+            "--diff-merges=first-parent",
+            "--numstat",
+            _ANALYZE_PRETTY_FORMAT,
+            "-z",
+            *dict.fromkeys(hashes),
+            "--",
+        ]
+        records: dict[str, tuple[list[str], str, list[str]]] = {}
+        numstat: list[str] = []
+        # NUL-separated records: paths arrive unquoted even with tabs or newlines in them
+        for token in run_git_streaming(args, repo_root=repo_root, sep="\0"):
+            if token.startswith(_RECORD_START):
+                # The header and the commit's first numstat record share a token,
+                # separated by the newline git writes after the (single-line) subject
+                header, _, first = token[1:].partition("\n")
+                full_hash, parents, subject = header.split("\x1f", 2)
+                numstat = [first]
+                records[full_hash] = (parents.split(), subject, numstat)
+            else:
+                numstat.append(token)
+    except Exception as e:  # noqa: BLE001
+        logger.debug("batched commit analysis failed, analyzing one by one: %s", e)
+        return [_analyze_one(h, workdir) for h in hashes]
+
+    # `git log` dedupes and reports full hashes; map each input back by position or prefix
+    unique = list(dict.fromkeys(hashes))
+    by_input: dict[str, tuple[list[str], str, list[str]]] = {}
+    if len(records) == len(unique):
+        by_input = dict(zip(unique, records.values(), strict=True))
+    else:
+        for h in unique:
+            found = next((r for full, r in records.items() if full.startswith(h.lower())), None)
+            if found is not None:
+                by_input[h] = found
+
+    results: list[CommitAnalysis] = []
+    for h in hashes:
+        record = by_input.get(h)
+        if record is None:
+            results.append(_analyze_one(h, workdir))
+            continue
+        parents, subject, lines = record
+        # One regex pass over the subject serves both the category and the merge info
+        subject_match = _SUBJECT_RE.match(subject)
+        results.append(
+            {
+                "hash": h,
+                "statistics": _numstat_totals(h, _numstat_z_lines(lines)),
+                "category": _categorize_subject(subject, h, subject_match),
+                "merge_info": _merge_info(h, parents, subject, subject_match),
+            }
+        )
+    return results
+
+
+def _decode(value: bytes) -> str:
+    return value.decode("utf-8", errors="replace")
+
+
+# `git blame --line-porcelain` header keys kept per line: entry field and value parser.
+# Output is read as bytes: file content need not be UTF-8, so only kept fields are decoded.
+_BLAME_FIELDS: dict[bytes, tuple[str, Callable[[bytes], object]]] = {
+    b"author": ("author", _decode),
+    b"author-mail": ("author_mail", lambda v: _decode(v.strip(b"<>"))),
+    b"author-time": ("author_time", int),
+    b"summary": ("summary", _decode),
+}
+_HEX_DIGITS = frozenset(b"0123456789abcdef")
+
+
+def _iter_blame_entries(
+    path: str,
+    rev: str,
+    start_line: int,
+    end_line: int | None,
+    repo_root: str | None,
+) -> Iterator[dict]:
+    """Yield one blame entry per line as ``git blame --line-porcelain`` writes it.
+
+    Entries are parsed from git's stdout pipe, so the raw output is never held in full;
+    closing the iterator early stops git. Code lines that are not valid UTF-8 are
+    decoded with replacement characters instead of failing the whole blame.
+    """
+    args = ["blame", rev, "--line-porcelain"]
+    if end_line is not None:
+        args += [f"-L{start_line},{end_line}"]
+    elif start_line != 1:
+        args += [f"-L{start_line},+999999"]
+    args.append(path)
+
+    cur: dict | None = None
+    with contextlib.closing(run_git_streaming_bytes(args, repo_root=repo_root)) as lines:
         for ln in lines:
-            if re.match(r"^[0-9a-f]{7,40} ", ln):
+            if not ln:
+                continue
+            if ln[0] == 0x09:  # tab: the line's content
+                if cur is not None:
+                    cur["code"] = _decode(ln[1:])
+                continue
+            # Dispatch on the first word instead of trying each prefix in turn
+            key, _, val = ln.partition(b" ")
+            field = _BLAME_FIELDS.get(key)
+            if field is not None:
+                if cur is not None:
+                    name, convert = field
+                    cur[name] = convert(val)
+            elif val and 7 <= len(key) <= 40 and _HEX_DIGITS.issuperset(key):
                 # start of a block
                 if cur:
-                    entries.append(cur)
+                    yield cur
                 parts = ln.split()
+                # Every key is present from the start, so filling the entry never resizes it
                 cur = {
-                    "commit": parts[0],
+                    "commit": parts[0].decode("ascii"),
                     "orig_line": int(parts[2]) if len(parts) > 2 else None,
                     "final_line": int(parts[1]) if len(parts) > 1 else None,
                     "author": None,
@@ -324,18 +557,30 @@ def blame_file(
                     "summary": None,
                     "code": None,
                 }
-            elif ln.startswith("author ") and cur is not None:
-                cur["author"] = ln[len("author ") :]
-            elif ln.startswith("author-mail ") and cur is not None:
-                cur["author_mail"] = ln[len("author-mail ") :].strip("<>")
-            elif ln.startswith("author-time ") and cur is not None:
-                cur["author_time"] = int(ln[len("author-time ") :])
-            elif ln.startswith("summary ") and cur is not None:
-                cur["summary"] = ln[len("summary ") :]
-            elif ln.startswith("\t") and cur is not None:
-                cur["code"] = ln[1:]
-        if cur:
-            entries.append(cur)
+    if cur:
+        yield cur
+
+
+def blame_file(
+    path: str,
+    start_line: int = 1,
+    end_line: int | None = None,
+    rev: str = "HEAD",
+    workdir: str | None = None,
+) -> dict:
+    """Run git blame on a file or a line range.
+
+    Returns a structured list with commit, author, date and code for each line.
+    """
+    try:
+        repo_root: str | None = None
+        if workdir is not None:
+            root_res = resolve_repo_root(workdir)
+            if "error" in root_res:
+                return _err(root_res["error"])
+            repo_root = root_res.get("path")
+
+        entries = list(_iter_blame_entries(path, rev, start_line, end_line, repo_root))
         return {"path": path, "rev": rev, "start": start_line, "end": end_line, "entries": entries}
     except subprocess.CalledProcessError as e:  # noqa: BLE001
         return _err(f"Git command failed: {e.stderr}")
@@ -343,6 +588,55 @@ def blame_file(
         return _err(f"Failed to run git blame: {str(e)}")
 
 
+def blame_file_chunk(
+    path: str,
+    offset: int = 0,
+    limit: int = 500,
+    start_line: int = 1,
+    end_line: int | None = None,
+    rev: str = "HEAD",
+    workdir: str | None = None,
+) -> dict:
+    """Blame at most ``limit`` lines, starting ``offset`` lines into the requested range.
+
+    Blame emits exactly one entry per line, so each chunk only asks git for its own
+    window of lines (plus one to tell whether more follow). ``next_offset`` is the
+    offset of the following chunk, or None after the last one.
+    """
+    if offset < 0 or limit < 1:
+        return _err("offset must be >= 0 and limit >= 1")
+    try:
+        repo_root: str | None = None
+        if workdir is not None:
+            root_res = resolve_repo_root(workdir)
+            if "error" in root_res:
+                return _err(root_res["error"])
+            repo_root = root_res.get("path")
+
+        first = start_line + offset
+        # One line past the chunk, to learn whether another chunk follows
+        last = first + limit
+        if end_line is not None:
+            last = min(last, end_line)
+        entries = (
+            [] if last < first else list(_iter_blame_entries(path, rev, first, last, repo_root))
+        )
+        more = len(entries) > limit
+        return {
+            "path": path,
+            "rev": rev,
+            "start": start_line,
+            "end": end_line,
+            "offset": offset,
+            "entries": entries[:limit],
+            "next_offset": offset + limit if more else None,
+        }
+    except subprocess.CalledProcessError as e:  # noqa: BLE001
+        return _err(f"Git command failed: {e.stderr}")
+    except Exception as e:  # noqa: BLE001
+        return _err(f"Failed to run git blame: {str(e)}")
+
+
 # MCP tool registrations
 @mcp.tool(
     name="detect_merge_info",
@@ -432,6 +726,35 @@ def _tool_categorize_commit(
     return categorize_commit(message_or_hash=message_or_hash, is_hash=is_hash, workdir=workdir)
 
 
+@mcp.tool(
+    name="analyze_commits_batch",
+    description=(
+        "Analyze several commits at once: statistics, Conventional Commit categorization "
+        "and merge/PR detection per hash, from a single git invocation."
+    ),
+)
+def _tool_analyze_commits_batch(
+    hashes: list[str],
+    workdir: Annotated[
+        str,
+        Field(
+            description=(
+                "Required working directory path. Git runs in the repository containing this path "
+                "using 'git -C <root>', ensuring commands "
+                "execute in the client's project repository "
+                "rather than the server process CWD. The path must reside inside a Git repository."
+            )
+        ),
+    ],
+) -> list[CommitAnalysis] | ErrorResponse:  # pragma: no cover
+    if not workdir:
+        return _err(
+            "Parameter 'workdir' is required. Provide a path inside the target Git repository "
+            "so the server can execute git commands with '-C <root>'."
+        )
+    return analyze_commits(hashes=hashes, workdir=workdir)
+
+
 @mcp.tool(
     name="git_blame",
     description=(
@@ -461,3 +784,46 @@ def _tool_git_blame(
             "so the server can execute git commands with '-C <root>'."
         )
     return blame_file(path=path, start_line=start_line, end_line=end_line, rev=rev, workdir=workdir)
+
+
+@mcp.tool(
+    name="git_blame_stream",
+    description=(
+        "Run git blame on a file or range in chunks of at most 'limit' lines. Returns the "
+        "chunk's per-line entries and next_offset (null after the last chunk); pass it back "
+        "as 'offset' to fetch the next chunk."
+    ),
+)
+def _tool_git_blame_stream(
+    path: str,
+    workdir: Annotated[
+        str,
+        Field(
+            description=(
+                "Required working directory path. Git runs in the repository containing this path "
+                "using 'git -C <root>', ensuring commands "
+                "execute in the client's project repository "
+                "rather than the server process CWD. The path must reside inside a Git repository."
+            )
+        ),
+    ],
+    offset: int = 0,
+    limit: int = 500,
+    start_line: int = 1,
+    end_line: int | None = None,
+    rev: str = "HEAD",
+):  # pragma: no cover
+    if not workdir:
+        return _err(
+            "Parameter 'workdir' is required. Provide a path inside the target Git repository "
+            "so the server can execute git commands with '-C <root>'."
+        )
+    return blame_file_chunk(
+        path=path,
+        offset=offset,
+        limit=limit,
+        start_line=start_line,
+        end_line=end_line,
+        rev=rev,
+        workdir=workdir,
+    )
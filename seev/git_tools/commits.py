@@ -1,14 +1,32 @@
+import asyncio
+import collections
+import functools
+import heapq
+import itertools
 import logging
+import os
+import re
 import subprocess
-from datetime import date, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from os import getcwd as _getcwd  # added for logging
 from typing import Annotated, TypedDict
 
 from fastmcp import Context  # type: ignore
 from pydantic import Field
 
+import seev.git_tools as git_tools
+
 from ..mcp_app import mcp
-from .utils import resolve_repo_root, run_git
+from .git_daemon import _subject
+from .utils import resolve_repo_root, run_git_streaming
+
+try:  # pragma: no cover - optional native backend
+    import pygit2  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    pygit2 = None
 
 logger = logging.getLogger("seev.git.commits")
 
@@ -37,20 +55,258 @@ NO_EMAIL_ERROR: ErrorResponse = {
 }
 
 
+def _info_response(message: str) -> InfoResponse:
+    """A new ``{"info": message}`` entry; callers may annotate it (e.g. with a repository)."""
+    return {"info": message}
+
+
+# `git log -z` ends each record with NUL and the fields are joined with the ASCII unit
+# separator, neither of which can appear in names or subjects (unlike '|').
+_RECORD_SEP = "\x00"
+_FIELD_SEP = "\x1f"
+_LOG_PRETTY_FORMAT = "--pretty=format:%H%x1f%an%x1f%ai%x1f%s"
+# Trailing options of every commit query. Colors, ref decorations and notes never reach the
+# pretty format; keep git from looking them up (log.decorate / color.ui could enable them)
+_LOG_OUTPUT_ARGS = ("--no-color", "--no-decorate", "--no-notes", "-z", _LOG_PRETTY_FORMAT)
+
+
+# Characters that make an --author value a pattern in git's default (basic) regex syntax
+_BRE_PATTERN_CHARS = frozenset("\\^$*[]")
+# Literal characters in git's default basic regex that are operators in extended syntax
+_ERE_ONLY_OPERATORS_RE = re.compile(r"([+?(){}|])")
+
+
+def _author_args(author_filters: list[str]) -> list[str]:
+    """``--author`` options matching any of ``author_filters``.
+
+    Several plain values (addresses, names) become one extended-regex alternation, so
+    git tests each commit's author against a single pattern instead of one per value.
+    Each value is escaped so it matches exactly what its own ``--author`` would. Values
+    written as patterns keep a ``--author`` each, as their meaning depends on the basic
+    regex syntax git uses by default.
+    """
+    if len(author_filters) > 1 and not any(
+        _BRE_PATTERN_CHARS.intersection(a) for a in author_filters
+    ):
+        alternation = "|".join(_ERE_ONLY_OPERATORS_RE.sub(r"\\\1", a) for a in author_filters)
+        return ["--extended-regexp", f"--author={alternation}"]
+    return [f"--author={a}" for a in author_filters]
+
+
+def _redacted_author_args(author_filters: list[str]) -> list[str]:
+    """``_author_args`` for logging, with the addresses replaced by their count."""
+    args = _author_args(author_filters)
+    if not args:
+        return []
+    return [*args[:-1], f"--author=<{len(author_filters)} authors>"]
+
+
 def _build_git_log_command(base_args: list[str], author_filters: list[str]) -> list[str]:
-    cmd = ["git", "log"] + base_args
-    for author in author_filters:
-        cmd.append(f"--author={author}")
-    cmd.append("--pretty=format:%H|%an|%ai|%s")
-    return cmd
+    return ["git", "log", *base_args, *_author_args(author_filters), *_LOG_OUTPUT_ARGS]
+
+
+def _parse_commit_record(record: str) -> CommitInfo | None:
+    """Parse one ``git log -z`` record produced with ``_LOG_PRETTY_FORMAT`` (None if blank)."""
+    if not record.strip():
+        return None
+    # Slice on the three field separators
+    i1 = record.find(_FIELD_SEP)
+    i2 = record.find(_FIELD_SEP, i1 + 1)
+    i3 = record.find(_FIELD_SEP, i2 + 1)
+    if i1 < 0 or i2 < 0 or i3 < 0:
+        raise ValueError(f"Unexpected git log record: {record.strip()!r}")
+    return {
+        "hash": record[:i1].strip(),
+        "author": record[i1 + 1 : i2],
+        "date": record[i2 + 1 : i3],
+        "message": record[i3 + 1 :].rstrip("\n"),
+    }
 
 
 def _parse_commit_lines(output: str) -> list[CommitInfo]:
+    """Parse ``git log -z`` output produced with ``_LOG_PRETTY_FORMAT``."""
     commits: list[CommitInfo] = []
-    for line in output.strip().split("\n"):
-        if line:
-            hash, author, date, message = line.split("|", 3)
-            commits.append({"hash": hash, "author": author, "date": date, "message": message})
+    # Walk the records in place rather than materializing a list of every record
+    start = 0
+    end_of_output = len(output)
+    while start < end_of_output:
+        end = output.find(_RECORD_SEP, start)
+        if end < 0:
+            end = end_of_output
+        commit = _parse_commit_record(output[start:end])
+        start = end + 1
+        if commit is not None:
+            commits.append(commit)
+    return commits
+
+
+# Parsed `git log` results keyed by (repository dir, command). Entries expire after a
+# short TTL (relative dates like "yesterday" drift) and are tied to the repository's HEAD
+# and HEAD reflog mtimes, which change on every commit, checkout, reset or rebase. Only
+# queries that walk from HEAD are cached: other refs (branch -f, fetch) move without
+# touching either file.
+# Commits are held as (hash, author, date, message) tuples, a fraction of a dict's size;
+# each hit builds fresh CommitInfo dicts from them.
+_LOG_CACHE_TTL_SECONDS = 10.0
+_LOG_CACHE_MAX_ENTRIES = 64
+_CommitRow = tuple[str, str, str, str]
+_log_cache: dict[
+    tuple[str, tuple[str, ...]], tuple[float, tuple[int, int], tuple[_CommitRow, ...]]
+] = {}
+_log_cache_lock = threading.Lock()
+
+
+def _repo_signature(repo_dir: str) -> tuple[int, int] | None:
+    """Cheap change marker for a repository, or None when it cannot be determined."""
+    git_dir = os.path.join(repo_dir, ".git")
+    try:
+        head = os.stat(os.path.join(git_dir, "HEAD")).st_mtime_ns
+        reflog = os.stat(os.path.join(git_dir, "logs", "HEAD")).st_mtime_ns
+    except OSError:
+        # Not at the repo root, a worktree/submodule .git file, or no reflog: don't cache
+        return None
+    return head, reflog
+
+
+def _cached_git_log(repo_dir: str, cmd: list[str]) -> list[CommitInfo] | None:
+    signature = _repo_signature(repo_dir)
+    if signature is None:
+        return None
+    key = (repo_dir, tuple(cmd))
+    with _log_cache_lock:
+        entry = _log_cache.get(key)
+        if entry is None:
+            return None
+        expires, cached_signature, rows = entry
+        if time.monotonic() >= expires or cached_signature != signature:
+            del _log_cache[key]
+            return None
+    # Fresh dicts per hit, so callers can't mutate the cached entry
+    return [{"hash": h, "author": a, "date": d, "message": m} for h, a, d, m in rows]
+
+
+def _store_git_log(repo_dir: str, cmd: list[str], commits: list[CommitInfo]) -> None:
+    signature = _repo_signature(repo_dir)
+    if signature is None:
+        return
+    with _log_cache_lock:
+        if len(_log_cache) >= _LOG_CACHE_MAX_ENTRIES:
+            _log_cache.clear()
+        _log_cache[(repo_dir, tuple(cmd))] = (
+            time.monotonic() + _LOG_CACHE_TTL_SECONDS,
+            signature,
+            tuple((c["hash"], c["author"], c["date"], c["message"]) for c in commits),
+        )
+
+
+def clear_git_log_cache() -> None:
+    """Drop all cached `git log` results and the record of auto-written commits."""
+    with _log_cache_lock:
+        _log_cache.clear()
+    with _autowritten_lock:
+        _autowritten.clear()
+
+
+def _use_pygit2() -> bool:
+    """True when SEEV_GIT_BACKEND=pygit2 (or libgit2) and pygit2 is installed."""
+    backend = (os.getenv("SEEV_GIT_BACKEND") or "").strip().lower()
+    return pygit2 is not None and backend in {"pygit2", "libgit2"}
+
+
+@functools.lru_cache(maxsize=8)
+def _open_pygit2_repo(repo_dir: str):  # pragma: no cover - requires pygit2
+    path = pygit2.discover_repository(repo_dir)
+    if path is None:
+        raise ValueError(f"Not a git repository: {repo_dir}")
+    return pygit2.Repository(path)
+
+
+# Characters that are literal in git's basic regex syntax but operators in Python's;
+# escaped with a backslash they become the GNU basic regex operators
+_BRE_ESCAPED_OPERATORS = frozenset("+?(){}|")
+
+
+def _author_matcher(pattern: str) -> re.Pattern[str]:
+    """Compile an ``--author`` value with git's default (GNU basic) regex semantics."""
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "[":
+            # A bracket expression runs to the first "]" that doesn't open it ("[]...]",
+            # "[^]...]") and takes backslashes literally
+            end = i + 1
+            if pattern[end : end + 1] == "^":
+                end += 1
+            if pattern[end : end + 1] == "]":
+                end += 1
+            end = pattern.find("]", end)
+            if end < 0:  # unterminated, which git rejects
+                return re.compile(re.escape(pattern))
+            body = pattern[i + 1 : end].replace("\\", "\\\\").replace("[", "\\[")
+            out.append(f"[{body}]")
+            i = end + 1
+            continue
+        if ch == "\\" and i + 1 < len(pattern):
+            i += 1
+            ch = pattern[i]
+            out.append(ch if ch in _BRE_ESCAPED_OPERATORS else "\\" + ch)
+        elif ch in _BRE_ESCAPED_OPERATORS:
+            out.append("\\" + ch)
+        else:
+            out.append(ch)
+        i += 1
+    try:
+        return re.compile("".join(out))
+    except re.error:
+        # git rejects the pattern outright; a literal match is the closest useful reading
+        return re.compile(re.escape(pattern))
+
+
+def _pygit2_walk(repo, tip):  # pragma: no cover - requires pygit2
+    """Commits reachable from ``tip`` in ``git log``'s default order.
+
+    git emits the tip first, then repeatedly the newest (by committer date) commit whose
+    child has already been shown, ties going to the one queued first. libgit2's time
+    sort instead orders every reachable commit by date, which differs under clock skew.
+    """
+    tie = itertools.count()
+    start = repo[tip]
+    seen = {start.id}
+    queue = [(-start.commit_time, next(tie), start)]
+    while queue:
+        commit = heapq.heappop(queue)[2]
+        yield commit
+        for parent in commit.parents:
+            if parent.id not in seen:
+                seen.add(parent.id)
+                heapq.heappush(queue, (-parent.commit_time, next(tie), parent))
+
+
+def _pygit2_log(
+    repo_dir: str, branch: str | None, count: int, author_filters: list[str]
+) -> list[CommitInfo]:  # pragma: no cover - requires pygit2
+    """In-process equivalent of ``git log [branch] -<count> --author=...``."""
+    repo = _open_pygit2_repo(repo_dir)
+    target = repo.revparse_single(branch).peel(pygit2.Commit).id if branch else repo.head.target
+    matchers = [_author_matcher(a) for a in author_filters]
+    commits: list[CommitInfo] = []
+    for commit in _pygit2_walk(repo, target):
+        if commit.message_encoding:
+            # git re-encodes these messages to UTF-8 for output; leave that to git
+            raise ValueError(f"commit {commit.id} uses encoding {commit.message_encoding}")
+        author = commit.author
+        ident = f"{author.name} <{author.email}>"
+        if matchers and not any(m.search(ident) for m in matchers):
+            continue
+        tz = timezone(timedelta(minutes=author.offset))
+        when = datetime.fromtimestamp(author.time, tz).strftime("%Y-%m-%d %H:%M:%S %z")
+        subject = _subject(commit.raw_message).decode("utf-8")
+        commits.append(
+            {"hash": str(commit.id), "author": author.name, "date": when, "message": subject}
+        )
+        if len(commits) >= count:
+            break
     return commits
 
 
@@ -72,17 +328,48 @@ def _handle_git_error(e: Exception) -> list[ErrorResponse]:
 
 
 def _get_author_filters() -> list[str]:
-    # Local import so test monkeypatching glin.git_tools.get_tracked_emails takes effect
-    from . import get_tracked_emails as _get  # type: ignore
+    # Looked up on the package each call so patching seev.git_tools.get_tracked_emails works
+    return git_tools.get_tracked_emails()
+
+
+# SHAs already handed to the commit writer, per database, most recent last. Polling the
+# same query after a new commit re-fetches the whole page; only unseen SHAs are written.
+# The writer reports batches it fails to write, which are forgotten so they are retried.
+_AUTOWRITTEN_MAX_PER_DB = 2048
+_autowritten: dict[str, collections.OrderedDict[str, None]] = {}
+_autowritten_lock = threading.Lock()
+
 
-    return _get()
+def _unwritten_commits(db_path: str, commits: list[CommitInfo]) -> list[CommitInfo]:
+    """Drop the commits already auto-written to ``db_path`` and remember the rest."""
+    with _autowritten_lock:
+        seen = _autowritten.setdefault(db_path, collections.OrderedDict())
+        fresh = [c for c in commits if c["hash"] not in seen]
+        for c in commits:
+            seen[c["hash"]] = None
+            seen.move_to_end(c["hash"])
+        while len(seen) > _AUTOWRITTEN_MAX_PER_DB:
+            seen.popitem(last=False)
+    return fresh
+
+
+def _forget_autowritten(db_path: str, shas: list[str]) -> None:
+    """Let the next query queue ``shas`` again after the writer failed to store them."""
+    with _autowritten_lock:
+        seen = _autowritten.get(db_path)
+        if seen is not None:
+            for sha in shas:
+                seen.pop(sha, None)
 
 
 def _maybe_autowrite(commits: list[CommitInfo]) -> None:
     """Optionally persist commits to storage if SEEV_DB_AUTOWRITE is truthy.
 
     This is a best-effort side effect and failures are swallowed to avoid
-    impacting the primary git query behavior.
+    impacting the primary git query behavior. The write itself happens on the
+    background commit writer, so the query returns without waiting for SQLite:
+    autowrite is asynchronous, and a caller that reads the commits back from
+    storage must call ``seev.storage.commit_writer.flush_commit_writes()`` first.
     """
     try:
         # Local imports to avoid heavy deps and to make monkeypatching easy in tests
@@ -90,11 +377,15 @@ def _maybe_autowrite(commits: list[CommitInfo]) -> None:
 
         if not get_db_autowrite():
             return
-        from ..storage.commits import bulk_upsert_commits  # type: ignore
+        from ..storage.commit_writer import enqueue_commits  # type: ignore
 
         db_path = get_db_path()
-        # Map CommitInfo -> minimal CommitInput
-        payload = [
+        commits = _unwritten_commits(db_path, commits)
+        if not commits:
+            return
+        # Map CommitInfo -> minimal CommitInput; the writer builds its batch from this
+        # generator, so the rows are only ever held in one list
+        payload = (
             {
                 "sha": c["hash"],
                 "author_name": c.get("author", ""),
@@ -103,13 +394,29 @@ def _maybe_autowrite(commits: list[CommitInfo]) -> None:
                 "message": c.get("message", ""),
             }
             for c in commits
-        ]
-        bulk_upsert_commits(payload, db_path=db_path)
+        )
+        # Queued for the background writer, which batches bursts into one transaction
+        enqueue_commits(
+            payload,
+            db_path=db_path,
+            on_failure=functools.partial(_forget_autowritten, db_path),
+        )
     except Exception:
         # Silently ignore; logging could be added later
         return
 
 
+def _run_git_log(cmd: list[str], repo_root: str | None) -> list[CommitInfo]:
+    # Records are parsed as git writes them, so only the commits are held in memory, not
+    # the whole stdout as well. `run_git_streaming` takes subcommand args (no leading 'git').
+    commits: list[CommitInfo] = []
+    for record in run_git_streaming(cmd[1:], repo_root=repo_root, sep=_RECORD_SEP):
+        commit = _parse_commit_record(record)
+        if commit is not None:
+            commits.append(commit)
+    return commits
+
+
 def _run_git_log_query(
     base_args: list[str],
     branch: str | None,
@@ -118,6 +425,8 @@ def _run_git_log_query(
     *,
     auto_write: bool = True,
     workdir: str | None = None,
+    count: int | None = None,
+    known_empty: bool = False,
 ) -> list[CommitInfo | ErrorResponse | InfoResponse]:
     """Run a git log query with optional branch and standardized handling.
 
@@ -128,6 +437,10 @@ def _run_git_log_query(
     - empty_msg_branch_fmt: optional format string used when no results and a branch was
       specified. Should contain `{branch}` placeholder.
     - auto_write: when True, call `_maybe_autowrite` on non-empty results.
+    - count: for count-limited queries, the limit; lets the optional pygit2 backend
+      (SEEV_GIT_BACKEND=pygit2) walk history in-process instead of spawning git.
+    - known_empty: the caller knows git would list nothing (a zero count, an inverted
+      date range); configuration errors are still reported but git is not run.
 
     Returns a list of `CommitInfo` or a single `ErrorResponse`/`InfoResponse` dict.
     """
@@ -148,40 +461,71 @@ def _run_git_log_query(
             if "error" in root_res:
                 return [{"error": root_res["error"]}]
             repo_root = root_res.get("path")
-        if repo_root:
-            # `run_git` expects subcommand args (without leading 'git')
-            result = run_git(cmd[1:], repo_root=repo_root)
+        repo_dir = repo_root or os.getcwd()
+        # A named branch can move without HEAD changing, so only HEAD walks are cached
+        cacheable = not known_empty and not branch
+        cached = _cached_git_log(repo_dir, cmd) if cacheable else None
+        if known_empty:
+            commits = []
+        elif cached is not None:
+            # Fresh results were already persisted when they were first fetched
+            commits = cached
         else:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        commits = _parse_commit_lines(result.stdout)
-        if commits:
-            if auto_write:
+            commits = None
+            if count is not None and _use_pygit2():
+                try:
+                    commits = _pygit2_log(repo_dir, branch, count, author_filters)
+                except Exception as e:  # noqa: BLE001
+                    logger.debug("pygit2 log failed, falling back to git: %s", e)
+            if commits is None:
+                commits = _run_git_log(cmd, repo_root)
+            if cacheable:
+                _store_git_log(repo_dir, cmd, commits)
+            if commits and auto_write:
                 _maybe_autowrite(commits)
+        if commits:
             return commits
         if branch and empty_msg_branch_fmt:
-            return [{"info": empty_msg_branch_fmt.format(branch=branch)}]
-        return [{"info": empty_msg_default}]
+            return [_info_response(empty_msg_branch_fmt.format(branch=branch))]
+        return [_info_response(empty_msg_default)]
     except Exception as e:  # noqa: BLE001
         return _handle_git_error(e)
 
 
+def _split_log_result(
+    result: list[CommitInfo | ErrorResponse | InfoResponse],
+) -> tuple[list[CommitInfo], str | None]:
+    """Commits and error message of a `_run_git_log_query` result.
+
+    A query returns either commits only or a single error/info entry, so the first
+    element decides which without walking the whole list.
+    """
+    if not result:
+        return [], None
+    first = result[0]
+    if "error" in first:
+        return [], str(first.get("error", ""))
+    if "info" in first:
+        return [], None
+    return result, None  # type: ignore[return-value]
+
+
 def get_recent_commits(
     count: int = 10,
     branch: str | None = None,
     workdir: str | None = None,
 ) -> list[CommitInfo | ErrorResponse | InfoResponse]:
-    try:
-        base_args: list[str] = [f"-{count}"]
-        return _run_git_log_query(
-            base_args,
-            branch,
-            empty_msg_default="No recent commits found",
-            empty_msg_branch_fmt="No recent commits found on branch {branch}",
-            auto_write=True,
-            workdir=workdir,
-        )
-    except Exception as e:  # noqa: BLE001
-        return _handle_git_error(e)
+    base_args: list[str] = [f"-{count}"]
+    return _run_git_log_query(
+        base_args,
+        branch,
+        empty_msg_default="No recent commits found",
+        empty_msg_branch_fmt="No recent commits found on branch {branch}",
+        auto_write=True,
+        workdir=workdir,
+        count=count,
+        known_empty=count == 0,
+    )
 
 
 def _normalize_date_range(since: str, until: str | None) -> tuple[str, str]:
@@ -208,41 +552,125 @@ def _normalize_date_range(since: str, until: str | None) -> tuple[str, str]:
         return since, until_norm
 
 
+def _is_inverted_date_range(since: str, until: str) -> bool:
+    """True when both bounds are plain ISO dates and ``until`` is before ``since``.
+
+    git resolves both to the same time of day, so such a range can match no commit.
+    Anything else (relative dates, timestamps) is left for git to interpret.
+    """
+    try:
+        if len(since) != 10 or len(until) != 10:
+            return False
+        return date.fromisoformat(until) < date.fromisoformat(since)
+    except (TypeError, ValueError):
+        return False
+
+
 def get_commits_by_date(
     workdir: str,
     since: str,
     until: str = "now",
     branch: str | None = None,
 ) -> list[CommitInfo | ErrorResponse | InfoResponse]:
-    try:
-        norm_since, norm_until = _normalize_date_range(since, until)
-        base_args: list[str] = [f"--since={norm_since}", f"--until={norm_until}"]
-        return _run_git_log_query(
-            base_args,
-            branch,
-            empty_msg_default="No commits found in date range",
-            empty_msg_branch_fmt="No commits found in date range on branch {branch}",
-            auto_write=True,
-            workdir=workdir,
-        )
-    except Exception as e:  # noqa: BLE001
-        return _handle_git_error(e)
+    norm_since, norm_until = _normalize_date_range(since, until)
+    base_args: list[str] = [f"--since={norm_since}", f"--until={norm_until}"]
+    return _run_git_log_query(
+        base_args,
+        branch,
+        empty_msg_default="No commits found in date range",
+        empty_msg_branch_fmt="No commits found in date range on branch {branch}",
+        auto_write=True,
+        workdir=workdir,
+        known_empty=_is_inverted_date_range(norm_since, norm_until),
+    )
 
 
 def get_branch_commits(
     branch: str, count: int = 10, workdir: str | None = None
 ) -> list[CommitInfo | ErrorResponse | InfoResponse]:
+    base_args: list[str] = [f"-{count}"]
+    # Use branch parameter to prepend in helper and to produce branch-aware empty message.
+    return _run_git_log_query(
+        base_args,
+        branch,
+        empty_msg_default=f"No commits found on branch {branch}",
+        empty_msg_branch_fmt="No commits found on branch {branch}",
+        auto_write=False,
+        workdir=workdir,
+        count=count,
+        known_empty=count == 0,
+    )
+
+
+class RepoCommitInfo(CommitInfo):
+    repository: str
+
+
+_MAX_REPO_WORKERS = 8
+
+
+def _local_repositories(repositories: list[str]) -> list[str]:
+    """Keep the entries that are local directories (remote URLs and shorthands are skipped)."""
+    local: list[str] = []
+    for repo in repositories:
+        path = os.path.expanduser(repo)
+        if os.path.isdir(path) and path not in local:
+            local.append(path)
+    return local
+
+
+def parse_commit_date(value: str) -> datetime:
+    """Parse a commit ``date`` (git's ``%ai``, e.g. ``2025-10-09 12:00:00 +0200``).
+
+    ``datetime.fromisoformat`` reads this layout directly and is far cheaper than
+    ``strptime``. Raises ``ValueError`` for anything it cannot parse.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _commit_sort_key(commit: CommitInfo) -> float:
     try:
-        base_args: list[str] = [f"-{count}"]
-        # Use branch parameter to prepend in helper and to produce branch-aware empty message.
-        return _run_git_log_query(
-            base_args,
-            branch,
-            empty_msg_default=f"No commits found on branch {branch}",
-            empty_msg_branch_fmt="No commits found on branch {branch}",
-            auto_write=False,
-            workdir=workdir,
-        )
+        return parse_commit_date(commit["date"]).timestamp()
+    except (KeyError, ValueError):
+        return float("-inf")
+
+
+def get_recent_commits_for_repositories(
+    count: int = 10,
+    repositories: list[str] | None = None,
+) -> list[RepoCommitInfo | ErrorResponse | InfoResponse]:
+    """Collect recent commits from several repositories, newest first.
+
+    Defaults to the configured tracked repositories. Each repository is queried in its
+    own worker thread since the git subprocesses are independent, so the wall time is
+    that of the slowest repository rather than the sum of all of them.
+    """
+    try:
+        if repositories is None:
+            repositories = git_tools.get_tracked_repositories()
+        repos = _local_repositories(repositories)
+        if not repos:
+            return [_info_response("No local tracked repositories configured")]
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_REPO_WORKERS, len(repos))) as pool:
+            results = list(
+                pool.map(lambda repo: get_recent_commits(count=count, workdir=repo), repos)
+            )
+
+        commits: list[RepoCommitInfo] = []
+        errors: list[ErrorResponse] = []
+        for repo, result in zip(repos, results, strict=True):
+            for entry in result:
+                if "hash" in entry:
+                    commits.append({**entry, "repository": repo})  # type: ignore[typeddict-item]
+                elif "error" in entry:
+                    errors.append({"error": f"{repo}: {entry['error']}"})
+        if commits:
+            commits.sort(key=_commit_sort_key, reverse=True)
+            return commits[:count]
+        if errors:
+            return errors
+        return [_info_response("No recent commits found")]
     except Exception as e:  # noqa: BLE001
         return _handle_git_error(e)
 
@@ -278,44 +706,43 @@ async def _tool_get_recent_commits(
     except Exception:
         authors = []
     authors_count = len(authors)
+    # Request fields carried by the one outcome message sent below (a separate "fetching"
+    # message would cost the client another round trip for the same data)
+    fields = {
+        "tool": "get_recent_commits",
+        "count": count,
+        "branch": branch or "",
+        "authors_count": authors_count,
+    }
 
     if ctx:
-        await ctx.info(
-            "Fetching recent commits",
-            extra={
-                "tool": "get_recent_commits",
-                "count": count,
-                "branch": branch or "",
-                "authors_count": authors_count,
-            },
-        )
-        # Debug: redacted command + cwd
-        base_args = [f"-{count}"]
-        if branch:
-            base_args = [branch, *base_args]
-        redacted_cmd = ["git", "log", *base_args]
-        if authors_count:
-            redacted_cmd.append(f"--author=<{authors_count} authors>")
-        await ctx.log(
-            "Planned git command",
-            level="debug",
-            logger_name="glin.git.commits",
-            extra={
-                "cmd": redacted_cmd,
-                "cwd": _getcwd(),
-                "authors_count": authors_count,
-                "branch": branch or "",
-            },
-        )
+        # Debug: redacted command + cwd (skipped unless SEEV_LOG_LEVEL=DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            base_args = [f"-{count}"]
+            if branch:
+                base_args = [branch, *base_args]
+            redacted_cmd = ["git", "log", *base_args]
+            redacted_cmd.extend(_redacted_author_args(authors))
+            await ctx.log(
+                "Planned git command",
+                level="debug",
+                logger_name="glin.git.commits",
+                extra={
+                    "cmd": redacted_cmd,
+                    "cwd": _getcwd(),
+                    "authors_count": authors_count,
+                    "branch": branch or "",
+                },
+            )
 
-    # Call pure helper
-    result = get_recent_commits(count=count, branch=branch, workdir=workdir)
+    # Call pure helper; git runs on a worker thread so concurrent tool calls don't
+    # wait on each other's subprocesses
+    result = await asyncio.to_thread(
+        get_recent_commits, count=count, branch=branch, workdir=workdir
+    )
 
     # Summarize outcome
-    try:
-        commits_only: list[CommitInfo] = [r for r in result if isinstance(r, dict) and "hash" in r]
-    except Exception:
-        commits_only = []
+    commits_only, error = _split_log_result(result)
     commit_count = len(commits_only)
 
     if ctx:
@@ -329,9 +756,7 @@ async def _tool_get_recent_commits(
                 level="info",
                 logger_name="glin.git.commits",
                 extra={
-                    "tool": "get_recent_commits",
-                    "count": count,
-                    "branch": branch or "",
+                    **fields,
                     "commit_count": commit_count,
                     "first_sha": first_sha,
                     "last_sha": last_sha,
@@ -341,31 +766,26 @@ async def _tool_get_recent_commits(
             )
         else:
             # Detect config gap or empty results/errors
-            error_entries = [r for r in result if isinstance(r, dict) and "error" in r]
-            if error_entries:
+            if error is not None:
                 # Truncate error detail to avoid large payloads
-                msg = str(error_entries[0].get("error", ""))
+                msg = error
                 try:
                     logger.error("get_recent_commits failed: %s", msg)
                 except Exception:
                     pass
                 await ctx.error(
                     "Git fetch failed",
-                    extra={
-                        "tool": "get_recent_commits",
-                        "return": msg[:500],
-                        "branch": branch or "",
-                    },
+                    extra={**fields, "return": msg[:500]},
                 )
             elif authors_count == 0:
                 await ctx.warning(
                     "No tracked emails configured; cannot query commits",
-                    extra={"tool": "get_recent_commits", "branch": branch or ""},
+                    extra=fields,
                 )
             else:
                 await ctx.warning(
                     "No recent commits found",
-                    extra={"tool": "get_recent_commits", "count": count, "branch": branch or ""},
+                    extra=fields,
                 )
 
     return result
@@ -402,39 +822,38 @@ async def _tool_get_commits_by_date(
     except Exception:
         authors = []
     authors_count = len(authors)
+    fields = {
+        "tool": "get_commits_by_date",
+        "since": since,
+        "until": until,
+        "branch": branch or "",
+        "authors_count": authors_count,
+    }
 
     if ctx:
-        await ctx.info(
-            "Fetching commits in date range",
-            extra={
-                "tool": "get_commits_by_date",
-                "since": since,
-                "until": until,
-                "branch": branch or "",
-                "authors_count": authors_count,
-            },
-        )
-        base_args = [f"--since={since}", f"--until={until}"]
-        if branch:
-            base_args = [branch, *base_args]
-        redacted_cmd = ["git", "log", *base_args]
-        if authors_count:
-            redacted_cmd.append(f"--author=<{authors_count} authors>")
-        await ctx.log(
-            "Planned git command",
-            level="debug",
-            logger_name="glin.git.commits",
-            extra={
-                "cmd": redacted_cmd,
-                "cwd": _getcwd(),
-                "authors_count": authors_count,
-                "branch": branch or "",
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            base_args = [f"--since={since}", f"--until={until}"]
+            if branch:
+                base_args = [branch, *base_args]
+            redacted_cmd = ["git", "log", *base_args]
+            redacted_cmd.extend(_redacted_author_args(authors))
+            await ctx.log(
+                "Planned git command",
+                level="debug",
+                logger_name="glin.git.commits",
+                extra={
+                    "cmd": redacted_cmd,
+                    "cwd": _getcwd(),
+                    "authors_count": authors_count,
+                    "branch": branch or "",
+                },
+            )
 
-    result = get_commits_by_date(workdir, since=since, until=until, branch=branch)
+    result = await asyncio.to_thread(
+        get_commits_by_date, workdir, since=since, until=until, branch=branch
+    )
 
-    commits_only: list[CommitInfo] = [r for r in result if isinstance(r, dict) and "hash" in r]
+    commits_only, error = _split_log_result(result)
     commit_count = len(commits_only)
 
     if ctx:
@@ -444,10 +863,7 @@ async def _tool_get_commits_by_date(
                 level="info",
                 logger_name="glin.git.commits",
                 extra={
-                    "tool": "get_commits_by_date",
-                    "since": since,
-                    "until": until,
-                    "branch": branch or "",
+                    **fields,
                     "commit_count": commit_count,
                     "first_sha": commits_only[0]["hash"],
                     "last_sha": commits_only[-1]["hash"],
@@ -456,9 +872,8 @@ async def _tool_get_commits_by_date(
                 },
             )
         else:
-            error_entries = [r for r in result if isinstance(r, dict) and "error" in r]
-            if error_entries:
-                msg = str(error_entries[0].get("error", ""))
+            if error is not None:
+                msg = error
                 try:
                     logger.error(
                         "get_commits_by_date failed (since=%s, until=%s, branch=%s): %s",
@@ -471,28 +886,17 @@ async def _tool_get_commits_by_date(
                     pass
                 await ctx.error(
                     "Git fetch failed",
-                    extra={
-                        "tool": "get_commits_by_date",
-                        "since": since,
-                        "until": until,
-                        "branch": branch or "",
-                        "return": msg[:500],
-                    },
+                    extra={**fields, "return": msg[:500]},
                 )
             elif authors_count == 0:
                 await ctx.warning(
                     "No tracked emails configured; cannot query commits",
-                    extra={"tool": "get_commits_by_date", "branch": branch or ""},
+                    extra=fields,
                 )
             else:
                 await ctx.warning(
                     "No commits found in date range",
-                    extra={
-                        "tool": "get_commits_by_date",
-                        "since": since,
-                        "until": until,
-                        "branch": branch or "",
-                    },
+                    extra=fields,
                 )
 
     return result
@@ -527,31 +931,30 @@ async def _tool_get_branch_commits(
     except Exception:
         authors = []
     authors_count = len(authors)
+    fields = {
+        "tool": "get_branch_commits",
+        "branch": branch,
+        "count": count,
+        "authors_count": authors_count,
+    }
 
     if ctx:
-        await ctx.info(
-            "Fetching commits for branch",
-            extra={
-                "tool": "get_branch_commits",
-                "branch": branch,
-                "count": count,
-                "authors_count": authors_count,
-            },
-        )
-        base_args = [branch, f"-{count}"]
-        redacted_cmd = ["git", "log", *base_args]
-        if authors_count:
-            redacted_cmd.append(f"--author=<{authors_count} authors>")
-        await ctx.log(
-            "Planned git command",
-            level="debug",
-            logger_name="glin.git.commits",
-            extra={"cmd": redacted_cmd, "cwd": _getcwd(), "authors_count": authors_count},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            base_args = [branch, f"-{count}"]
+            redacted_cmd = ["git", "log", *base_args]
+            redacted_cmd.extend(_redacted_author_args(authors))
+            await ctx.log(
+                "Planned git command",
+                level="debug",
+                logger_name="glin.git.commits",
+                extra={"cmd": redacted_cmd, "cwd": _getcwd(), "authors_count": authors_count},
+            )
 
-    result = get_branch_commits(branch=branch, count=count, workdir=workdir)
+    result = await asyncio.to_thread(
+        get_branch_commits, branch=branch, count=count, workdir=workdir
+    )
 
-    commits_only: list[CommitInfo] = [r for r in result if isinstance(r, dict) and "hash" in r]
+    commits_only, error = _split_log_result(result)
     commit_count = len(commits_only)
 
     if ctx:
@@ -561,9 +964,7 @@ async def _tool_get_branch_commits(
                 level="info",
                 logger_name="glin.git.commits",
                 extra={
-                    "tool": "get_branch_commits",
-                    "branch": branch,
-                    "count": count,
+                    **fields,
                     "commit_count": commit_count,
                     "first_sha": commits_only[0]["hash"],
                     "last_sha": commits_only[-1]["hash"],
@@ -572,27 +973,60 @@ async def _tool_get_branch_commits(
                 },
             )
         else:
-            error_entries = [r for r in result if isinstance(r, dict) and "error" in r]
-            if error_entries:
-                msg = str(error_entries[0].get("error", ""))
+            if error is not None:
+                msg = error
                 await ctx.error(
                     "Git fetch failed",
-                    extra={
-                        "tool": "get_branch_commits",
-                        "branch": branch,
-                        "count": count,
-                        "return": msg[:500],
-                    },
+                    extra={**fields, "return": msg[:500]},
                 )
             elif authors_count == 0:
                 await ctx.warning(
                     "No tracked emails configured; cannot query commits",
-                    extra={"tool": "get_branch_commits", "branch": branch},
+                    extra=fields,
                 )
             else:
                 await ctx.warning(
                     "No commits found on branch",
-                    extra={"tool": "get_branch_commits", "branch": branch, "count": count},
+                    extra=fields,
                 )
 
     return result
+
+
+@mcp.tool(
+    name="get_recent_commits_for_repositories",
+    description=(
+        "Get the most recent commits across several repositories (defaults to the "
+        "configured tracked repositories), newest first. Each commit carries the "
+        "repository it came from; remote-only entries are skipped."
+    ),
+)
+async def _tool_get_recent_commits_for_repositories(
+    count: int = 10,
+    repositories: Annotated[
+        list[str] | None,
+        Field(
+            description=(
+                "Optional local repository paths to query. "
+                "Defaults to SEEV_TRACK_REPOSITORIES / track_repositories."
+            )
+        ),
+    ] = None,
+    ctx: Context | None = None,
+):  # pragma: no cover
+    result = await asyncio.to_thread(
+        get_recent_commits_for_repositories, count=count, repositories=repositories
+    )
+    if ctx:
+        commit_count = sum(1 for r in result if isinstance(r, dict) and "hash" in r)
+        await ctx.log(
+            "Multi-repository commits fetch completed",
+            level="info",
+            logger_name="glin.git.commits",
+            extra={
+                "tool": "get_recent_commits_for_repositories",
+                "count": count,
+                "commit_count": commit_count,
+            },
+        )
+    return result
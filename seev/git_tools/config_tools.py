@@ -1,8 +1,11 @@
+import os
 import subprocess
+import time
 from typing import TypedDict
 
 import seev.git_tools as git_tools
 
+from ..config import _find_config_file
 from ..mcp_app import mcp
 
 
@@ -31,32 +34,39 @@ class RepositoriesConfig(TypedDict):
     source: str
 
 
+# `git config --get` answers per (cwd, key), reused for a few seconds so the config tools
+# don't spawn git on every call
+_GIT_CONFIG_TTL_SECONDS = 5.0
+_git_config_cache: dict[tuple[str, str], tuple[float, bool]] = {}
+
+
+def clear_git_config_cache() -> None:
+    """Forget cached ``git config --get`` answers."""
+    _git_config_cache.clear()
+
+
 def _check_git_config(key: str) -> bool:
+    cache_key = (os.getcwd(), key)
+    now = time.monotonic()
+    cached = _git_config_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
     try:
         subprocess.run(["git", "config", "--get", key], capture_output=True, text=True, check=True)
-        return True
+        found = True
     except subprocess.CalledProcessError:
-        return False
+        found = False
+    _git_config_cache[cache_key] = (now + _GIT_CONFIG_TTL_SECONDS, found)
+    return found
 
 
 def _get_config_source() -> str:
-    import os
-    from pathlib import Path
-
     if os.getenv("SEEV_TRACK_EMAILS"):
         return "environment_variable"
 
-    config_paths = [
-        Path.cwd() / "seev.toml",
-        Path.home() / ".config" / "seev" / "seev.toml",
-        Path.home() / ".seev.toml",
-        Path.cwd() / "glin.toml",
-        Path.home() / ".config" / "glin" / "glin.toml",
-        Path.home() / ".glin.toml",
-    ]
-    for p in config_paths:
-        if p.exists():
-            return f"config_file ({p})"
+    config_path = _find_config_file()
+    if config_path is not None:
+        return f"config_file ({config_path})"
 
     if _check_git_config("user.email"):
         return "git_user_email"
@@ -66,23 +76,12 @@ def _get_config_source() -> str:
 
 
 def _get_repositories_config_source() -> str:
-    import os
-    from pathlib import Path
-
     if os.getenv("SEEV_TRACK_REPOSITORIES") or os.getenv("SEEV_TRACK_REPOS"):
         return "environment_variable"
 
-    config_paths = [
-        Path.cwd() / "seev.toml",
-        Path.home() / ".config" / "seev" / "seev.toml",
-        Path.home() / ".seev.toml",
-        Path.cwd() / "glin.toml",
-        Path.home() / ".config" / "glin" / "glin.toml",
-        Path.home() / ".glin.toml",
-    ]
-    for p in config_paths:
-        if p.exists():
-            return f"config_file ({p})"
+    config_path = _find_config_file()
+    if config_path is not None:
+        return f"config_file ({config_path})"
 
     return "none"
 
@@ -4,11 +4,7 @@ from typing import Annotated, Any, TypedDict
 from pydantic import Field
 
 from ..mcp_app import mcp
-from .analysis import (
-    categorize_commit,
-    detect_merge_info,
-    get_commit_statistics,
-)
+from .analysis import analyze_commits
 from .commits import get_commits_by_date
 
 
@@ -64,15 +60,15 @@ def get_enriched_commits(
     total_dels = 0
     total_files = 0
 
-    for c in commits:
-        # Skip non-commit dicts defensively
-        if "hash" not in c:
-            continue
+    # Skip non-commit dicts defensively
+    commit_list = [c for c in commits if "hash" in c]
+    # One batched git query covers every commit instead of three subprocesses per commit
+    analyses = analyze_commits([c["hash"] for c in commit_list], workdir=workdir)
 
-        sha = c["hash"]
-        stats = get_commit_statistics(sha, workdir=workdir)
-        category = categorize_commit(sha, is_hash=True, workdir=workdir)
-        merge_info = detect_merge_info(sha, workdir=workdir)
+    for c, analysis in zip(commit_list, analyses, strict=True):
+        stats = analysis["statistics"]
+        category = analysis["category"]
+        merge_info = analysis["merge_info"]
 
         # Aggregate totals if stats have expected shape
         try:
@@ -15,6 +15,12 @@ def _err(msg: str) -> ErrorResponse:
     return {"error": msg}
 
 
+# Metadata fields are joined with the ASCII unit separator, which (unlike '|') cannot
+# appear in names, emails or subjects
+_FIELD_SEP = "\x1f"
+_SHOW_PRETTY_FORMAT = "--pretty=format:%H%x1f%an%x1f%ae%x1f%ai%x1f%s"
+
+
 class CommitFilesResult(TypedDict):
     hash: str
     author: str
@@ -46,57 +52,59 @@ def get_commit_files(
                 return _err(root_res["error"])
             repo_root = root_res.get("path")
 
-        metadata_args = ["show", "--no-patch", "--pretty=format:%H|%an|%ae|%ai|%s", commit_hash]
-        metadata_result = run_git(metadata_args, repo_root=repo_root)
-        if not metadata_result.stdout.strip():
+        # One `git show` for metadata, statuses and line counts. With -z, paths are
+        # NUL-terminated and never quoted, and renames give both paths in full.
+        show_args = ["show", "-z", "--raw", "--numstat", _SHOW_PRETTY_FORMAT, commit_hash]
+        show_result = run_git(show_args, repo_root=repo_root)
+        if not show_result.stdout.strip():
             return _err(f"Commit {commit_hash} not found")
-        hash, author, email, date, message = metadata_result.stdout.strip().split("|", 4)
-
-        status_args = ["show", "--name-status", "--pretty=format:", commit_hash]
-        status_result = run_git(status_args, repo_root=repo_root)
-
-        numstat_args = ["show", "--numstat", "--pretty=format:", commit_hash]
-        numstat_result = run_git(numstat_args, repo_root=repo_root)
+        out = show_result.stdout
+        # The metadata line ends with a newline before raw records, or with NUL when only
+        # numstat follows (merges have no raw output)
+        end = min((i for i in (out.find("\n"), out.find("\0")) if i != -1), default=len(out))
+        header, diff = out[:end], out[end + 1 :]
+        hash, author, email, date, message = header.split(_FIELD_SEP, 4)
+        # str.strip() counts the separator as whitespace, so only trim the subject
+        message = message.rstrip()
 
         status_map: dict[str, tuple[str, str | None]] = {}
-        for line in status_result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("\t")
-            if len(parts) >= 2:
-                status = parts[0]
-                if status.startswith(("R", "C")) and len(parts) == 3:
-                    old_path = parts[1]
-                    new_path = parts[2]
-                    status_map[new_path] = (status[0], old_path)
-                else:
-                    path = parts[1]
-                    status_map[path] = (status, None)
-
         files: list[FileChange] = []
         total_additions = 0
         total_deletions = 0
 
-        for line in numstat_result.stdout.strip().split("\n"):
-            if not line:
+        tokens = iter(diff.split("\0"))
+        for token in tokens:
+            if token.startswith(":"):
+                # Raw record ":<modes> <oids> <status>", then one path (two for R/C)
+                status = token.rsplit(" ", 1)[-1]
+                if status.startswith(("R", "C")):
+                    old_path = next(tokens)
+                    status_map[next(tokens)] = (status[0], old_path)
+                else:
+                    status_map[next(tokens)] = (status, None)
                 continue
-            parts = line.split("\t")
-            if len(parts) >= 3:
-                additions_str, deletions_str, path = parts[0], parts[1], parts[2]
-                additions = 0 if additions_str == "-" else int(additions_str)
-                deletions = 0 if deletions_str == "-" else int(deletions_str)
-                total_additions += additions
-                total_deletions += deletions
-                status, old_path = status_map.get(path, ("M", None))
-                files.append(
-                    {
-                        "path": path,
-                        "status": status,
-                        "additions": additions,
-                        "deletions": deletions,
-                        "old_path": old_path,
-                    }
-                )
+            parts = token.split("\t", 2)
+            if len(parts) < 3:
+                continue
+            additions_str, deletions_str, path = parts
+            if not path:
+                # Numstat of a rename/copy: the old and new paths follow
+                next(tokens)
+                path = next(tokens)
+            additions = 0 if additions_str == "-" else int(additions_str)
+            deletions = 0 if deletions_str == "-" else int(deletions_str)
+            total_additions += additions
+            total_deletions += deletions
+            status, old_path = status_map.get(path, ("M", None))
+            files.append(
+                {
+                    "path": path,
+                    "status": status,
+                    "additions": additions,
+                    "deletions": deletions,
+                    "old_path": old_path,
+                }
+            )
 
         return {
             "hash": hash,
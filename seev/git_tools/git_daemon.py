@@ -0,0 +1,172 @@
+"""
+Long-running ``git cat-file --batch`` workers for per-commit lookups.
+
+Tools that look at one commit at a time (its subject, its parents) would otherwise
+fork and exec a fresh ``git`` for every call, which costs far more than git's actual
+work. A worker stays alive per repository and answers each lookup over its
+stdin/stdout pipes instead; threads share it and take turns under its lock.
+
+Lookups are best effort: anything the raw commit object cannot answer the way
+``git log``/``git show`` would (missing or non-commit objects, a re-encoded message,
+shallow or linked-worktree repositories, a dead worker) returns None, and the caller
+runs git as before.
+"""
+
+import atexit
+import collections
+import os
+import subprocess
+import threading
+from typing import NamedTuple
+
+# Workers kept alive at once; the least recently used one is closed beyond this
+_MAX_WORKERS = 8
+
+_workers: collections.OrderedDict[str, "_CatFileWorker"] = collections.OrderedDict()
+_workers_lock = threading.Lock()
+
+
+class CommitObject(NamedTuple):
+    hash: str
+    parents: list[str]
+    subject: str
+
+
+class _CatFileWorker:
+    """One ``git cat-file --batch`` process reading object names from its stdin."""
+
+    def __init__(self, repo_root: str) -> None:
+        self.proc = subprocess.Popen(
+            ["git", "-C", repo_root, "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        # One request/response exchange at a time on the pipes
+        self.lock = threading.Lock()
+
+    def read(self, rev: str) -> tuple[str, str, bytes] | None:
+        """Return ``(oid, type, content)`` for ``rev``, or None if git cannot resolve it."""
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        self.proc.stdin.write(rev.encode() + b"\n")
+        self.proc.stdin.flush()
+        header = self.proc.stdout.readline()
+        if not header:
+            raise OSError("git cat-file exited")
+        parts = header.split()
+        # "<rev> missing" / "<rev> ambiguous" instead of "<oid> <type> <size>"
+        if len(parts) != 3:
+            return None
+        oid, obj_type, size = parts
+        content = self.proc.stdout.read(int(size))
+        self.proc.stdout.read(1)  # newline after the content
+        return oid.decode(), obj_type.decode(), content
+
+    def close(self) -> None:
+        try:
+            if self.proc.stdin is not None:
+                self.proc.stdin.close()
+            self.proc.wait(timeout=1)
+        except Exception:  # noqa: BLE001
+            self.proc.kill()
+        if self.proc.stdout is not None:
+            self.proc.stdout.close()
+
+
+def _worker(repo_root: str) -> _CatFileWorker:
+    with _workers_lock:
+        worker = _workers.get(repo_root)
+        if worker is not None:
+            _workers.move_to_end(repo_root)
+            return worker
+        worker = _workers[repo_root] = _CatFileWorker(repo_root)
+        oldest = _workers.popitem(last=False)[1] if len(_workers) > _MAX_WORKERS else None
+    if oldest is not None:
+        _close(oldest)
+    return worker
+
+
+def _close(worker: _CatFileWorker) -> None:
+    # Wait for a lookup in flight on another thread before closing the pipes
+    with worker.lock:
+        worker.close()
+
+
+def _drop(repo_root: str, worker: _CatFileWorker) -> None:
+    with _workers_lock:
+        # Another thread may already have replaced the broken worker
+        if _workers.get(repo_root) is worker:
+            del _workers[repo_root]
+    _close(worker)
+
+
+def _supported(repo_root: str) -> bool:
+    git_dir = os.path.join(repo_root, ".git")
+    # Linked worktrees have a .git file; shallow clones report grafted parents in log
+    return os.path.isdir(git_dir) and not os.path.exists(os.path.join(git_dir, "shallow"))
+
+
+# git's isspace(): space, tab, CR and LF (not vertical tab or form feed)
+_GIT_SPACE = b" \t\r\n"
+
+
+def _subject(message: bytes) -> bytes:
+    """The ``%s`` subject: the first paragraph's lines, right-trimmed and joined by spaces."""
+    lines = message.split(b"\n")
+    i = 0
+    while i < len(lines) and not lines[i].strip(_GIT_SPACE):
+        i += 1
+    subject: list[bytes] = []
+    for line in lines[i:]:
+        line = line.rstrip(_GIT_SPACE)
+        if not line:
+            break
+        subject.append(line)
+    return b" ".join(subject)
+
+
+def read_commit(repo_root: str | None, rev: str) -> CommitObject | None:
+    """Full hash, parents and subject of ``rev`` in ``repo_root``, or None to run git instead."""
+    if not repo_root or not rev or "\n" in rev or not _supported(repo_root):
+        return None
+    try:
+        worker = _worker(repo_root)
+    except OSError:
+        return None
+    try:
+        with worker.lock:
+            found = worker.read(rev)
+    except (OSError, ValueError):
+        # A dead process, or a worker closed by eviction while this lookup waited
+        _drop(repo_root, worker)
+        return None
+    if found is None:
+        return None
+    oid, obj_type, content = found
+    if obj_type != "commit":
+        return None
+    headers, _, message = content.partition(b"\n\n")
+    parents: list[str] = []
+    for line in headers.split(b"\n"):
+        if line.startswith(b"parent "):
+            parents.append(line[7:].decode())
+        elif line.startswith(b"encoding "):
+            # git re-encodes such messages for output; leave that to git
+            return None
+    try:
+        subject = _subject(message).decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return CommitObject(oid, parents, subject)
+
+
+def close_workers() -> None:
+    """Stop every worker process."""
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        _close(worker)
+
+
+atexit.register(close_workers)
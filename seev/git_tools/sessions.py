@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any, TypedDict
 
 from ..mcp_app import mcp
-from .commits import get_commits_by_date
+from .commits import get_commits_by_date, parse_commit_date
 from .enrichment import EnrichedCommit, EnrichedResult, get_enriched_commits
 
 
@@ -54,8 +54,8 @@ def detect_work_sessions(commits: list[dict], gap_threshold_minutes: int = 30) -
         if not date_str:
             # Skip items that don't look like commits
             continue
-        # Normalize: allow "YYYY-MM-DD HH:MM:SS" or isoformat already
-        ts = datetime.fromisoformat(date_str.replace(" ", "T"))
+        # "YYYY-MM-DD HH:MM:SS[ +ZZZZ]" (git %ai) or isoformat already
+        ts = parse_commit_date(date_str)
 
         if current["start_time"] is None:
             current["start_time"] = ts
@@ -1,5 +1,10 @@
+import contextlib
+import functools
+import os
 import subprocess
-from typing import TypedDict
+import tempfile
+from collections.abc import Iterator
+from typing import IO, Any, TypedDict
 
 
 class RepoRootResult(TypedDict, total=False):
@@ -7,6 +12,27 @@ class RepoRootResult(TypedDict, total=False):
     error: str
 
 
+@functools.lru_cache(maxsize=128)
+def _repo_root_for(path: str) -> str:
+    """Return the top level of the repository containing ``path`` (cached per path).
+
+    Failures raise ``CalledProcessError`` and are therefore not cached, so a directory
+    that becomes a repository later is picked up on the next call.
+    """
+    res = subprocess.run(
+        ["git", "-C", path, "rev-parse", "--show-toplevel"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return res.stdout.strip()
+
+
+def clear_repo_root_cache() -> None:
+    """Forget every resolved repository root."""
+    _repo_root_for.cache_clear()
+
+
 def resolve_repo_root(path: str | None) -> RepoRootResult:
     """Resolve the git repository root for a given path.
 
@@ -23,14 +49,8 @@ def resolve_repo_root(path: str | None) -> RepoRootResult:
     else:
         base = path
     try:
-        res = subprocess.run(
-            ["git", "-C", base, "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        root = res.stdout.strip()
-        return {"path": root}
+        # Keyed on the absolute path so a relative workdir follows the current directory
+        return {"path": _repo_root_for(os.path.abspath(base))}
     except subprocess.CalledProcessError as e:  # noqa: BLE001
         msg = (e.stderr or e.stdout or "Not a git repo").strip() or "Not a git repo"
         return {"error": msg}
@@ -48,3 +68,65 @@ def run_git(args: list[str], repo_root: str | None = None, **kwargs):
     else:
         cmd = ["git", *args]
     return subprocess.run(cmd, capture_output=True, text=True, check=True, **kwargs)
+
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _split_stream(stream: IO[str], sep: str) -> Iterator[str]:
+    """Yield the ``sep``-terminated records of ``stream`` (a final unterminated one too)."""
+    pending = ""
+    while chunk := stream.read(_STREAM_CHUNK_SIZE):
+        *records, pending = (pending + chunk).split(sep)
+        yield from records
+    if pending:
+        yield pending
+
+
+@contextlib.contextmanager
+def _git_stdout(args: list[str], repo_root: str | None, text: bool) -> Iterator[IO[Any]]:
+    """Run git and yield its stdout pipe; raise ``CalledProcessError`` if git failed."""
+    cmd = ["git", "-C", repo_root, *args] if repo_root else ["git", *args]
+    # stderr goes to a temporary file so a chatty git cannot block on a full pipe
+    with tempfile.TemporaryFile(mode="w+") as err:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err, text=text) as proc:
+            assert proc.stdout is not None
+            try:
+                yield proc.stdout
+            except GeneratorExit:
+                # The caller stopped early; don't wait for git to write the rest
+                proc.kill()
+                raise
+        if proc.returncode:
+            err.seek(0)
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=err.read())
+
+
+def run_git_streaming(
+    args: list[str], repo_root: str | None = None, sep: str = "\n"
+) -> Iterator[str]:
+    """Yield the stdout records of a git subcommand as git produces them.
+
+    Builds the command like :func:`run_git`, but reads stdout through a pipe instead of
+    buffering it, so large outputs are parsed while git is still writing them. Records
+    are lines by default; pass ``sep="\\0"`` for the NUL-terminated output of ``-z``
+    options. Raises ``CalledProcessError`` (with ``stderr``) once the output is
+    exhausted if git failed.
+    """
+    with _git_stdout(args, repo_root, text=True) as stdout:
+        if sep == "\n":
+            for line in stdout:
+                yield line.rstrip("\n")
+        else:
+            yield from _split_stream(stdout, sep)
+
+
+def run_git_streaming_bytes(args: list[str], repo_root: str | None = None) -> Iterator[bytes]:
+    """Like :func:`run_git_streaming`, but yield undecoded stdout lines.
+
+    For output that embeds file content (e.g. ``git blame``), which need not be UTF-8;
+    the caller decodes only the parts it keeps.
+    """
+    with _git_stdout(args, repo_root, text=False) as stdout:
+        for line in stdout:
+            yield line.rstrip(b"\n")
@@ -1,9 +1,17 @@
+import contextlib
+import errno
 import os
 import re
+import stat
+import tempfile
+import time
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from itertools import chain, islice
 from pathlib import Path
 from typing import TypedDict
 
-from .config import get_markdown_path
+from .config import _resolve_markdown_path, get_markdown_path
 from .mcp_app import mcp
 
 
@@ -56,6 +64,32 @@ class DateEntryResponse(TypedDict):
     raw_content: str
 
 
+# Today's local date as YYYY-MM-DD and the epoch time of the next local midnight, when it
+# stops being valid.
+_TODAY_CACHE: tuple[float, str] = (0.0, "")
+
+
+def _today_iso() -> str:
+    global _TODAY_CACHE
+    now = time.time()
+    if now >= _TODAY_CACHE[0]:
+        today = datetime.fromtimestamp(now).date()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _TODAY_CACHE = (midnight.timestamp(), today.isoformat())
+    return _TODAY_CACHE[1]
+
+
+def _absolute_path(target: str) -> Path:
+    """Return ``target`` as an absolute path, resolving relative paths against the cwd.
+
+    The working directory is read on each call (tools may run after a chdir); the join
+    is done on strings so only one Path is built.
+    """
+    if not os.path.isabs(target):
+        target = os.path.join(os.getcwd(), target)
+    return Path(target)
+
+
 def read_date_entry(
     date_str: str,
     file_path: str | None = None,
@@ -71,8 +105,6 @@ def read_date_entry(
         A dict with exists flag, date, heading line number, parsed sections, and raw content.
         If the date entry doesn't exist, returns exists=False with empty sections.
     """
-    from datetime import date
-
     # Validate date format
     try:
         parsed_date = date.fromisoformat(date_str)
@@ -101,9 +133,7 @@ def read_date_entry(
         target = str(file_path).strip()
     else:
         target = get_markdown_path()
-    path = Path(target)
-    if not path.is_absolute():
-        path = Path.cwd() / path
+    path = _absolute_path(target)
 
     # If file doesn't exist, return non-existent entry
     if not path.exists():
@@ -130,11 +160,7 @@ def read_date_entry(
 
     # Find the date heading
     heading = f"## {date_iso}"
-    heading_idx = None
-    for i, line in enumerate(lines):
-        if line.strip() == heading:
-            heading_idx = i
-            break
+    heading_idx = _find_heading_line(lines, heading)
 
     # If heading not found, return non-existent entry
     if heading_idx is None:
@@ -156,13 +182,7 @@ def read_date_entry(
         }
 
     # Find the end of this date section (next ## heading or end of file)
-    end_idx = len(lines)
-    for i in range(heading_idx + 1, len(lines)):
-        stripped = lines[i].strip()
-        # Match only level 2 headings (## ), not level 3 (###) or deeper
-        if stripped.startswith("## ") and len(stripped) > 3:
-            end_idx = i
-            break
+    end_idx = _find_next_level2_heading(lines, heading_idx + 1)
 
     # Extract raw content for this date section
     section_lines = lines[heading_idx + 1 : end_idx]
@@ -385,6 +405,19 @@ def merge_date_sections(
     Returns:
         Tuple of (merged markdown content ready to write, deduplicated count)
     """
+    merged_lines, total_duplicates = _merge_date_section_lines(
+        existing, new_content, preserve_lines=preserve_lines
+    )
+    return "\n".join(merged_lines), total_duplicates
+
+
+def _merge_date_section_lines(
+    existing: DateEntryResponse,
+    new_content: str,
+    *,
+    preserve_lines: bool = False,
+) -> tuple[list[str], int]:
+    """Line-list form of ``merge_date_sections``, for callers that write lines directly."""
     # Parse new content into sections
     new_sections: DateEntrySections = {
         "goals": [],
@@ -517,10 +550,7 @@ def merge_date_sections(
         for line in merged_sections["weekly_summary"].split("\n"):
             output_lines.append(line)
 
-    # Join with newlines
-    merged_content = "\n".join(output_lines)
-
-    return merged_content, total_duplicates
+    return output_lines, total_duplicates
 
 
 def _find_date_insertion_position(doc_lines: list[str], new_date_str: str) -> int:
@@ -534,8 +564,6 @@ def _find_date_insertion_position(doc_lines: list[str], new_date_str: str) -> in
     Returns:
         Line index where the new date heading should be inserted.
     """
-    from datetime import date
-
     new_date = date.fromisoformat(new_date_str)
     date_pattern = re.compile(r"^##\s+(\d{4}-\d{2}-\d{2})\s*$")
 
@@ -563,6 +591,209 @@ def _find_date_insertion_position(doc_lines: list[str], new_date_str: str) -> in
     return len(doc_lines)
 
 
+def _read_doc_lines(path: Path) -> tuple[list[str], bool]:
+    """Read ``path`` as a list of lines without their line endings.
+
+    Also reports whether the file is already in the canonical form this module writes
+    (every line, including the last, ends with a bare ``\\n``), in which case new lines
+    can be appended to it without rewriting what is there. A missing file yields
+    ``([], True)``.
+    """
+    try:
+        # newline="" keeps each line's original ending so non-canonical files can be spotted
+        f = path.open("r", encoding="utf-8", newline="")
+    except FileNotFoundError:
+        return [], True
+    lines: list[str] = []
+    canonical = True
+    with f:
+        for line in f:
+            if line.endswith("\r\n"):
+                line = line[:-2]
+                canonical = False
+            elif line.endswith("\n"):
+                line = line[:-1]
+            else:
+                # A bare "\r" ending, or a final line without a newline
+                if line.endswith("\r"):
+                    line = line[:-1]
+                canonical = False
+            lines.append(line)
+    return lines, canonical
+
+
+def _write_doc_lines_in_place(target: Path, lines: Iterable[str]) -> None:
+    with target.open("w", encoding="utf-8") as f:
+        f.writelines(f"{line}\n" for line in lines)
+        if f.tell() == 0:
+            f.write("\n")
+
+
+def _write_doc_lines(path: Path, lines: Iterable[str]) -> None:
+    """Replace ``path`` with ``lines`` (Unix newlines, ending with a newline).
+
+    An existing file is rewritten through a temporary file in the same directory that
+    is fsync'ed and then renamed over it, so a crash mid-write leaves the old worklog
+    intact. Symlinks are written through, and the file's permission bits and owner are
+    kept. When a rename cannot preserve the file (a hard-linked file, an owner the
+    temporary file cannot take) or the directory is not writable, the file is
+    overwritten in place instead.
+    """
+    target = Path(os.path.realpath(path))
+    try:
+        st = target.stat()
+    except FileNotFoundError:
+        # Nothing to protect yet: write the new file directly
+        _write_doc_lines_in_place(target, lines)
+        return
+    if not os.access(target, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(path))
+    if st.st_nlink > 1:
+        # Renaming over one name would split it from its other links
+        _write_doc_lines_in_place(target, lines)
+        return
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    except PermissionError:
+        # A writable worklog in a read-only directory
+        _write_doc_lines_in_place(target, lines)
+        return
+    try:
+        tmp_st = os.fstat(fd)
+        if (tmp_st.st_uid, tmp_st.st_gid) != (st.st_uid, st.st_gid):
+            os.fchown(fd, st.st_uid, st.st_gid)
+    except PermissionError:
+        os.close(fd)
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        _write_doc_lines_in_place(target, lines)
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(f"{line}\n" for line in lines)
+            if f.tell() == 0:
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, stat.S_IMODE(st.st_mode))
+        os.replace(tmp_name, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _append_doc_lines(path: Path, lines: Iterable[str]) -> None:
+    """Append ``lines`` (each newline-terminated) to the canonical file at ``path``."""
+    with path.open("a", encoding="utf-8") as f:
+        f.writelines(f"{line}\n" for line in lines)
+
+
+# Line probes for scanning worklogs. Matching in place avoids a strip()/lstrip() copy of
+# every line visited.
+_HEADING_LINE_RE = re.compile(r"\s*#")
+# A level 2 heading ("## " plus some text), but not "###" or deeper
+_LEVEL2_HEADING_RE = re.compile(r"\s*## \s*\S")
+
+
+def _find_heading_line(doc_lines: list[str], heading: str) -> int | None:
+    """Return the index of the line that is exactly ``heading`` (ignoring outer whitespace)."""
+    for i, line in enumerate(doc_lines):
+        # The substring test rejects almost every line without allocating
+        if heading in line and line.strip() == heading:
+            return i
+    return None
+
+
+def _find_next_heading(doc_lines: list[str], start: int) -> int | None:
+    """Return the index of the first Markdown heading at or after ``start``."""
+    match = _HEADING_LINE_RE.match
+    for i in range(start, len(doc_lines)):
+        if match(doc_lines[i]):
+            return i
+    return None
+
+
+def _find_next_level2_heading(doc_lines: list[str], start: int) -> int:
+    """Return the index of the next ``## `` heading at or after ``start`` (or the line count)."""
+    match = _LEVEL2_HEADING_RE.match
+    for i in range(start, len(doc_lines)):
+        if match(doc_lines[i]):
+            return i
+    return len(doc_lines)
+
+
+def _find_heading_span(doc_lines: list[str], heading: str) -> tuple[int | None, int | None]:
+    """Locate ``heading`` and the next heading after it in one pass over ``doc_lines``."""
+    heading_idx = _find_heading_line(doc_lines, heading)
+    if heading_idx is None:
+        return None, None
+    return heading_idx, _find_next_heading(doc_lines, heading_idx + 1)
+
+
+def _probe_last_section(data: bytes, heading: str) -> tuple[int, bool] | None:
+    """Check, without parsing the whole worklog, whether ``heading`` opens its last section.
+
+    Only the lines of the final section are decoded; the rest of ``data`` is handled as
+    bytes. Returns ``(line_count, blank_needed)``, where ``blank_needed`` says whether a
+    blank line must separate the heading from the new bullets, or None when the file is
+    not in canonical form or ``heading`` is not (only) the last section. In that case the
+    caller falls back to the full read and rewrite, which this path mirrors.
+    """
+    if not data.endswith(b"\n") or b"\r" in data:
+        return None
+    try:
+        # Walk back from the end of the file to the last heading line
+        line_end = len(data) - 1
+        next_line: str | None = None
+        while line_end >= 0:
+            line_start = data.rfind(b"\n", 0, line_end) + 1
+            line = data[line_start:line_end].decode("utf-8")
+            if _HEADING_LINE_RE.match(line):
+                break
+            next_line = line
+            line_end = line_start - 1
+        else:
+            return None
+        if line.strip() != heading:
+            return None
+        # An earlier copy of the heading is the one the full path would append under
+        heading_bytes = heading.encode("utf-8")
+        pos = data.find(heading_bytes, 0, line_start)
+        while pos >= 0:
+            start = data.rfind(b"\n", 0, pos) + 1
+            end = data.find(b"\n", pos)
+            if data[start:end].decode("utf-8").strip() == heading:
+                return None
+            pos = data.find(heading_bytes, end, line_start)
+    except UnicodeDecodeError:
+        return None
+    return data.count(b"\n"), next_line is None or next_line.strip() != ""
+
+
+def _append_to_last_section(
+    path: Path, heading: str, block_lines: list[str]
+) -> tuple[int, bool] | None:
+    """Append ``block_lines`` under ``heading`` if it opens the last section of ``path``.
+
+    The file is opened once: the probe reads it and the bullets are written through the
+    same handle. Returns the probe result, or None (leaving the file untouched) when the
+    file is missing or the probe declines.
+    """
+    try:
+        f = path.open("r+b")
+    except FileNotFoundError:
+        return None
+    with f:
+        probe = _probe_last_section(f.read(), heading)
+        if probe is None:
+            return None
+        lines = [""] + block_lines if probe[1] else block_lines
+        f.seek(0, os.SEEK_END)
+        f.write("".join(f"{line}\n" for line in lines).encode("utf-8"))
+    return probe
+
+
 def append_to_markdown(
     content: str,
     file_path: str | None = None,
@@ -610,8 +841,6 @@ def append_to_markdown(
             }
             return error_response
 
-        from datetime import date, datetime
-
         # Resolve target path: parameter > env var > glin.toml > default
         if file_path and str(file_path).strip():
             target = str(file_path).strip()
@@ -619,16 +848,14 @@ def append_to_markdown(
             defaulted_flag = False
         else:
             # Delegate env/TOML/default resolution to config
-            target = get_markdown_path()
-            used_env_flag = bool(os.getenv("SEEV_MD_PATH"))
+            target, used_env_flag = _resolve_markdown_path()
             # Consider defaulted when neither param nor env provided and config didn't override
             defaulted_flag = (not used_env_flag) and (target == "WORKLOG.md")
-        path = Path(target)
-        if not path.is_absolute():
-            path = Path.cwd() / path
+        path = _absolute_path(target)
 
-        # Ensure parent directory exists
-        path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists (one stat in the common case where it already does)
+        if not path.parent.is_dir():
+            path.parent.mkdir(parents=True, exist_ok=True)
 
         # Prepare date heading (validate provided date_str if any)
         if date_str is not None:
@@ -639,53 +866,37 @@ def append_to_markdown(
                 return {"error": "date_str must be in YYYY-MM-DD format"}
             date_for_heading = chosen_date.isoformat()
         else:
-            date_for_heading = datetime.now().date().isoformat()
+            date_for_heading = _today_iso()
 
         # UPDATE MODE: Read existing entry and merge
         if update_mode:
-            existing = read_date_entry(date_for_heading, file_path)
+            existing = read_date_entry(date_for_heading, str(path))
 
             if existing["exists"]:
-                # Merge new content with existing
-                merged_content, deduplicated_count = merge_date_sections(
+                # Merge new content with existing, keeping the result as lines since that
+                # is how it is spliced into the document
+                merged_lines, deduplicated_count = _merge_date_section_lines(
                     existing, content, preserve_lines=preserve_lines
                 )
 
                 # Read the file to replace the date section
-                if path.exists():
-                    file_content = (
-                        path.read_text(encoding="utf-8").replace("\r\n", "\n").replace("\r", "\n")
-                    )
-                    doc_lines = file_content.split("\n")
-                    if doc_lines and doc_lines[-1] == "":
-                        doc_lines.pop()
-                else:
-                    doc_lines = []
+                doc_lines, _canonical = _read_doc_lines(path)
 
                 # Find the date heading
                 heading = f"## {date_for_heading}"
-                heading_idx = None
-                for i, line in enumerate(doc_lines):
-                    if line.strip() == heading:
-                        heading_idx = i
-                        break
-
-                # Find the end of this date section
-                end_idx = len(doc_lines)
+                heading_idx = _find_heading_line(doc_lines, heading)
+
                 if heading_idx is not None:
-                    for i in range(heading_idx + 1, len(doc_lines)):
-                        stripped = doc_lines[i].strip()
-                        # Match only level 2 headings (## ), not level 3 (###) or deeper
-                        if stripped.startswith("## ") and len(stripped) > 3:
-                            end_idx = i
-                            break
+                    # Find the end of this date section
+                    end_idx = _find_next_level2_heading(doc_lines, heading_idx + 1)
 
                     # Replace the section content (keep heading, replace content
                     # until the next heading)
-                    merged_lines = merged_content.split("\n")
-                    # Remove leading empty line if present (we'll add proper spacing)
-                    while merged_lines and merged_lines[0].strip() == "":
-                        merged_lines.pop(0)
+                    # Drop leading empty lines (we'll add proper spacing)
+                    first = 0
+                    while first < len(merged_lines) and merged_lines[first].strip() == "":
+                        first += 1
+                    merged_lines = merged_lines[first:]
 
                     # Ensure blank line after heading
                     replacement = [""]
@@ -701,11 +912,10 @@ def append_to_markdown(
                     # Count bullets in merged content
                     bullet_count = sum(1 for line in merged_lines if line.strip().startswith("- "))
 
-                    # Reconstruct and write
-                    new_content = "\n".join(doc_lines)
-                    if not new_content.endswith("\n"):
-                        new_content += "\n"
-                    path.write_text(new_content, encoding="utf-8")
+                    # Write back; a trailing blank line becomes the file's final newline
+                    if doc_lines and doc_lines[-1] == "":
+                        doc_lines.pop()
+                    _write_doc_lines(path, doc_lines)
 
                     # Calculate statistics
                     existing_bullet_count = sum(
@@ -752,111 +962,106 @@ def append_to_markdown(
 
         heading = f"## {date_for_heading}"
 
-        # Read existing file (normalize to Unix newlines)
-        existing = ""
-        if path.exists():
-            existing = path.read_text(encoding="utf-8").replace("\r\n", "\n").replace("\r", "\n")
-        # Ensure file ends with single newline for consistent processing
-        if existing and not existing.endswith("\n"):
-            existing += "\n"
-
-        # Work with list of lines for insertion
-        doc_lines = existing.split("\n") if existing else []
-        # Remove a possible trailing empty string from split if file ended with newline
-        if doc_lines and doc_lines[-1] == "":
-            doc_lines.pop()
-
-        # Find today's heading
-        try:
-            heading_idx = next(i for i, ln in enumerate(doc_lines) if ln.strip() == heading)
-            heading_exists = True
-        except StopIteration:
-            heading_exists = False
-            heading_idx = None
-
-        # If heading is missing, insert it in chronological order (ascending)
-        if not heading_exists:
-            # Find the correct position to insert the date to maintain ascending order
-            insert_pos = _find_date_insertion_position(doc_lines, date_for_heading)
-
-            # Prepare the heading lines to insert
-            heading_lines = []
-            # Add blank line before heading if needed
-            if insert_pos > 0 and doc_lines and insert_pos <= len(doc_lines):
-                if insert_pos < len(doc_lines) and doc_lines[insert_pos - 1].strip() != "":
-                    heading_lines.append("")
-            heading_lines.append(heading)
-            heading_lines.append("")  # blank line after heading
-
-            # Insert the heading at the correct position
-            doc_lines[insert_pos:insert_pos] = heading_lines
-            # After inserting, recalculate heading index
-
-        # Determine insertion index: after the heading and any existing content of that section,
-        # which we define as lines until the next heading (line starting with '#').
-        # Recompute heading index to be robust
-        heading_idx = next((i for i, ln in enumerate(doc_lines) if ln.strip() == heading), None)
-        if heading_idx is None:
-            # Fallback: append heading at end if somehow missing
-            if doc_lines and doc_lines[-1].strip() != "":
-                doc_lines.append("")
-            doc_lines.append(heading)
-            doc_lines.append("")
-            heading_idx = len(doc_lines) - 2  # index of heading line
-            heading_exists = False
-
-        # Find next heading after current section
-        next_heading_idx = None
-        for i in range(heading_idx + 1, len(doc_lines)):
-            if doc_lines[i].lstrip().startswith("#") and doc_lines[i].strip() != "":
-                next_heading_idx = i
-                break
-
-        # Build the new section content to insert
-        insert_block = []
-        # Ensure there is a blank line after heading if the next line isn't blank
-        # and we're inserting directly
-        after_heading_idx = heading_idx + 1
-        if after_heading_idx >= len(doc_lines) or doc_lines[after_heading_idx].strip() != "":
-            insert_block.append("")
-        insert_block.extend(block_lines)
-
-        # If there will be another heading after, ensure there is a blank line before it
-        if next_heading_idx is not None:
-            insert_block.append("")
-
-        # Compute insertion position
-        insert_pos = next_heading_idx if next_heading_idx is not None else len(doc_lines)
-
-        # Determine the 1-based line numbers for the bullets we will insert
-        # First, compute where within insert_block the bullets start
-        bullets_offset_in_block = 1 if (len(insert_block) > 0 and insert_block[0] == "") else 0
-        bullet_line_numbers = []
-        # The final line number for a given inserted line at block index k is (insert_pos + k) + 1
-        for idx in range(len(block_lines)):
-            k = bullets_offset_in_block + idx
-            bullet_line_numbers.append(insert_pos + k + 1)
-
-        # If we created the heading in this call, compute its 1-based line number
-        # in the final document
-        heading_added = not heading_exists
-        heading_line_number = None
-        if heading_added:
-            # Heading line is at heading_idx (recomputed above) in doc_lines
-            # BEFORE inserting insert_block
-            # Since we haven't yet inserted insert_block, its final 1-based line
-            # number is heading_idx + 1
-            heading_line_number = heading_idx + 1
-
-        # Insert bullets block
-        doc_lines[insert_pos:insert_pos] = insert_block
-
-        # Reconstruct content with Unix newlines and ensure file ends with newline
-        new_content = "".join(line + "\n" for line in doc_lines)
-        if not new_content.endswith("\n"):
-            new_content += "\n"
-
-        path.write_text(new_content, encoding="utf-8")
+        probe = _append_to_last_section(path, heading, block_lines)
+        if probe is not None:
+            # Fast path: today's section was already the last one, so the bullets went at
+            # the end of the file and nothing before them needed parsing or rewriting
+            line_count, blank_needed = probe
+            first_bullet_line = line_count + (2 if blank_needed else 1)
+            bullet_line_numbers = list(
+                range(first_bullet_line, first_bullet_line + len(block_lines))
+            )
+            heading_added = False
+            heading_line_number = None
+        else:
+            doc_lines, canonical = _read_doc_lines(path)
+            original_line_count = len(doc_lines)
+            # Index of the first line that is new in this call; everything before it is unchanged
+            first_changed_idx = original_line_count
+
+            # Find today's heading and the next heading after it in a single pass
+            heading_idx, next_heading_idx = _find_heading_span(doc_lines, heading)
+            heading_exists = heading_idx is not None
+
+            # If heading is missing, insert it in chronological order (ascending)
+            if heading_idx is None:
+                # Find the correct position to insert the date to maintain ascending order
+                insert_pos = _find_date_insertion_position(doc_lines, date_for_heading)
+
+                # Prepare the heading lines to insert
+                heading_lines = []
+                # Add blank line before heading if needed
+                if insert_pos > 0 and doc_lines and insert_pos <= len(doc_lines):
+                    if insert_pos < len(doc_lines) and doc_lines[insert_pos - 1].strip() != "":
+                        heading_lines.append("")
+                heading_lines.append(heading)
+                heading_lines.append("")  # blank line after heading
+
+                # Insert the heading at the correct position; its index is known exactly,
+                # so only the lines after it need scanning for the next heading
+                doc_lines[insert_pos:insert_pos] = heading_lines
+                first_changed_idx = insert_pos
+                heading_idx = insert_pos + len(heading_lines) - 2
+                next_heading_idx = _find_next_heading(doc_lines, heading_idx + 1)
+
+            # Build the new section content to insert
+            insert_block = []
+            # Ensure there is a blank line after heading if the next line isn't blank
+            # and we're inserting directly
+            after_heading_idx = heading_idx + 1
+            if after_heading_idx >= len(doc_lines) or doc_lines[after_heading_idx].strip() != "":
+                insert_block.append("")
+            insert_block.extend(block_lines)
+
+            # If there will be another heading after, ensure there is a blank line before it
+            if next_heading_idx is not None:
+                insert_block.append("")
+
+            # Compute insertion position
+            insert_pos = next_heading_idx if next_heading_idx is not None else len(doc_lines)
+
+            # Determine the 1-based line numbers for the bullets we will insert
+            # First, compute where within insert_block the bullets start
+            bullets_offset_in_block = 1 if (len(insert_block) > 0 and insert_block[0] == "") else 0
+            bullet_line_numbers = []
+            # The final line number for the inserted line at block index k is (insert_pos + k) + 1
+            for idx in range(len(block_lines)):
+                k = bullets_offset_in_block + idx
+                bullet_line_numbers.append(insert_pos + k + 1)
+
+            # If we created the heading in this call, compute its 1-based line number
+            # in the final document
+            heading_added = not heading_exists
+            heading_line_number = None
+            if heading_added:
+                # Heading line is at heading_idx (recomputed above) in doc_lines
+                # BEFORE inserting insert_block
+                # Since we haven't yet inserted insert_block, its final 1-based line
+                # number is heading_idx + 1
+                heading_line_number = heading_idx + 1
+
+            if (
+                canonical
+                and first_changed_idx == original_line_count
+                and insert_pos == len(doc_lines)
+            ):
+                # Every new line lands after the existing content (e.g. a new latest date
+                # heading), so append those lines instead of rewriting the file
+                _append_doc_lines(
+                    path, chain(islice(doc_lines, original_line_count, None), insert_block)
+                )
+            else:
+                # Write the document with the bullets block spliced in at insert_pos; streaming
+                # the prefix, block and suffix avoids shifting every later line and joining
+                # the whole file
+                _write_doc_lines(
+                    path,
+                    chain(
+                        islice(doc_lines, insert_pos),
+                        insert_block,
+                        islice(doc_lines, insert_pos, None),
+                    ),
+                )
 
         success_response: MarkdownSuccessResponse = {
             "ok": True,
@@ -90,7 +90,7 @@ from . import (  # noqa: E402
 )
 
 # Import storage tools (commit-conversation links) to register their MCP tools
-from .storage import links as _storage_links  # noqa: E402, F401
+from .storage import close_all, links as _storage_links  # noqa: E402, F401
 
 
 def _truthy(val: str | None) -> bool:
@@ -159,6 +159,17 @@ def _configure_logging_from_env() -> None:
             pass
 
 
+def _configure_git_env() -> None:
+    """Default git child processes of the server to skipping optional locks.
+
+    The tools only read repositories. GIT_OPTIONAL_LOCKS=0 (the environment form of
+    ``git --no-optional-locks``) stops commands like ``git status`` from taking
+    ``index.lock`` to refresh the index, so they neither wait on nor block a user's
+    concurrent git operations. An explicit value in the environment is left alone.
+    """
+    os.environ.setdefault("GIT_OPTIONAL_LOCKS", "0")
+
+
 def run(argv: list[str] | None = None) -> None:
     """
     Run the MCP server.
@@ -168,9 +179,14 @@ def run(argv: list[str] | None = None) -> None:
     """
     # Configure server-side logging if requested by environment
     _configure_logging_from_env()
+    _configure_git_env()
 
     args = argv if argv is not None else sys.argv
-    if "--transport" in args and "http" in args:
-        mcp.run(transport="http", port=8000)
-    else:
-        mcp.run()
+    try:
+        if "--transport" in args and "http" in args:
+            mcp.run(transport="http", port=8000)
+        else:
+            mcp.run()
+    finally:
+        # Optimize and close cached SQLite connections, including those of worker threads
+        close_all()
@@ -6,11 +6,12 @@ These prompts do not call any LLMs. They return message sequences
 that a client LLM can use to produce summaries and reports.
 
 Clients can discover these with `list_prompts()` and render with
-`get_prompt(name, args)` when using a FastMCP client.
+`get_prompt(name, args)` when using a FastMCP client. The `batch_render_prompts`
+tool renders several prompts in a single round-trip.
 """
 
 from datetime import date as _date
-from typing import Annotated, TypedDict
+from typing import Annotated, Any, NotRequired, TypedDict
 
 from fastmcp.utilities.logging import get_logger  # type: ignore
 from pydantic import Field
@@ -27,6 +28,25 @@ class PromptArg(TypedDict):
     required: bool
 
 
+class PromptRenderRequest(TypedDict):
+    name: str
+    args: NotRequired[dict[str, Any]]
+
+
+class PromptRenderError(TypedDict):
+    name: str
+    error: str
+
+
+def _nonempty(value: str | None) -> bool:
+    """Return True when ``value`` has any non-whitespace character.
+
+    ``str.isspace`` stops at the first non-whitespace character, so this avoids
+    allocating a stripped copy of potentially large arguments just to test emptiness.
+    """
+    return bool(value) and not value.isspace()
+
+
 def _system_header(title: str) -> str:
     return (
         "You are a precise, transparent technical writing assistant. "
@@ -39,6 +59,158 @@ def _system_header(title: str) -> str:
     )
 
 
+# Static prompt text is assembled once at import; renders only splice in the
+# per-call values (period, resolved markdown path, summary parameters).
+_WORKLOG_SYSTEM = _system_header("Create an engineering worklog entry from commits and notes")
+
+_WORKLOG_WORKFLOW = (
+    "If you can call MCP tools, follow this workflow:\n\n"
+    "STEP 1 — Get tracked repositories configuration:\n"
+    "- First, call 'get_tracked_repositories_config' to retrieve the list of repositories to include in the worklog.\n"
+    "- The tool returns: tracked_repositories (list), count, and source (environment variable or config file).\n"
+    "- If the count is 0 (no tracked repositories configured), fall back to the current directory as the single repository to process.\n\n"
+    "STEP 2 — Iteratively gather data for each repository:\n"
+    "- For each repository R in the tracked_repositories list (or current directory if empty):\n"
+    "  • If R is a local filesystem path that contains a Git repository:\n"
+    "    - Call git MCP tools with 'workdir' parameter set to R (e.g., 'get_commits_by_date', 'get_recent_commits', 'get_branch_commits', 'get_commit_files', 'get_commit_diff', 'get_remote_origin').\n"
+    "    - Gather: commits via 'get_commits_by_date'; enriched stats via 'get_enriched_commits' (additions/deletions, files changed) when available.\n"
+    "    - To generate commit links: call 'get_remote_origin' with workdir=R, then 'determine_commit_url_prefix' with the returned URL.\n"
+    "  • If R is a remote identifier (e.g., 'owner/repo' GitHub shorthand or a Git URL):\n"
+    "    - Use the GitHub MCP or the GitHub CLI to fetch commits and related activity for that repository.\n"
+    "    - Extract owner/repo from the identifier and query GitHub APIs accordingly.\n"
+    "  • For each repository, use the Github MCP, falling back to the GitHub CLI, to fetch PR and Issues details (PRs or issues authored by the user, PRs reviewed by the user, or comments on PRs or issues left by the user) for the specified period.\n"
+    "  • Collect data for the specified period across all repositories before proceeding to synthesis.\n\n"
+    "STEP 3 — Gather additional context:\n"
+    "- Recent conversations via 'get_recent_conversations'.\n"
+    "When calling tools that accept a 'workdir' parameter, always include 'workdir' pointing to a path inside the target repository so commands execute in the correct repo.\n"
+    "Correlate commits with conversations as follows: For each commit, try to identify related conversations by matching keywords, issue keys, or PR numbers present in the commit message to conversation titles/previews. When you have high confidence, include the related conversation title next to the commit summary (e.g., 'Implements: <Conversation Title>'). Optionally record the association by calling 'link_commit_to_conversation' with a relevance score between 0.5 and 1.0.\n"
+    "Then, scan the commits for merge commits that reference pull requests (patterns like "
+    "'Merge pull request #123' or '#123' in the message). When PR numbers are found and the GitHub MCP is available, "
+    "use the GitHub Pull Requests toolset (falling back to the GitHub CLI) to retrieve details for those PRs (at minimum: title, number, HTML URL, author, "
+    "state — open/closed/merged — and merge date/mergedBy). Include a one-line PR summary with the merge item. If the toolset "
+    "is not available, include the PR numbers as-is.\n"
+    "Additionally, for each merge commit, attempt to determine the merged branch name (e.g., from messages like 'Merge branch <name>' or 'Merge pull request ... from <owner>/<branch>'). If a branch name is identified, call the 'get_commits_by_date' MCP tool again with the same since/until window and with branch set to that merged branch. Use the returned commits to add a brief sub-summary under the merge item highlighting what was brought in by that branch. If the branch cannot be determined, skip this step.\n"
+    "Next, use the GitHub MCP server to collect first-party activity for this period authored by the user: (1) issues opened, (2) PR comments, and (3) PR reviews. Determine the actor to filter by using the configured emails from 'get_tracked_emails' (map to GitHub login when possible) or fall back to the git author name/email. Apply the same since/until window when querying GitHub. Additionally, gather related context: issues referenced in PRs that the user created or reviewed, and reviews submitted by others on PRs created by the user.\n"
+    "- Issues: fetch issues created by the user in the window; also fetch any issues referenced in PRs that the user created or reviewed (even if those issues were opened by someone else). For each issue, include a one-line summary with number/title/state/url and explicitly indicate the creator (e.g., 'by <login>' or 'by you'). Correlate each issue to any local branches and PRs that reference the issue key/number in branch names, commit messages, or PR titles. Add a 'Correlated PR/branch' sub-bullet when found.\n"
+    "- PR comments: fetch comments authored by the user in the window. If a comment is on a PR created by the same user, include it inline with that PR's work item while summarizing the PR's evolution. If a comment was made in reference to a review the user submitted, include it under the context of that review (see Reviews below).\n"
+    "- PR reviews: fetch submitted reviews by the user in the window (state, summary, decision). List these under Technical Work as discrete items with PR number/title/state/url. Also reflect their content in 'Key Decisions', 'Impact Assessment', and 'Learnings' where applicable.\n"
+    "- Reviews on your PRs (by others): for PRs authored by the user, fetch reviews submitted by other participants within the window (state/decision, reviewer, highlights). Include their feedback inline with the corresponding PR item and factor it into summaries and context (Key Decisions, Impact Assessment, Learnings).\n"
+    "To turn commit hashes into clickable links, determine the commit URL prefix by calling the "
+    "'determine_commit_url_prefix' tool. First call 'get_remote_origin' to get the repository URL, "
+    "then call 'determine_commit_url_prefix' with it. If the tool returns an error or an empty prefix, "
+    "leave hashes as plain text without links.\n"
+    "Finally, combine your structured sections with any notes below. Use ISO dates. If there are no commits, say so. Keep the writing concise and non-redundant.\n\n"
+    "IMPORTANT — Persisting the worklog:\n"
+    "- Group the final worklog content by each calendar date covered by the period.\n"
+    "- Sort dates ascending (earliest first).\n"
+    "- For each date D, produce a markdown block\n"
+    "Now, produce the final structured markdown yourself (do not call 'generate_rich_worklog'). Group content by each calendar date covered. For each date, include the following sections with the specified details:\n\n"
+    "### 🎯 Goals & Context\n"
+    "- Summarize top goals/objectives for the day inferred from conversations (titles + first user message excerpts) and the provided inputs.\n"
+    "- DO break down into multiple bullets if more than one goal/objective is present. Never comma-join multiple goals into a single bullet; always split them.\n"
+    "- Note constraints, blockers, or external events shaping the work.\n"
+    "- If no conversations exist, derive goals from commit themes and inputs.\n\n"
+    "### 💻 Technical Work\n"
+    "- deduplicated commit list with the same per-commit details and link to the commit.\n"
+    "- PRs reviewed by the user (if any)"
+    "- Never comma-join multiple work items into one bullet; one item per bullet.\n\n"
+    "### 📊 Metrics\n"
+    "- Total commits for the date.\n"
+    "- Additions and deletions (from enrichment) when available.\n"
+    "- Files touched and top languages by additions (top 3), plus the 'hot' file if provided by heatmap.\n"
+    "- PRs opened/merged and notable branch merges (counts).\n\n"
+    "- DO break down each metric into its own bullet. For example, 'Total commits' should be a bullet, not a header.\n\n"
+    "### 🔍 Key Decisions\n"
+    "- Bullet the important decisions made (from conversations and commit messages), with brief rationale and alternatives considered.\n"
+    "- Reference the related conversation title or PR when applicable.\n"
+    "- Split multiple decisions into separate bullets; never comma-join them into one bullet.\n\n"
+    "### ⚠️ Impact Assessment\n"
+    "- Describe the impact of changes on users, subsystems, APIs, and dependencies.\n"
+    "- Call out risks/regressions and suggested tests or mitigations.\n"
+    "- DO break down into multiple bullets if more than one impact category is present.\n"
+    "- Note performance implications and backward-compatibility considerations.\n\n"
+    "### 🚧 Open Items\n"
+    "- List follow-ups, TODOs, and blockers with owners (if known) and next steps.\n"
+    "- DO break down into multiple bullets if more than one open item category is present.\n"
+    "- Include due dates or milestones if present.\n\n"
+    "### 📚 Learnings\n"
+    "- Capture lessons, debugging insights, patterns, tools, and gotchas worth remembering.\n"
+    "- Split multiple learnings into separate bullets; never comma-join them into one bullet.\n\n"
+    "Guidance for deriving since/until from the period string:\n"
+    "- Single day 'YYYY-MM-DD' → since='YYYY-MM-DD', until='YYYY-MM-DD 23:59:59'.\n"
+    "- Range 'YYYY-MM-DD..YYYY-MM-DD' → since=start, until=end '23:59:59'.\n"
+    "- Relative periods (e.g., 'yesterday', 'last 2 days', '1 week ago') → since=expression, "
+    "until='now'.\n\n\n"
+    "After generating the above markdown content, then immediately call the 'append_to_markdown' MCP tool with:\n"
+    "  • date_str = D (ISO format YYYY-MM-DD)\n"
+    "  • content = the date-specific markdown block with h3 sub-headings and bullets\n"
+    "  • preserve_lines = true (so lines are written as-is without auto-bullets)\n"
+    "  • update_mode = true (IMPORTANT: merge with existing entry if present; do not create duplicates)\n"
+    "  • file_path can be omitted (defaults to SEEV_MD_PATH or ./WORKLOG.md).\n"
+)
+
+_WORKLOG_PERSIST_AND_WEEKLY = (
+    "- Make exactly one tool call per date with just that date's content. Do not batch multiple dates in one call.\n"
+    "- The update_mode flag ensures that if an entry for date D already exists, the new content will be intelligently merged with the existing sections rather than appended, preventing duplicates.\n\n"
+    "MERGE BEHAVIOR (when update_mode=true):\n"
+    "- If the target date already has an entry, the tool will:\n"
+    "  1. Read and parse the existing sections\n"
+    "  2. Merge your new content with existing content at the section level\n"
+    "  3. Deduplicate commits (by hash), bullets (by content similarity), and metrics (recalculated)\n"
+    "  4. Preserve all unique information from both old and new entries\n"
+    "- This allows you to run the worklog generation multiple times for the same date without creating duplicates.\n"
+    "- Existing content is preserved; only new information is added.\n\n"
+    "WEEKLY SUMMARY (Monday..Sunday):\n"
+    "- After persisting all date blocks for the requested period, determine whether a full Monday..Sunday window has just completed AND newer entries exist past the Sunday.\n"
+    "- Compute SUNDAY S as the most recent past Sunday relative to 'now' or the latest date written, and MONDAY M = S - 6 days.\n"
+)
+
+_WORKLOG_WEEKLY_TAIL = (
+    "If a file-read tool is available (e.g., filesystem.read_file, fs.read, or similar), use it to obtain the markdown contents; otherwise, you may rely on the content you just generated for dates in M..S.\n"
+    "- If the file contains any entry with a date > S (i.e., there is content after that Sunday), then create a weekly summary for M..S under date S.\n"
+    "- Idempotency: Before writing, check under '## S' for an existing line that starts with '### 🗓️ Weekly Summary' or contains '<!-- weekly-summary:' with the same M..S range; if present, do not duplicate.\n"
+    "- Synthesis: Aggregate across entries from M..S (scan their sections) and produce a concise weekly narrative. Use this structure:\n"
+    "  ### 🗓️ Weekly Summary (M..S)\n"
+    "  - Highlights: top 3–6 outcomes with links to key commits/PRs.\n"
+    "  - Metrics: totals (commits, PRs opened/merged, lines added/removed when available).\n"
+    "  - Decisions & Risks: pivotal decisions and noteworthy risks surfaced this week.\n"
+    "  - Learnings: 2–5 lessons worth remembering.\n"
+    "  - Next Week Focus: concrete priorities and first steps.\n"
+    "  <!-- weekly-summary:M..S -->\n"
+    "- Persist the weekly summary by calling 'append_to_markdown' once with:\n"
+    "  • date_str = S\n"
+    "  • content = the weekly summary block shown above (including the marker comment)\n"
+    "  • preserve_lines = true\n"
+    "- Make exactly one tool call per Sunday summary.\n\n"
+    "Edge cases:\n"
+    "- If a date has neither commits nor conversations, you may persist a single bullet line (e.g., '- No recorded commits or conversations (planning/research/offline work possible).') inside the '### Work' section.\n"
+    "- If Git tools are unavailable or return errors for the period, add a one-line 'Data unavailable' note and proceed with the remaining sources.\n"
+)
+
+_CONVERSATION_SUMMARY_SYSTEM = _system_header(
+    "Summarize a conversation and persist it via record_conversation_summary"
+)
+
+_CONVERSATION_SUMMARY_INTRO = (
+    "Create a concise summary for the conversation/task and then immediately persist it using the "
+    "'record_conversation_summary' tool. Follow this workflow:\n\n"
+    "1) Write the summary:\n"
+    "   - Keep it brief and concrete.\n"
+    "   - Prefer bullets; short paragraphs are fine.\n"
+    "   - Include concrete ISO dates when mentioned.\n"
+    "   - Emphasize goals, key decisions (with rationale), outcomes, blockers, and next steps.\n\n"
+    "2) Persist the summary by calling the tool with EXACTLY these parameters:\n"
+)
+
+_CONVERSATION_SUMMARY_RULES = (
+    "\nRules:\n"
+    "- Make exactly one tool call.\n"
+    "- If conversation_id is provided, ignore title derivation.\n"
+    "- If both conversation_id and title are null, derive the title as instructed.\n"
+    "- Do not include the tool call parameters in the summary text itself.\n"
+)
+
+
 @mcp.prompt(
     name="worklog_entry",
     description=(
@@ -77,7 +249,7 @@ async def worklog_entry_prompt(
 ) -> list[dict[str, str]]:
     # Be lenient: do not fail rendering when clients omit arguments while previewing.
     # Default to a reasonable period and allow empty inputs.
-    if not date or not date.strip():
+    if not _nonempty(date):
         log.warning("worklog_entry: empty date arg; defaulting to 'today'")
         date = "today"
     if inputs is None:
@@ -86,126 +258,15 @@ async def worklog_entry_prompt(
         "worklog_entry: rendering",
         extra={"date_len": len(date), "inputs_len": len(inputs)},
     )
-    system = _system_header("Create an engineering worklog entry from commits and notes")
+    system = _WORKLOG_SYSTEM
     md_path = get_markdown_path()
     user = (
         f"Create a worklog entry for the period: {date}. "
-        "If you can call MCP tools, follow this workflow:\n\n"
-        "STEP 1 — Get tracked repositories configuration:\n"
-        "- First, call 'get_tracked_repositories_config' to retrieve the list of repositories to include in the worklog.\n"
-        "- The tool returns: tracked_repositories (list), count, and source (environment variable or config file).\n"
-        "- If the count is 0 (no tracked repositories configured), fall back to the current directory as the single repository to process.\n\n"
-        "STEP 2 — Iteratively gather data for each repository:\n"
-        "- For each repository R in the tracked_repositories list (or current directory if empty):\n"
-        "  • If R is a local filesystem path that contains a Git repository:\n"
-        "    - Call git MCP tools with 'workdir' parameter set to R (e.g., 'get_commits_by_date', 'get_recent_commits', 'get_branch_commits', 'get_commit_files', 'get_commit_diff', 'get_remote_origin').\n"
-        "    - Gather: commits via 'get_commits_by_date'; enriched stats via 'get_enriched_commits' (additions/deletions, files changed) when available.\n"
-        "    - To generate commit links: call 'get_remote_origin' with workdir=R, then 'determine_commit_url_prefix' with the returned URL.\n"
-        "  • If R is a remote identifier (e.g., 'owner/repo' GitHub shorthand or a Git URL):\n"
-        "    - Use the GitHub MCP or the GitHub CLI to fetch commits and related activity for that repository.\n"
-        "    - Extract owner/repo from the identifier and query GitHub APIs accordingly.\n"
-        "  • For each repository, use the Github MCP, falling back to the GitHub CLI, to fetch PR and Issues details (PRs or issues authored by the user, PRs reviewed by the user, or comments on PRs or issues left by the user) for the specified period.\n"
-        "  • Collect data for the specified period across all repositories before proceeding to synthesis.\n\n"
-        "STEP 3 — Gather additional context:\n"
-        "- Recent conversations via 'get_recent_conversations'.\n"
-        "When calling tools that accept a 'workdir' parameter, always include 'workdir' pointing to a path inside the target repository so commands execute in the correct repo.\n"
-        "Correlate commits with conversations as follows: For each commit, try to identify related conversations by matching keywords, issue keys, or PR numbers present in the commit message to conversation titles/previews. When you have high confidence, include the related conversation title next to the commit summary (e.g., 'Implements: <Conversation Title>'). Optionally record the association by calling 'link_commit_to_conversation' with a relevance score between 0.5 and 1.0.\n"
-        "Then, scan the commits for merge commits that reference pull requests (patterns like "
-        "'Merge pull request #123' or '#123' in the message). When PR numbers are found and the GitHub MCP is available, "
-        "use the GitHub Pull Requests toolset (falling back to the GitHub CLI) to retrieve details for those PRs (at minimum: title, number, HTML URL, author, "
-        "state — open/closed/merged — and merge date/mergedBy). Include a one-line PR summary with the merge item. If the toolset "
-        "is not available, include the PR numbers as-is.\n"
-        "Additionally, for each merge commit, attempt to determine the merged branch name (e.g., from messages like 'Merge branch <name>' or 'Merge pull request ... from <owner>/<branch>'). If a branch name is identified, call the 'get_commits_by_date' MCP tool again with the same since/until window and with branch set to that merged branch. Use the returned commits to add a brief sub-summary under the merge item highlighting what was brought in by that branch. If the branch cannot be determined, skip this step.\n"
-        "Next, use the GitHub MCP server to collect first-party activity for this period authored by the user: (1) issues opened, (2) PR comments, and (3) PR reviews. Determine the actor to filter by using the configured emails from 'get_tracked_emails' (map to GitHub login when possible) or fall back to the git author name/email. Apply the same since/until window when querying GitHub. Additionally, gather related context: issues referenced in PRs that the user created or reviewed, and reviews submitted by others on PRs created by the user.\n"
-        "- Issues: fetch issues created by the user in the window; also fetch any issues referenced in PRs that the user created or reviewed (even if those issues were opened by someone else). For each issue, include a one-line summary with number/title/state/url and explicitly indicate the creator (e.g., 'by <login>' or 'by you'). Correlate each issue to any local branches and PRs that reference the issue key/number in branch names, commit messages, or PR titles. Add a 'Correlated PR/branch' sub-bullet when found.\n"
-        "- PR comments: fetch comments authored by the user in the window. If a comment is on a PR created by the same user, include it inline with that PR's work item while summarizing the PR's evolution. If a comment was made in reference to a review the user submitted, include it under the context of that review (see Reviews below).\n"
-        "- PR reviews: fetch submitted reviews by the user in the window (state, summary, decision). List these under Technical Work as discrete items with PR number/title/state/url. Also reflect their content in 'Key Decisions', 'Impact Assessment', and 'Learnings' where applicable.\n"
-        "- Reviews on your PRs (by others): for PRs authored by the user, fetch reviews submitted by other participants within the window (state/decision, reviewer, highlights). Include their feedback inline with the corresponding PR item and factor it into summaries and context (Key Decisions, Impact Assessment, Learnings).\n"
-        "To turn commit hashes into clickable links, determine the commit URL prefix by calling the "
-        "'determine_commit_url_prefix' tool. First call 'get_remote_origin' to get the repository URL, "
-        "then call 'determine_commit_url_prefix' with it. If the tool returns an error or an empty prefix, "
-        "leave hashes as plain text without links.\n"
-        "Finally, combine your structured sections with any notes below. Use ISO dates. If there are no commits, say so. Keep the writing concise and non-redundant.\n\n"
-        "IMPORTANT — Persisting the worklog:\n"
-        "- Group the final worklog content by each calendar date covered by the period.\n"
-        "- Sort dates ascending (earliest first).\n"
-        "- For each date D, produce a markdown block\n"
-        "Now, produce the final structured markdown yourself (do not call 'generate_rich_worklog'). Group content by each calendar date covered. For each date, include the following sections with the specified details:\n\n"
-        "### 🎯 Goals & Context\n"
-        "- Summarize top goals/objectives for the day inferred from conversations (titles + first user message excerpts) and the provided inputs.\n"
-        "- DO break down into multiple bullets if more than one goal/objective is present. Never comma-join multiple goals into a single bullet; always split them.\n"
-        "- Note constraints, blockers, or external events shaping the work.\n"
-        "- If no conversations exist, derive goals from commit themes and inputs.\n\n"
-        "### 💻 Technical Work\n"
-        "- deduplicated commit list with the same per-commit details and link to the commit.\n"
-        "- PRs reviewed by the user (if any)"
-        "- Never comma-join multiple work items into one bullet; one item per bullet.\n\n"
-        "### 📊 Metrics\n"
-        "- Total commits for the date.\n"
-        "- Additions and deletions (from enrichment) when available.\n"
-        "- Files touched and top languages by additions (top 3), plus the 'hot' file if provided by heatmap.\n"
-        "- PRs opened/merged and notable branch merges (counts).\n\n"
-        "- DO break down each metric into its own bullet. For example, 'Total commits' should be a bullet, not a header.\n\n"
-        "### 🔍 Key Decisions\n"
-        "- Bullet the important decisions made (from conversations and commit messages), with brief rationale and alternatives considered.\n"
-        "- Reference the related conversation title or PR when applicable.\n"
-        "- Split multiple decisions into separate bullets; never comma-join them into one bullet.\n\n"
-        "### ⚠️ Impact Assessment\n"
-        "- Describe the impact of changes on users, subsystems, APIs, and dependencies.\n"
-        "- Call out risks/regressions and suggested tests or mitigations.\n"
-        "- DO break down into multiple bullets if more than one impact category is present.\n"
-        "- Note performance implications and backward-compatibility considerations.\n\n"
-        "### 🚧 Open Items\n"
-        "- List follow-ups, TODOs, and blockers with owners (if known) and next steps.\n"
-        "- DO break down into multiple bullets if more than one open item category is present.\n"
-        "- Include due dates or milestones if present.\n\n"
-        "### 📚 Learnings\n"
-        "- Capture lessons, debugging insights, patterns, tools, and gotchas worth remembering.\n"
-        "- Split multiple learnings into separate bullets; never comma-join them into one bullet.\n\n"
-        "Guidance for deriving since/until from the period string:\n"
-        "- Single day 'YYYY-MM-DD' → since='YYYY-MM-DD', until='YYYY-MM-DD 23:59:59'.\n"
-        "- Range 'YYYY-MM-DD..YYYY-MM-DD' → since=start, until=end '23:59:59'.\n"
-        "- Relative periods (e.g., 'yesterday', 'last 2 days', '1 week ago') → since=expression, "
-        "until='now'.\n\n\n"
-        "After generating the above markdown content, then immediately call the 'append_to_markdown' MCP tool with:\n"
-        "  • date_str = D (ISO format YYYY-MM-DD)\n"
-        "  • content = the date-specific markdown block with h3 sub-headings and bullets\n"
-        "  • preserve_lines = true (so lines are written as-is without auto-bullets)\n"
-        "  • update_mode = true (IMPORTANT: merge with existing entry if present; do not create duplicates)\n"
-        "  • file_path can be omitted (defaults to SEEV_MD_PATH or ./WORKLOG.md).\n"
+        f"{_WORKLOG_WORKFLOW}"
         f"  • Target worklog file path resolved now: {md_path}.\n"
-        "- Make exactly one tool call per date with just that date's content. Do not batch multiple dates in one call.\n"
-        "- The update_mode flag ensures that if an entry for date D already exists, the new content will be intelligently merged with the existing sections rather than appended, preventing duplicates.\n\n"
-        "MERGE BEHAVIOR (when update_mode=true):\n"
-        "- If the target date already has an entry, the tool will:\n"
-        "  1. Read and parse the existing sections\n"
-        "  2. Merge your new content with existing content at the section level\n"
-        "  3. Deduplicate commits (by hash), bullets (by content similarity), and metrics (recalculated)\n"
-        "  4. Preserve all unique information from both old and new entries\n"
-        "- This allows you to run the worklog generation multiple times for the same date without creating duplicates.\n"
-        "- Existing content is preserved; only new information is added.\n\n"
-        "WEEKLY SUMMARY (Monday..Sunday):\n"
-        "- After persisting all date blocks for the requested period, determine whether a full Monday..Sunday window has just completed AND newer entries exist past the Sunday.\n"
-        "- Compute SUNDAY S as the most recent past Sunday relative to 'now' or the latest date written, and MONDAY M = S - 6 days.\n"
-        f"- Read the target worklog file at: {md_path}. If a file-read tool is available (e.g., filesystem.read_file, fs.read, or similar), use it to obtain the markdown contents; otherwise, you may rely on the content you just generated for dates in M..S.\n"
-        "- If the file contains any entry with a date > S (i.e., there is content after that Sunday), then create a weekly summary for M..S under date S.\n"
-        "- Idempotency: Before writing, check under '## S' for an existing line that starts with '### 🗓️ Weekly Summary' or contains '<!-- weekly-summary:' with the same M..S range; if present, do not duplicate.\n"
-        "- Synthesis: Aggregate across entries from M..S (scan their sections) and produce a concise weekly narrative. Use this structure:\n"
-        "  ### 🗓️ Weekly Summary (M..S)\n"
-        "  - Highlights: top 3–6 outcomes with links to key commits/PRs.\n"
-        "  - Metrics: totals (commits, PRs opened/merged, lines added/removed when available).\n"
-        "  - Decisions & Risks: pivotal decisions and noteworthy risks surfaced this week.\n"
-        "  - Learnings: 2–5 lessons worth remembering.\n"
-        "  - Next Week Focus: concrete priorities and first steps.\n"
-        "  <!-- weekly-summary:M..S -->\n"
-        "- Persist the weekly summary by calling 'append_to_markdown' once with:\n"
-        "  • date_str = S\n"
-        "  • content = the weekly summary block shown above (including the marker comment)\n"
-        "  • preserve_lines = true\n"
-        "- Make exactly one tool call per Sunday summary.\n\n"
-        "Edge cases:\n"
-        "- If a date has neither commits nor conversations, you may persist a single bullet line (e.g., '- No recorded commits or conversations (planning/research/offline work possible).') inside the '### Work' section.\n"
-        "- If Git tools are unavailable or return errors for the period, add a one-line 'Data unavailable' note and proceed with the remaining sources.\n"
+        f"{_WORKLOG_PERSIST_AND_WEEKLY}"
+        f"- Read the target worklog file at: {md_path}. "
+        f"{_WORKLOG_WEEKLY_TAIL}"
     )
     if inputs:
         user += f"\n\n<INPUTS>\n{inputs}\n</INPUTS>"
@@ -267,7 +328,7 @@ async def conversation_summary_prompt(
     if inputs is None:
         inputs = ""
     # Resolve default date on the server so the LLM doesn't have to guess today's date
-    resolved_date = (date or "").strip() or _date.today().isoformat()
+    resolved_date = date.strip() if _nonempty(date) else _date.today().isoformat()
     log.info(
         "conversation_summary: rendering",
         extra={
@@ -277,20 +338,11 @@ async def conversation_summary_prompt(
             "inputs_len": len(inputs),
         },
     )
-    system = _system_header(
-        "Summarize a conversation and persist it via record_conversation_summary"
-    )
+    system = _CONVERSATION_SUMMARY_SYSTEM
     # Provide explicit call contract so tool-using LLMs behave deterministically
     user = (
-        "Create a concise summary for the conversation/task and then immediately persist it using the "
-        "'record_conversation_summary' tool. Follow this workflow:\n\n"
-        "1) Write the summary:\n"
-        "   - Keep it brief and concrete.\n"
-        "   - Prefer bullets; short paragraphs are fine.\n"
-        "   - Include concrete ISO dates when mentioned.\n"
-        "   - Emphasize goals, key decisions (with rationale), outcomes, blockers, and next steps.\n\n"
-        "2) Persist the summary by calling the tool with EXACTLY these parameters:\n"
-        f"   • date = {resolved_date} (ISO YYYY-MM-DD; resolved by the server)\n"
+        _CONVERSATION_SUMMARY_INTRO
+        + f"   • date = {resolved_date} (ISO YYYY-MM-DD; resolved by the server)\n"
         "   • summary = the text you just wrote (do not wrap in code fences)\n"
         f"   • conversation_id = {conversation_id if conversation_id is not None else 'null'}\n"
         + (
@@ -298,11 +350,7 @@ async def conversation_summary_prompt(
             if title
             else "   • title = null (if conversation_id is null, generate a short title summarizing the conversation; <= 80 chars, no newlines)\n"
         )
-        + "\nRules:\n"
-        "- Make exactly one tool call.\n"
-        "- If conversation_id is provided, ignore title derivation.\n"
-        "- If both conversation_id and title are null, derive the title as instructed.\n"
-        "- Do not include the tool call parameters in the summary text itself.\n"
+        + _CONVERSATION_SUMMARY_RULES
     )
     if inputs:
         user += f"\n\n<INPUTS>\n{inputs}\n</INPUTS>"
@@ -312,3 +360,43 @@ async def conversation_summary_prompt(
     ]
     log.info("conversation_summary: rendered", extra={"messages": len(msgs)})
     return msgs
+
+
+async def render_prompts(
+    requests: list[PromptRenderRequest],
+) -> list[list[dict[str, str]] | PromptRenderError]:
+    """Render several registered prompts in order and return their message lists.
+
+    Each request names a prompt registered on the shared MCP instance and supplies its
+    keyword arguments. Unknown names or invalid arguments yield a ``PromptRenderError``
+    entry in that position instead of failing the whole batch.
+    """
+    renderers = {p.get("name"): p.get("func") for p in getattr(mcp, "_prompts", [])}
+    results: list[list[dict[str, str]] | PromptRenderError] = []
+    for req in requests:
+        name = str(req.get("name") or "")
+        fn = renderers.get(name)
+        if fn is None:
+            results.append({"name": name, "error": f"Unknown prompt: {name}"})
+            continue
+        try:
+            results.append(await fn(**(req.get("args") or {})))
+        except Exception as e:  # noqa: BLE001
+            log.warning("batch_render_prompts: %s failed: %s", name, e)
+            results.append({"name": name, "error": f"Failed to render prompt: {e}"})
+    return results
+
+
+@mcp.tool(
+    name="batch_render_prompts",
+    description=(
+        "Render several server prompts in one call. Pass a list of {name, args} objects, where "
+        "name is a registered prompt (e.g., 'worklog_entry', 'conversation_summary') and args "
+        "are its arguments. Returns one message list per request, or an {name, error} object "
+        "for requests that could not be rendered."
+    ),
+)
+async def _tool_batch_render_prompts(
+    requests: list[PromptRenderRequest],
+) -> list[list[dict[str, str]] | PromptRenderError]:  # pragma: no cover
+    return await render_prompts(requests)
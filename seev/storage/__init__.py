@@ -6,6 +6,8 @@ Public API exports minimal helpers and TypedDicts.
 from .db import (
     DBStatus,
     DBTableCount,
+    close_all,
+    close_connection,
     create_backup,
     get_connection,
     get_db_status,
@@ -22,6 +24,8 @@ __all__ = [
     "init_db",
     "migrate",
     "get_connection",
+    "close_all",
+    "close_connection",
     "create_backup",
     "get_db_status",
     "DBStatus",
@@ -0,0 +1,183 @@
+"""
+Background writer that batches auto-written commits into shared transactions.
+
+With ``SEEV_DB_AUTOWRITE`` on, every git query hands its commits to storage. Writing
+each result on its own costs one SQLite transaction per query and makes bursts of tool
+calls queue up behind each other's commits. Results are instead queued here and a
+single writer thread upserts whatever has arrived within a short window (or once
+enough commits are pending) in one ``bulk_upsert_commits`` call per database.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+from . import commits as _commits, db as _db
+from .types import CommitInput
+
+logger = logging.getLogger("seev.storage.commit_writer")
+
+FLUSH_INTERVAL_SECONDS = 0.1
+FLUSH_THRESHOLD = 500
+MAX_PENDING_BATCHES = 1024
+
+_STOP = object()
+
+# Called with the SHAs of a batch that could not be written
+FailureHook = Callable[[list[str]], None]
+_Pending = dict[str | None, dict[str, CommitInput]]
+_Hooks = dict[str | None, list[FailureHook]]
+
+
+class CommitWriter:
+    """Queue of pending commit batches drained by one daemon thread.
+
+    The thread starts on the first ``put``. Each tick collects batches for up to
+    ``flush_interval`` seconds (or until ``flush_threshold`` commits are pending),
+    keeps the last version of each SHA, and writes every database's commits in one
+    transaction. Write errors are logged and dropped, as auto-writes are best effort;
+    the ``on_failure`` hooks queued with a database's commits are told which SHAs were
+    dropped, so their callers can queue them again later. The thread closes its SQLite
+    connections when it stops.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        flush_threshold: int = FLUSH_THRESHOLD,
+        max_pending: int = MAX_PENDING_BATCHES,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="seev-commit-writer", daemon=True
+                )
+                self._thread.start()
+
+    def put(
+        self,
+        commits: Iterable[CommitInput],
+        db_path: str | None = None,
+        on_failure: FailureHook | None = None,
+    ) -> None:
+        """Queue ``commits`` for the next tick; write them inline if the queue is full."""
+        batch = list(commits)
+        if not batch:
+            return
+        self._ensure_thread()
+        item = (db_path, batch, on_failure)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # Back-pressure: the writer is behind, so this caller pays for its own write
+            pending: _Pending = {}
+            hooks: _Hooks = {}
+            self._add(pending, hooks, item)
+            self._write(pending, hooks)
+
+    def flush(self) -> None:
+        """Block until every batch queued so far has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write what is pending and stop the thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout=5)
+
+    def _run(self) -> None:
+        try:
+            self._drain()
+        finally:
+            # The thread's cached connections would otherwise outlive it unclosed
+            _db._close_thread_connections()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            taken = 1
+            stop = item is _STOP
+            pending: _Pending = {}
+            hooks: _Hooks = {}
+            size = 0
+            if not stop:
+                size += self._add(pending, hooks, item)
+                deadline = time.monotonic() + self.flush_interval
+                while size < self.flush_threshold:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if item is _STOP:
+                        stop = True
+                        break
+                    size += self._add(pending, hooks, item)
+            self._write(pending, hooks)
+            for _ in range(taken):
+                self._queue.task_done()
+            if stop:
+                return
+
+    @staticmethod
+    def _add(pending: _Pending, hooks: _Hooks, item: tuple) -> int:
+        db_path, batch, on_failure = item
+        if on_failure is not None:
+            hooks.setdefault(db_path, []).append(on_failure)
+        by_sha = pending.setdefault(db_path, {})
+        for c in batch:
+            # Later results win, as they would with one upsert per query
+            by_sha.pop(c["sha"], None)
+            by_sha[c["sha"]] = c
+        return len(batch)
+
+    @staticmethod
+    def _write(pending: _Pending, hooks: _Hooks) -> None:
+        for db_path, by_sha in pending.items():
+            try:
+                _commits.bulk_upsert_commits(by_sha.values(), db_path=db_path)
+            except Exception as e:  # noqa: BLE001
+                logger.debug("dropping %d auto-written commits: %s", len(by_sha), e)
+                for on_failure in hooks.get(db_path, ()):
+                    try:
+                        on_failure(list(by_sha))
+                    except Exception:  # noqa: BLE001
+                        logger.debug("auto-write failure hook raised", exc_info=True)
+
+
+_WRITER = CommitWriter()
+atexit.register(_WRITER.close)
+
+
+def enqueue_commits(
+    commits: Iterable[CommitInput],
+    db_path: str | None = None,
+    on_failure: FailureHook | None = None,
+) -> None:
+    """Queue commits for the process-wide background writer.
+
+    ``on_failure`` is called (on the writer thread) with the SHAs of the batch if it
+    cannot be written.
+    """
+    _WRITER.put(commits, db_path, on_failure)
+
+
+def flush_commit_writes() -> None:
+    """Wait until the process-wide writer has written everything queued so far."""
+    _WRITER.flush()
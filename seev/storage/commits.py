@@ -1,6 +1,6 @@
 from collections.abc import Iterable, Sequence
 
-from .db import get_connection
+from .db import _executemany_batched, get_connection
 from .types import (
     CommitFileChange,
     CommitInput,
@@ -11,6 +11,80 @@ from .types import (
     InfoResponse,
 )
 
+# SQL statements are module-level constants so every call passes the same string object
+# and sqlite3's per-connection statement cache reuses the compiled statement.
+
+_UPSERT_COMMIT_SQL = """
+INSERT INTO commits (
+    sha, author_email, author_name, author_date, message,
+    insertions, deletions, files_changed
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(sha) DO UPDATE SET
+    author_email=excluded.author_email,
+    author_name=excluded.author_name,
+    author_date=excluded.author_date,
+    message=excluded.message,
+    insertions=excluded.insertions,
+    deletions=excluded.deletions,
+    files_changed=excluded.files_changed
+"""
+
+# The no-op DO UPDATE makes RETURNING yield the existing row's id on conflict,
+# so both the insert and the already-present paths take a single statement.
+_INSERT_IGNORE_COMMIT_SQL = """
+INSERT INTO commits (
+    sha, author_email, author_name, author_date, message,
+    insertions, deletions, files_changed
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(sha) DO UPDATE SET sha=commits.sha
+RETURNING id
+"""
+
+_INSERT_COMMITS_MANY_SQL = """
+INSERT INTO commits (
+    sha, author_email, author_name, author_date, message,
+    insertions, deletions, files_changed
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(sha) DO NOTHING
+"""
+
+_UPSERT_FILE_SQL = """
+INSERT INTO commit_files (commit_id, file_path, status, additions, deletions)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(commit_id, file_path) DO UPDATE SET
+    status=excluded.status,
+    additions=excluded.additions,
+    deletions=excluded.deletions
+"""
+
+_INSERT_FILES_MANY_SQL = """
+INSERT INTO commit_files (commit_id, file_path, status, additions, deletions)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(commit_id, file_path) DO NOTHING
+"""
+
+_SELECT_COMMIT_ID_SQL = "SELECT id FROM commits WHERE sha = ?"
+
+_SELECT_COMMIT_SQL = "SELECT * FROM commits WHERE sha = ?"
+
+_QUERY_COMMITS_BASE_SQL = (
+    "SELECT sha AS hash, COALESCE(author_name, author_email) AS author, "
+    "author_date AS date, message FROM commits WHERE 1=1"
+)
+
+_AUTHOR_MATCH_SQL = "(author_email LIKE ? OR author_name LIKE ?)"
+
+_LIST_COMMITS_SQL = """
+SELECT sha,
+       COALESCE(author_name, author_email) AS author,
+       author_date AS date,
+       substr(message, 1, instr(message || '\n', '\n') - 1) AS title,
+       insertions, deletions, files_changed AS files
+FROM commits
+ORDER BY author_date DESC
+LIMIT ?
+"""
+
 
 def upsert_commit(
     commit: CommitInput,
@@ -23,40 +97,10 @@ def upsert_commit(
     Returns the commit row id.
     """
 
-    # Fill defaults
-    insertions = int(commit.get("insertions", 0) or 0)
-    deletions = int(commit.get("deletions", 0) or 0)
-    files_changed = int(commit.get("files_changed", 0) or 0)
-
     with get_connection(db_path) as conn:
-        cur = conn.execute(
-            """
-            INSERT INTO commits (
-                sha, author_email, author_name, author_date, message,
-                insertions, deletions, files_changed
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(sha) DO UPDATE SET
-                author_email=excluded.author_email,
-                author_name=excluded.author_name,
-                author_date=excluded.author_date,
-                message=excluded.message,
-                insertions=excluded.insertions,
-                deletions=excluded.deletions,
-                files_changed=excluded.files_changed
-            """,
-            (
-                commit["sha"],
-                commit.get("author_email", ""),
-                commit.get("author_name", ""),
-                commit["author_date"],
-                commit.get("message", ""),
-                insertions,
-                deletions,
-                files_changed,
-            ),
-        )
+        cur = conn.execute(_UPSERT_COMMIT_SQL, _commit_row(commit))
         # Retrieve id
-        row = conn.execute("SELECT id FROM commits WHERE sha = ?", (commit["sha"],)).fetchone()
+        row = conn.execute(_SELECT_COMMIT_ID_SQL, (commit["sha"],)).fetchone()
         commit_id = int(row[0]) if row else int(cur.lastrowid)
 
         # Upsert file changes if provided
@@ -78,48 +122,62 @@ def bulk_upsert_commits(
     """
 
     count = 0
+    # Commits without files need no id lookup, so runs of them go through executemany;
+    # a run is flushed before the next commit with files to keep the upserts in order.
+    plain: list[tuple[object, ...]] = []
     with get_connection(db_path) as conn:
         for c in commits:
             files = c.get("files") if isinstance(c, dict) else None  # type: ignore[assignment]
-            insertions = int(c.get("insertions", 0) or 0)
-            deletions = int(c.get("deletions", 0) or 0)
-            files_changed = int(c.get("files_changed", 0) or 0)
-            conn.execute(
-                """
-                INSERT INTO commits (
-                    sha, author_email, author_name, author_date, message,
-                    insertions, deletions, files_changed
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(sha) DO UPDATE SET
-                    author_email=excluded.author_email,
-                    author_name=excluded.author_name,
-                    author_date=excluded.author_date,
-                    message=excluded.message,
-                    insertions=excluded.insertions,
-                    deletions=excluded.deletions,
-                    files_changed=excluded.files_changed
-                """,
-                (
-                    c["sha"],
-                    c.get("author_email", ""),
-                    c.get("author_name", ""),
-                    c["author_date"],
-                    c.get("message", ""),
-                    insertions,
-                    deletions,
-                    files_changed,
-                ),
-            )
-            row = conn.execute("SELECT id FROM commits WHERE sha = ?", (c["sha"],)).fetchone()
-            commit_id = int(row[0])
-            if isinstance(files, list) and files:
-                for f in files:
-                    _upsert_commit_file(conn, commit_id, f)
             count += 1
+            if not (isinstance(files, list) and files):
+                plain.append(_commit_row(c))
+                continue
+            if plain:
+                _executemany_batched(conn, _UPSERT_COMMIT_SQL, plain)
+                plain.clear()
+            conn.execute(_UPSERT_COMMIT_SQL, _commit_row(c))
+            row = conn.execute(_SELECT_COMMIT_ID_SQL, (c["sha"],)).fetchone()
+            commit_id = int(row[0])
+            for f in files:
+                _upsert_commit_file(conn, commit_id, f)
+        if plain:
+            _executemany_batched(conn, _UPSERT_COMMIT_SQL, plain)
         conn.commit()
     return count
 
 
+def insert_commits_many(
+    commits: Iterable[CommitInput],
+    *,
+    db_path: str | None = None,
+) -> int:
+    """Insert commits with ``executemany`` in one transaction, skipping existing SHAs.
+
+    ``commits`` may be a generator; rows are sent in bounded batches. Returns the number
+    of commits actually inserted.
+    """
+
+    with get_connection(db_path) as conn:
+        return _executemany_batched(conn, _INSERT_COMMITS_MANY_SQL, map(_commit_row, commits))
+
+
+def insert_commit_files_many(
+    commit_id: int,
+    files: Iterable[CommitFileChange],
+    *,
+    db_path: str | None = None,
+) -> int:
+    """Insert per-file changes for ``commit_id`` in one transaction, skipping known paths.
+
+    Returns the number of rows actually inserted.
+    """
+
+    with get_connection(db_path) as conn:
+        return _executemany_batched(
+            conn, _INSERT_FILES_MANY_SQL, (_commit_file_row(commit_id, f) for f in files)
+        )
+
+
 def query_commits_by_date(
     since: str,
     until: str = "now",
@@ -133,28 +191,27 @@ def query_commits_by_date(
     - authors, if provided, filters by author_name OR author_email LIKE any value.
     """
 
-    base_sql = (
-        "SELECT sha AS hash, COALESCE(author_name, author_email) AS author, "
-        "author_date AS date, message FROM commits WHERE 1=1"
-    )
+    sql_parts: list[str] = [_QUERY_COMMITS_BASE_SQL]
     params: list[object] = []
     if since:
-        base_sql += " AND author_date >= ?"
+        sql_parts.append(" AND author_date >= ?")
         params.append(since)
     if until:
-        base_sql += " AND author_date <= ?"
+        sql_parts.append(" AND author_date <= ?")
         params.append(until)
     if authors:
-        clauses = []
+        if len(authors) == 1:
+            sql_parts.append(" AND " + _AUTHOR_MATCH_SQL)
+        else:
+            sql_parts.append(" AND (" + " OR ".join([_AUTHOR_MATCH_SQL] * len(authors)) + ")")
         for a in authors:
-            clauses.append("(author_email LIKE ? OR author_name LIKE ?)")
             like = f"%{a}%"
-            params.extend([like, like])
-        base_sql += " AND (" + " OR ".join(clauses) + ")"
-    base_sql += " ORDER BY author_date DESC"
+            params.extend((like, like))
+    sql_parts.append(" ORDER BY author_date DESC")
+    sql = "".join(sql_parts)
 
     with get_connection(db_path) as conn:
-        rows = conn.execute(base_sql, params).fetchall()
+        rows = conn.execute(sql, params).fetchall()
         if not rows:
             return [InfoResponse(info="No commits found in date range")]
         return [
@@ -165,24 +222,35 @@ def query_commits_by_date(
 # --- Helpers ---------------------------------------------------------------
 
 
-def _upsert_commit_file(conn, commit_id: int, f: CommitFileChange) -> None:
-    additions = int(f.get("additions", 0) or 0)
-    deletions = int(f.get("deletions", 0) or 0)
-    status = f.get("status")
-    file_path = f["file_path"]
-    conn.execute(
-        """
-        INSERT INTO commit_files (commit_id, file_path, status, additions, deletions)
-        VALUES (?, ?, ?, ?, ?)
-        ON CONFLICT(commit_id, file_path) DO UPDATE SET
-            status=excluded.status,
-            additions=excluded.additions,
-            deletions=excluded.deletions
-        """,
-        (commit_id, file_path, status, additions, deletions),
+def _commit_row(c: CommitInput) -> tuple[object, ...]:
+    """Parameters for the commit INSERT statements, with defaults filled in."""
+    return (
+        c["sha"],
+        c.get("author_email", ""),
+        c.get("author_name", ""),
+        c["author_date"],
+        c.get("message", ""),
+        int(c.get("insertions", 0) or 0),
+        int(c.get("deletions", 0) or 0),
+        int(c.get("files_changed", 0) or 0),
     )
 
 
+def _commit_file_row(commit_id: int, f: CommitFileChange) -> tuple[object, ...]:
+    """Parameters for the commit_files INSERT statements, with defaults filled in."""
+    return (
+        commit_id,
+        f["file_path"],
+        f.get("status"),
+        int(f.get("additions", 0) or 0),
+        int(f.get("deletions", 0) or 0),
+    )
+
+
+def _upsert_commit_file(conn, commit_id: int, f: CommitFileChange) -> None:
+    conn.execute(_UPSERT_FILE_SQL, _commit_file_row(commit_id, f))
+
+
 # Back-compat helpers kept for existing call sites
 
 
@@ -204,17 +272,8 @@ def insert_commit(
     """
 
     with get_connection(db_path) as conn:
-        # Try existing
-        row = conn.execute("SELECT id FROM commits WHERE sha = ?", (sha,)).fetchone()
-        if row:
-            return int(row[0])
-        cur = conn.execute(
-            """
-            INSERT INTO commits (
-                sha, author_email, author_name, author_date, message,
-                insertions, deletions, files_changed
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        row = conn.execute(
+            _INSERT_IGNORE_COMMIT_SQL,
             (
                 sha,
                 author_email,
@@ -225,31 +284,19 @@ def insert_commit(
                 deletions,
                 files_changed,
             ),
-        )
-        return int(cur.lastrowid)
+        ).fetchone()
+        return int(row[0])
 
 
 def get_commit_by_sha(sha: str, db_path: str | None = None) -> CommitRecord | None:
     with get_connection(db_path) as conn:
-        row = conn.execute("SELECT * FROM commits WHERE sha = ?", (sha,)).fetchone()
+        row = conn.execute(_SELECT_COMMIT_SQL, (sha,)).fetchone()
         return CommitRecord(**dict(row)) if row else None
 
 
 def list_commits(limit: int = 100, db_path: str | None = None) -> list[CommitSummary]:
     with get_connection(db_path) as conn:
-        rows = conn.execute(
-            """
-            SELECT sha,
-                   COALESCE(author_name, author_email) AS author,
-                   author_date AS date,
-                   substr(message, 1, instr(message || '\n', '\n') - 1) AS title,
-                   insertions, deletions, files_changed AS files
-            FROM commits
-            ORDER BY author_date DESC
-            LIMIT ?
-            """,
-            (limit,),
-        ).fetchall()
+        rows = conn.execute(_LIST_COMMITS_SQL, (limit,)).fetchall()
         summaries: list[CommitSummary] = []
         for r in rows:
             stats = {"insertions": int(r[4]), "deletions": int(r[5]), "files": int(r[6])}
@@ -1,4 +1,7 @@
-from .db import get_connection
+from collections.abc import Iterable
+from itertools import batched
+
+from .db import _executemany_batched, get_connection
 from .types import Conversation, ConversationQuery, Message
 
 
@@ -20,6 +23,10 @@ def add_conversation(title: str | None = None, db_path: str | None = None) -> in
     return create_conversation(title=title, db_path=db_path)
 
 
+# conversations.updated_at is refreshed by the trg_messages_touch_conv trigger (migration V4).
+_INSERT_MESSAGE_SQL = "INSERT INTO messages (conversation_id, role, content) VALUES (?, ?, ?)"
+
+
 def add_message(
     conversation_id: int,
     role: str,
@@ -28,33 +35,119 @@ def add_message(
     db_path: str | None = None,
 ) -> int:
     with get_connection(db_path) as conn:
-        cur = conn.execute(
-            "INSERT INTO messages (conversation_id, role, content) VALUES (?, ?, ?)",
-            (conversation_id, role, content),
+        cur = conn.execute(_INSERT_MESSAGE_SQL, (conversation_id, role, content))
+        return int(cur.lastrowid)
+
+
+def add_messages(
+    conversation_id: int,
+    messages: Iterable[tuple[str, str]],
+    *,
+    db_path: str | None = None,
+) -> int:
+    """Append several ``(role, content)`` messages to a conversation in one transaction.
+
+    Returns the number of messages inserted.
+    """
+
+    with get_connection(db_path) as conn:
+        return _executemany_batched(
+            conn,
+            _INSERT_MESSAGE_SQL,
+            ((conversation_id, role, content) for role, content in messages),
         )
-        conn.execute(
-            "UPDATE conversations SET updated_at = datetime('now') WHERE id = ?",
-            (conversation_id,),
+
+
+def insert_messages_many(
+    messages: Iterable[Message],
+    *,
+    db_path: str | None = None,
+) -> int:
+    """Insert messages (each carrying its ``conversation_id``) with ``executemany``.
+
+    Messages may span conversations and may come from a generator; rows are sent in
+    bounded batches inside one transaction. Returns the number of messages inserted.
+    """
+
+    with get_connection(db_path) as conn:
+        return _executemany_batched(
+            conn,
+            _INSERT_MESSAGE_SQL,
+            ((m["conversation_id"], m["role"], m["content"]) for m in messages),
         )
-        return int(cur.lastrowid)
 
 
-_message_cols = "id, conversation_id, role, content, created_at"
+# idx_messages_conversation(conversation_id) implicitly ends with the rowid (id), so this
+# query walks the index in id order without a separate sort step.
+_LIST_MESSAGES_SQL = (
+    "SELECT id, conversation_id, role, content, created_at "
+    "FROM messages WHERE conversation_id = ? ORDER BY id ASC"
+)
 
 
 def list_messages(conversation_id: int, db_path: str | None = None) -> list[Message]:
     with get_connection(db_path) as conn:
-        rows = conn.execute(
-            f"SELECT {_message_cols} FROM messages WHERE conversation_id = ? ORDER BY id ASC",
-            (conversation_id,),
-        ).fetchall()
+        rows = conn.execute(_LIST_MESSAGES_SQL, (conversation_id,)).fetchall()
         return [Message(**dict(r)) for r in rows]
 
 
+# Ids per IN (...) list, well below SQLite's bound-parameter limit
+_IN_BATCH_SIZE = 500
+
+# Whitespace that str.strip() removes for ASCII text: space, \t, \n, \r, \f, \v
+_PREVIEW_TRIM = "char(32, 9, 10, 13, 12, 11)"
+# One seek per conversation on the partial index idx_messages_first_user, stopping at the
+# first user message that is not blank; the conversation ids are bound into the IN list.
+_FIRST_USER_PREVIEW_SQL = (
+    "SELECT m.conversation_id, m.id, m.content FROM conversations c "
+    "JOIN messages m ON m.id = ("
+    "SELECT f.id FROM messages f WHERE f.conversation_id = c.id AND f.role = 'user' "
+    f"AND trim(f.content, {_PREVIEW_TRIM}) != '' ORDER BY f.id LIMIT 1) "
+    "WHERE c.id IN ({})"
+)
+_LATER_USER_MESSAGES_SQL = (
+    "SELECT content FROM messages "
+    "WHERE conversation_id = ? AND role = 'user' AND id > ? ORDER BY id ASC"
+)
+
+
+def _preview(content: str, limit: int) -> str:
+    text = content.strip()
+    return (text[: limit - 3] + "...") if len(text) > limit else text
+
+
+def first_user_message_previews(
+    conversation_ids: Iterable[int], limit: int = 100, db_path: str | None = None
+) -> dict[int, str]:
+    """Return a whitespace-trimmed excerpt of each conversation's first non-blank user message.
+
+    Excerpts longer than ``limit`` characters are cut to ``limit - 3`` and end with
+    "...". SQLite skips messages that are blank in ASCII terms; the excerpt itself is
+    built with ``str.strip()``, so a message holding only other whitespace (e.g. a
+    no-break space) falls through to the next user message. Conversations without a
+    non-blank user message are left out of the result.
+    """
+    previews: dict[int, str] = {}
+    with get_connection(db_path) as conn:
+        for batch in batched(
+            dict.fromkeys(int(c) for c in conversation_ids), _IN_BATCH_SIZE, strict=False
+        ):
+            sql = _FIRST_USER_PREVIEW_SQL.format(",".join("?" * len(batch)))
+            for conv_id, msg_id, content in conn.execute(sql, batch).fetchall():
+                preview = _preview(content, limit)
+                if not preview:
+                    later = conn.execute(_LATER_USER_MESSAGES_SQL, (conv_id, msg_id))
+                    preview = next((p for (c,) in later if (p := _preview(c, limit))), "")
+                if preview:
+                    previews[conv_id] = preview
+    return previews
+
+
 def get_conversation(conversation_id: int, db_path: str | None = None) -> Conversation | None:
     with get_connection(db_path) as conn:
         row = conn.execute(
-            "SELECT id, title, created_at, updated_at FROM conversations WHERE id = ?",
+            "SELECT id, title, created_at, updated_at, message_count "
+            "FROM conversations WHERE id = ?",
             (conversation_id,),
         ).fetchone()
         return Conversation(**dict(row)) if row else None
@@ -78,7 +171,7 @@ def query_conversations(
     """
 
     f = filters or {}
-    sql = "SELECT id, title, created_at, updated_at FROM conversations WHERE 1=1"
+    sql = "SELECT id, title, created_at, updated_at, message_count FROM conversations WHERE 1=1"
     params: list[object] = []
 
     ids = f.get("ids") if isinstance(f, dict) else None  # type: ignore[assignment]
@@ -120,6 +213,9 @@ def query_conversations(
     if order not in {"asc", "desc"}:
         order = "desc"
     sql += f" ORDER BY {order_by} {order.upper()}"
+    if order_by != "id":
+        # Stable order for equal timestamps; matches the (timestamp, rowid) index order
+        sql += f", id {order.upper()}"
 
     limit = f.get("limit") if isinstance(f, dict) else None
     if isinstance(limit, int) and limit > 0:
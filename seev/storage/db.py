@@ -1,14 +1,27 @@
+import functools
+import os
 import sqlite3
+import threading
 import time
-from collections.abc import Callable
+import weakref
+from collections.abc import Callable, Iterable
+from itertools import batched, count
 from pathlib import Path
+from typing import TypedDict
 
 from ..config import get_db_path as _get_db_path
 
 DEFAULT_DB_PATH = "~/.glin/db.sqlite3"
 
+# Prepared-statement cache size per connection (sqlite3 default is 128). Cached
+# connections are long-lived, so keep every distinct storage statement compiled.
+_CACHED_STATEMENTS = 256
+
+# Rows per executemany() call in the bulk insert helpers: large enough to amortize the
+# Python/SQLite boundary, small enough to bound memory when fed from a generator.
+_BULK_BATCH_SIZE = 10_000
+
 # Types for status
-from typing import TypedDict  # noqa: E402
 
 
 class DBTableCount(TypedDict):
@@ -23,71 +36,265 @@ class DBStatus(TypedDict):
     ok: bool
 
 
+# Connection-level tuning applied to every file-backed connection. WAL lets readers
+# proceed while a writer commits, and synchronous=NORMAL is durable under WAL except
+# for the last transactions on power loss. The rest sizes caches for our small DB.
+_PERFORMANCE_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA mmap_size = 268435456;",  # 256MB
+    "PRAGMA cache_size = -16000;",  # 16MB
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA busy_timeout = 5000;",
+)
+
+
+def _configure_connection(conn: sqlite3.Connection, path: str) -> None:
+    """Apply row factory, foreign keys and performance PRAGMAs to a new connection."""
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON;")
+    if path != ":memory:":
+        # journal_mode is persistent in the file header; re-issuing it is a cheap no-op.
+        conn.execute("PRAGMA journal_mode = WAL;")
+    for pragma in _PERFORMANCE_PRAGMAS:
+        conn.execute(pragma)
+
+
+# Per-thread cache of open connections keyed by resolved database path. sqlite3
+# connections should only be used on the thread that created them, so each thread
+# keeps its own set.
+_tls = threading.local()
+
+
+class _ConnectionCache(dict[str, sqlite3.Connection]):
+    """One thread's cached connections (a dict subclass so the registry can hold it weakly)."""
+
+    __slots__ = ("__weakref__",)
+
+
+# Every live thread's cache, so close_all() also reaches the connections opened on worker
+# threads (asyncio.to_thread, executors), which never close their own. A thread's cache
+# drops out when the thread exits and its connections are garbage-collected.
+_all_caches: "weakref.WeakValueDictionary[int, _ConnectionCache]" = weakref.WeakValueDictionary()
+_cache_ids = count()
+_all_caches_lock = threading.Lock()
+
+
+# Cached connections live for the whole process, so besides optimizing on close we
+# refresh planner statistics periodically when a connection is handed out again.
+_OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+
+
+def _thread_connections() -> _ConnectionCache:
+    conns = getattr(_tls, "conns", None)
+    if conns is None:
+        conns = _ConnectionCache()
+        _tls.conns = conns
+        _tls.optimized_at = {}
+        with _all_caches_lock:
+            _all_caches[next(_cache_ids)] = conns
+    return conns
+
+
+def _maybe_optimize(key: str, conn: sqlite3.Connection) -> None:
+    optimized_at: dict[str, float] = _tls.optimized_at
+    now = time.monotonic()
+    last = optimized_at.setdefault(key, now)
+    if now - last >= _OPTIMIZE_INTERVAL_SECONDS:
+        optimized_at[key] = now
+        try:
+            conn.execute("PRAGMA optimize;")
+        except sqlite3.Error:
+            pass
+
+
+def close_connection(conn: sqlite3.Connection) -> None:
+    """Run ``PRAGMA optimize`` so the planner statistics stay fresh, then close ``conn``."""
+    try:
+        conn.execute("PRAGMA optimize;")
+    except sqlite3.Error:
+        pass
+    conn.close()
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_path(path: str) -> Path:
+    """Expand ``~`` in a configured database path (memoized; paths repeat on every call)."""
+    return Path(path).expanduser()
+
+
+def _resolve_path(db_path: str | None) -> tuple[str, str]:
+    """Return ``(path, key)`` where ``key`` is the user-expanded path used for caching."""
+    # Resolve path: argument > env var > glin.toml > default
+    path = db_path if db_path is not None else _get_db_path()
+    key = path if path == ":memory:" else str(_expand_path(path))
+    return path, key
+
+
+def _open_connection(key: str) -> sqlite3.Connection:
+    """Open, configure and migrate a new connection to the resolved path ``key``."""
+    if key != ":memory:":
+        # Ensure parent directory exists before connecting
+        Path(key).parent.mkdir(parents=True, exist_ok=True)
+    # Open connection and migrate on it to avoid double opens; an in-memory database
+    # must be migrated on this very connection anyway. Only the owning thread uses it;
+    # the thread check is off so close_all() may close it from another thread.
+    conn = sqlite3.connect(key, cached_statements=_CACHED_STATEMENTS, check_same_thread=False)
+    _configure_connection(conn, key)
+    latest = max(MIGRATIONS) if MIGRATIONS else 0
+    cached = _cached_version(key)
+    if cached is None or cached < latest:
+        _remember_version(key, migrate_conn(conn))
+    return conn
+
+
+def _executemany_batched(
+    conn: sqlite3.Connection, sql: str, rows: Iterable[tuple[object, ...]]
+) -> int:
+    """``executemany`` ``rows`` in batches of ``_BULK_BATCH_SIZE``; return rows changed.
+
+    Runs inside the caller's transaction, so a whole bulk load commits once.
+    """
+    changed = 0
+    for batch in batched(rows, _BULK_BATCH_SIZE, strict=False):
+        changed += conn.executemany(sql, batch).rowcount
+    return changed
+
+
+def _fetch_dicts(cur: sqlite3.Cursor) -> list[dict]:
+    """Fetch every remaining row of ``cur`` as a plain dict.
+
+    The column names are read from ``cur.description`` once per query instead of
+    through ``sqlite3.Row.keys()`` for every row.
+    """
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, row, strict=True)) for row in cur.fetchall()]
+
+
 def get_connection(db_path: str | None = None) -> sqlite3.Connection:
     """Return a sqlite3 connection with sensible defaults, ensuring migrations are applied.
 
     - Ensures parent directory exists when a filesystem path is used.
     - Expands user home (e.g., `~`) before connecting to avoid creating a literal `~` file.
     - Sets row factory to sqlite3.Row for dict-like access.
-    - Enables foreign keys.
+    - Enables foreign keys, WAL journaling (file databases) and performance PRAGMAs.
     - Ensures the database schema is initialized and up-to-date before use.
+
+    Connections are cached per thread and per resolved path, so repeated calls reuse the
+    same handle instead of reopening and re-migrating it. Using the connection as a context
+    manager commits (or rolls back on error) but does not close it; call ``close_all()``
+    to release the cached connections of every thread.
     """
 
-    # Resolve path: argument > env var > glin.toml > default
-    path = db_path if db_path is not None else _get_db_path()
-    if path == ":memory:":
-        # In-memory database must be migrated on this very connection
-        conn = sqlite3.connect(path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        migrate_conn(conn)
-        return conn
-    else:
-        # Expand `~` and ensure parent directory exists before connecting
-        full_path = Path(path).expanduser()
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        # Open connection and migrate on it to avoid double opens
-        conn = sqlite3.connect(str(full_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        migrate_conn(conn)
+    path, key = _resolve_path(db_path)
+    conns = _thread_connections()
+    conn = conns.get(key)
+    if conn is not None:
+        _maybe_optimize(key, conn)
         return conn
 
+    conn = _open_connection(key)
+    conns[key] = conn
+    _tls.optimized_at[key] = time.monotonic()
+    return conn
+
+
+def _close_cached(conns: _ConnectionCache) -> None:
+    while conns:
+        try:
+            _key, conn = conns.popitem()
+        except KeyError:  # emptied concurrently
+            return
+        try:
+            close_connection(conn)
+        except sqlite3.Error:
+            pass
+
+
+def _close_thread_connections() -> None:
+    """Optimize and close the connections cached for the calling thread only."""
+    _close_cached(_thread_connections())
+
+
+def close_all() -> None:
+    """Optimize and close every connection cached by ``get_connection``, on all threads.
+
+    Meant for shutdown and tests: no other thread may be using its connection while
+    this runs. A thread that calls ``get_connection`` afterwards opens a fresh one.
+    """
+    with _all_caches_lock:
+        caches = list(_all_caches.values())
+    for conns in caches:
+        _close_cached(conns)
+
 
 # --- Migration machinery ----------------------------------------------------
 
 MigrationFn = Callable[[sqlite3.Connection], None]
 
 
-def _create_schema_version_table(conn: sqlite3.Connection) -> None:
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS schema_version (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            current_version INTEGER NOT NULL,
-            updated_at TEXT NOT NULL
-        );
-        """
-    )
+# Statements run on every migration probe; kept as constants so each call hits the
+# connection's statement cache instead of being compiled again.
+_CREATE_SCHEMA_VERSION_SQL = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    current_version INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+_SELECT_VERSION_SQL = "SELECT current_version FROM schema_version WHERE id = 1"
+_INSERT_VERSION_SQL = (
+    "INSERT INTO schema_version (id, current_version, updated_at) VALUES (1, ?, ?)"
+)
+_UPDATE_VERSION_SQL = "UPDATE schema_version SET current_version = ?, updated_at = ? WHERE id = 1"
+
+
+def _create_schema_version_table(conn: sqlite3.Connection) -> int:
+    """Ensure the schema_version table and its single row exist; return the version."""
+    conn.execute(_CREATE_SCHEMA_VERSION_SQL)
     # Ensure a single row exists; if table was empty, insert version 0
-    row = conn.execute("SELECT current_version FROM schema_version WHERE id = 1").fetchone()
+    row = conn.execute(_SELECT_VERSION_SQL).fetchone()
     if row is None:
-        now = _now()
-        conn.execute(
-            "INSERT INTO schema_version (id, current_version, updated_at) VALUES (1, ?, ?)",
-            (0, now),
-        )
+        conn.execute(_INSERT_VERSION_SQL, (0, _now()))
+        return 0
+    return int(row[0])
+
+
+# (epoch second, formatted timestamp) of the last _now() call; the text only changes once
+# per second, so repeated calls within a second skip gmtime/strftime.
+_NOW_CACHE: tuple[int, str] = (-1, "")
 
 
 def _now() -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    global _NOW_CACHE
+    sec = int(time.time())
+    if _NOW_CACHE[0] != sec:
+        _NOW_CACHE = (sec, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec)))
+    return _NOW_CACHE[1]
+
+
+def _execute_statements(conn: sqlite3.Connection, script: str) -> None:
+    """Run each statement of ``script`` with ``execute`` inside the caller's transaction.
+
+    ``executescript`` would COMMIT first and run outside our transaction, so migration
+    DDL is split on complete statements (trigger bodies included) instead.
+    """
+    buf = ""
+    for line in script.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            conn.execute(buf)
+            buf = ""
+    leftover = "\n".join(ln for ln in buf.splitlines() if not ln.strip().startswith("--"))
+    if leftover.strip():
+        raise ValueError(f"Incomplete SQL statement in migration: {leftover.strip()!r}")
 
 
 def _mig_1(conn: sqlite3.Connection) -> None:
     """Migration V1: primary tables and indices for conversations and commits."""
 
     # Conversations and messages
-    conn.executescript(
+    _execute_statements(
+        conn,
         """
         CREATE TABLE conversations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -137,13 +344,14 @@ def _mig_1(conn: sqlite3.Connection) -> None:
         );
 
         CREATE INDEX idx_commit_files_commit ON commit_files(commit_id);
-        """
+        """,
     )
 
 
 def _mig_2(conn: sqlite3.Connection) -> None:
     """Migration V2: Add commit-conversation linking table and indices."""
-    conn.executescript(
+    _execute_statements(
+        conn,
         """
         CREATE TABLE commit_conversations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -157,13 +365,14 @@ def _mig_2(conn: sqlite3.Connection) -> None:
 
         CREATE INDEX idx_commit_conversations_sha ON commit_conversations(commit_sha);
         CREATE INDEX idx_commit_conversations_conv ON commit_conversations(conversation_id);
-        """
+        """,
     )
 
 
 def _mig_3(conn: sqlite3.Connection) -> None:
     """Migration V3: Add conversation_summaries table."""
-    conn.executescript(
+    _execute_statements(
+        conn,
         """
         CREATE TABLE conversation_summaries (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -177,29 +386,285 @@ def _mig_3(conn: sqlite3.Connection) -> None:
 
         CREATE INDEX idx_conv_summaries_date ON conversation_summaries(date);
         CREATE INDEX idx_conv_summaries_conv ON conversation_summaries(conversation_id);
+        """,
+    )
+
+
+def _mig_4(conn: sqlite3.Connection) -> None:
+    """Migration V4: Touch conversations.updated_at from a trigger when a message is added."""
+    _execute_statements(
+        conn,
+        """
+        CREATE TRIGGER trg_messages_touch_conv AFTER INSERT ON messages
+        BEGIN
+            UPDATE conversations SET updated_at = datetime('now') WHERE id = NEW.conversation_id;
+        END;
+        """,
+    )
+
+
+# Tables whose datetime('now') column defaults are replaced in V5, in rebuild order
+# (parents before children), with their current definitions and indices.
+_V5_TABLES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "conversations": (
+        """
+        CREATE TABLE conversations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        (),
+    ),
+    "messages": (
         """
+        CREATE TABLE messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            conversation_id INTEGER NOT NULL,
+            role TEXT NOT NULL CHECK (role IN ('user','assistant','system')),
+            content TEXT NOT NULL,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
+        )
+        """,
+        (
+            "CREATE INDEX idx_messages_conversation ON messages(conversation_id)",
+            "CREATE INDEX idx_messages_conversation_created "
+            "ON messages(conversation_id, created_at)",
+        ),
+    ),
+    "commits": (
+        """
+        CREATE TABLE commits (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sha TEXT NOT NULL UNIQUE,
+            author_email TEXT,
+            author_name TEXT,
+            author_date TEXT NOT NULL,
+            message TEXT NOT NULL,
+            insertions INTEGER NOT NULL DEFAULT 0,
+            deletions INTEGER NOT NULL DEFAULT 0,
+            files_changed INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        (
+            "CREATE INDEX idx_commits_sha ON commits(sha)",
+            "CREATE INDEX idx_commits_author_date ON commits(author_date)",
+        ),
+    ),
+    "commit_conversations": (
+        """
+        CREATE TABLE commit_conversations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            commit_sha TEXT NOT NULL,
+            conversation_id INTEGER NOT NULL,
+            relevance_score REAL DEFAULT 1.0,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE,
+            UNIQUE(commit_sha, conversation_id)
+        )
+        """,
+        (
+            "CREATE INDEX idx_commit_conversations_sha ON commit_conversations(commit_sha)",
+            "CREATE INDEX idx_commit_conversations_conv ON commit_conversations(conversation_id)",
+        ),
+    ),
+    "conversation_summaries": (
+        """
+        CREATE TABLE conversation_summaries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL, -- YYYY-MM-DD
+            conversation_id INTEGER NOT NULL,
+            title TEXT,
+            summary TEXT NOT NULL,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
+        )
+        """,
+        (
+            "CREATE INDEX idx_conv_summaries_date ON conversation_summaries(date)",
+            "CREATE INDEX idx_conv_summaries_conv ON conversation_summaries(conversation_id)",
+        ),
+    ),
+}
+
+
+def _rebuild_table(
+    conn: sqlite3.Connection, name: str, create_sql: str, indexes: Iterable[str]
+) -> None:
+    """Recreate ``name`` from ``create_sql`` keeping rows, ids and the AUTOINCREMENT counter.
+
+    Follows SQLite's create-copy-drop-rename procedure; foreign keys must be off.
+    """
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (name,)).fetchone()
+    conn.execute(create_sql.replace(f"CREATE TABLE {name} (", f"CREATE TABLE {name}__new (", 1))
+    conn.execute(f"INSERT INTO {name}__new SELECT * FROM {name}")
+    conn.execute(f"DROP TABLE {name}")
+    conn.execute(f"ALTER TABLE {name}__new RENAME TO {name}")
+    if row is not None:
+        conn.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = ?", (row[0], name))
+    for index_sql in indexes:
+        conn.execute(index_sql)
+
+
+def _mig_5(conn: sqlite3.Connection) -> None:
+    """Migration V5: Use CURRENT_TIMESTAMP instead of datetime('now') for column defaults.
+
+    Both produce the same ``YYYY-MM-DD HH:MM:SS`` UTC text, but the keyword avoids a SQL
+    function call per inserted row. SQLite cannot alter a column default in place, so the
+    affected tables are rebuilt.
+    """
+    # The trigger references conversations, which is briefly absent during the rebuild
+    conn.execute("DROP TRIGGER IF EXISTS trg_messages_touch_conv")
+    for name, (create_sql, indexes) in _V5_TABLES.items():
+        _rebuild_table(conn, name, create_sql, indexes)
+    _execute_statements(
+        conn,
+        """
+        CREATE TRIGGER trg_messages_touch_conv AFTER INSERT ON messages
+        BEGIN
+            UPDATE conversations SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.conversation_id;
+        END;
+        """,
+    )
+
+
+def _mig_6(conn: sqlite3.Connection) -> None:
+    """Migration V6: Indices for first-user-message lookups and per-conversation links."""
+    _execute_statements(
+        conn,
+        """
+        -- Partial index: only user messages, ordered like list_messages, so finding the
+        -- first one in a conversation is a single index seek.
+        CREATE INDEX idx_messages_first_user ON messages(conversation_id, id)
+            WHERE role = 'user';
+
+        -- Links for a conversation are listed newest first; the composite serves both the
+        -- filter and the ORDER BY and supersedes the single-column index.
+        CREATE INDEX idx_commit_conversations_conv_created
+            ON commit_conversations(conversation_id, created_at);
+        DROP INDEX IF EXISTS idx_commit_conversations_conv;
+        """,
+    )
+
+
+def _mig_7(conn: sqlite3.Connection) -> None:
+    """Migration V7: Indices for listing conversations by timestamp."""
+    _execute_statements(
+        conn,
+        """
+        -- query_conversations orders by updated_at (default) or created_at with a LIMIT and
+        -- breaks ties on id. Each index implicitly ends with the rowid (id), so both ORDER BY
+        -- columns come straight from the index, walked backwards for DESC, with no sort.
+        CREATE INDEX idx_conversations_updated ON conversations(updated_at);
+        CREATE INDEX idx_conversations_created ON conversations(created_at);
+        """,
+    )
+
+
+def _mig_8(conn: sqlite3.Connection) -> None:
+    """Migration V8: Keep a per-conversation message count up to date with triggers."""
+    _execute_statements(
+        conn,
+        """
+        ALTER TABLE conversations ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0;
+        UPDATE conversations SET message_count =
+            (SELECT COUNT(*) FROM messages WHERE conversation_id = conversations.id);
+
+        -- The insert trigger now also bumps the count, in the same UPDATE as updated_at.
+        DROP TRIGGER trg_messages_touch_conv;
+        CREATE TRIGGER trg_messages_touch_conv AFTER INSERT ON messages
+        BEGIN
+            UPDATE conversations
+            SET updated_at = CURRENT_TIMESTAMP, message_count = message_count + 1
+            WHERE id = NEW.conversation_id;
+        END;
+
+        CREATE TRIGGER trg_messages_count_delete AFTER DELETE ON messages
+        BEGIN
+            UPDATE conversations SET message_count = message_count - 1
+            WHERE id = OLD.conversation_id;
+        END;
+
+        CREATE TRIGGER trg_messages_count_move AFTER UPDATE OF conversation_id ON messages
+        WHEN OLD.conversation_id <> NEW.conversation_id
+        BEGIN
+            UPDATE conversations SET message_count = message_count - 1
+            WHERE id = OLD.conversation_id;
+            UPDATE conversations SET message_count = message_count + 1
+            WHERE id = NEW.conversation_id;
+        END;
+        """,
     )
 
 
+# Migrations that rebuild tables run with foreign key enforcement off (it cannot be
+# toggled inside a transaction) and verify integrity with foreign_key_check instead.
+_REBUILD_MIGRATIONS = frozenset({5})
+
+
 MIGRATIONS: dict[int, MigrationFn] = {
     1: _mig_1,
     2: _mig_2,
     3: _mig_3,
+    4: _mig_4,
+    5: _mig_5,
+    6: _mig_6,
+    7: _mig_7,
+    8: _mig_8,
 }
 
 
 def _get_current_version(conn: sqlite3.Connection) -> int:
-    _create_schema_version_table(conn)
-    row = conn.execute("SELECT current_version FROM schema_version WHERE id = 1").fetchone()
-    assert row is not None
-    return int(row[0])
+    return _create_schema_version_table(conn)
 
 
 def _set_version(conn: sqlite3.Connection, version: int) -> None:
-    conn.execute(
-        "UPDATE schema_version SET current_version = ?, updated_at = ? WHERE id = 1",
-        (version, _now()),
-    )
+    conn.execute(_UPDATE_VERSION_SQL, (version, _now()))
+    # Mirror into the file header so later opens can check it without touching tables
+    conn.execute(f"PRAGMA user_version = {int(version)};")
+
+
+def _get_user_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version;").fetchone()[0])
+
+
+# Resolved path -> (schema version, file identity, expiry). Lets a fresh open of an
+# up-to-date database skip the migration probe entirely for a short while.
+_VERSION_CACHE_TTL_SECONDS = 30.0
+_VERSION_CACHE: dict[str, tuple[int, int, float]] = {}
+
+
+def _file_identity(key: str) -> int | None:
+    try:
+        st = os.stat(key)
+    except OSError:
+        return None
+    # An empty file was just (re)created by a bare connect and has no schema yet; inode
+    # numbers can be reused immediately, so they alone don't identify the database.
+    return st.st_ino if st.st_size > 0 else None
+
+
+def _cached_version(key: str) -> int | None:
+    entry = _VERSION_CACHE.get(key)
+    if entry is None:
+        return None
+    version, ident, expires = entry
+    # A recreated file must be migrated again
+    if time.monotonic() >= expires or _file_identity(key) != ident:
+        _VERSION_CACHE.pop(key, None)
+        return None
+    return version
+
+
+def _remember_version(key: str, version: int) -> None:
+    if key == ":memory:":
+        return
+    ident = _file_identity(key)
+    if ident is not None:
+        _VERSION_CACHE[key] = (version, ident, time.monotonic() + _VERSION_CACHE_TTL_SECONDS)
 
 
 def migrate_conn(conn: sqlite3.Connection, target: int | None = None) -> int:
@@ -208,20 +673,49 @@ def migrate_conn(conn: sqlite3.Connection, target: int | None = None) -> int:
     Returns the new/current schema version. Idempotent and safe to call multiple times.
     """
 
-    cur = _get_current_version(conn)
     latest = max(MIGRATIONS) if MIGRATIONS else 0
     goal = target if target is not None else latest
-    if goal < cur:
-        # We don't support down-migrations in this simple system.
+    # Fast path: the header's user_version already covers the goal, so there is nothing
+    # to do and no need to create or query schema_version (which would write on a fresh
+    # file and fails on read-only databases).
+    user_version = _get_user_version(conn)
+    if user_version and goal <= user_version:
+        return user_version
+
+    cur = _get_current_version(conn)
+    if goal <= cur:
+        # Nothing to apply (we don't support down-migrations in this simple system).
+        if cur != user_version:
+            # Databases created before user_version was mirrored
+            conn.execute(f"PRAGMA user_version = {int(cur)};")
+        conn.commit()
         return cur
+    conn.commit()
     for v in range(cur + 1, goal + 1):
         fn = MIGRATIONS.get(v)
         if fn is None:
             raise RuntimeError(f"Missing migration {v}")
-        fn(conn)
-        _set_version(conn, v)
-    conn.commit()
-    return _get_current_version(conn)
+        rebuild = v in _REBUILD_MIGRATIONS
+        if rebuild:
+            fk_enabled = conn.execute("PRAGMA foreign_keys;").fetchone()[0]
+            conn.execute("PRAGMA foreign_keys = OFF;")
+        # One transaction (one fsync) per migration; FK checks run once at COMMIT.
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            conn.execute("PRAGMA defer_foreign_keys = ON;")
+            fn(conn)
+            if rebuild and conn.execute("PRAGMA foreign_key_check;").fetchone() is not None:
+                raise sqlite3.IntegrityError(f"Migration {v} left foreign key violations")
+            _set_version(conn, v)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            if rebuild and fk_enabled:
+                conn.execute("PRAGMA foreign_keys = ON;")
+    # Every step above committed its own version bump
+    return goal
 
 
 def migrate(db_path: str | None = None, target: int | None = None) -> int:
@@ -235,15 +729,17 @@ def migrate(db_path: str | None = None, target: int | None = None) -> int:
     if path == ":memory:":
         conn = sqlite3.connect(path)
     else:
-        full_path = Path(path).expanduser()
+        full_path = _expand_path(path)
         full_path.parent.mkdir(parents=True, exist_ok=True)
         conn = sqlite3.connect(str(full_path))
     try:
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return migrate_conn(conn, target)
+        _configure_connection(conn, path)
+        version = migrate_conn(conn, target)
+        if path != ":memory:":
+            _remember_version(str(full_path), version)
+        return version
     finally:
-        conn.close()
+        close_connection(conn)
 
 
 def init_db(db_path: str | None = None) -> int:
@@ -258,16 +754,21 @@ def init_db(db_path: str | None = None) -> int:
 # --- Backups & Status ------------------------------------------------------
 
 
+_BACKUP_PAGES_PER_STEP = 1000
+
+
 def create_backup(db_path: str | None = None, *, backups_root: str = ".glin/backups") -> Path:
     """Create a timestamped backup of the database file.
 
     The backup path pattern is backups_root/YYYYMMDD/HHMMSS/<db_filename>.
     Returns the full path to the copied backup file.
+
+    Uses SQLite's online backup API, so the snapshot is consistent even while other
+    connections write and includes transactions still sitting in the WAL file.
     """
-    import shutil
 
     path = db_path if db_path is not None else _get_db_path()
-    src = Path(path).expanduser()
+    src = _expand_path(path)
     if src.name == ":memory:":
         raise ValueError("Cannot back up an in-memory database")
     if not src.exists():
@@ -279,39 +780,75 @@ def create_backup(db_path: str | None = None, *, backups_root: str = ".glin/back
     root = Path(backups_root) / day / hms
     root.mkdir(parents=True, exist_ok=True)
     dest = root / src.name
-    shutil.copy2(src, dest)
+    src_conn = sqlite3.connect(str(src))
+    try:
+        dst_conn = sqlite3.connect(str(dest))
+        try:
+            # Copy in ~4MB steps so concurrent writers are not blocked for the whole copy
+            src_conn.backup(dst_conn, pages=_BACKUP_PAGES_PER_STEP)
+        finally:
+            dst_conn.close()
+    finally:
+        src_conn.close()
     return dest
 
 
+_STATUS_TABLES: tuple[str, ...] = (
+    "schema_version",
+    "conversations",
+    "messages",
+    "conversation_summaries",
+    "commits",
+    "commit_files",
+    "commit_conversations",
+)
+
+# The names are interpolated into SQL below, so reject anything that is not a bare
+# identifier when the module loads rather than trusting future edits to the tuple.
+_invalid_tables = [t for t in _STATUS_TABLES if not t.isidentifier()]
+if _invalid_tables:
+    raise RuntimeError(f"Invalid status table names: {_invalid_tables}")
+del _invalid_tables
+
+# Schema version and every row count in one statement (one round-trip instead of one
+# per table), built once at import; the per-table statements back the fallback path.
+_STATUS_COUNT_SQL = {t: f"SELECT COUNT(*) FROM {t}" for t in _STATUS_TABLES}
+_STATUS_SQL = f"SELECT ({_SELECT_VERSION_SQL}), " + ", ".join(
+    f"({_STATUS_COUNT_SQL[t]})" for t in _STATUS_TABLES
+)
+
+
 def get_db_status(db_path: str | None = None) -> DBStatus:
     """Return a status snapshot: path, schema version, and row counts per table."""
     path = db_path if db_path is not None else _get_db_path()
-    tables = [
-        "schema_version",
-        "conversations",
-        "messages",
-        "conversation_summaries",
-        "commits",
-        "commit_files",
-        "commit_conversations",
-    ]
     counts: list[DBTableCount] = []
     schema_version = 0
     ok = True
     try:
         with get_connection(path) as conn:
-            # version
-            row = conn.execute("SELECT current_version FROM schema_version WHERE id = 1").fetchone()
-            schema_version = int(row[0]) if row else 0
-            for t in tables:
-                try:
-                    c = conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()
-                    counts.append({"table": t, "rows": int(c[0]) if c else 0})
-                except Exception:
-                    counts.append({"table": t, "rows": 0})
-                    ok = False
+            try:
+                row = conn.execute(_STATUS_SQL).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                schema_version = int(row[0]) if row[0] is not None else 0
+                counts = [
+                    {"table": t, "rows": int(n)}
+                    for t, n in zip(_STATUS_TABLES, row[1:], strict=True)
+                ]
+            else:
+                # Some table is missing: count what we can and flag the snapshot as not ok
+                row = conn.execute(_SELECT_VERSION_SQL).fetchone()
+                schema_version = int(row[0]) if row else 0
+                for t in _STATUS_TABLES:
+                    try:
+                        c = conn.execute(_STATUS_COUNT_SQL[t]).fetchone()
+                        counts.append({"table": t, "rows": int(c[0]) if c else 0})
+                    except Exception:
+                        counts.append({"table": t, "rows": 0})
+                        ok = False
     except Exception:
         ok = False
     return DBStatus(
-        path=str(Path(path).expanduser()), schema_version=schema_version, tables=counts, ok=ok
+        path=str(_expand_path(path)), schema_version=schema_version, tables=counts, ok=ok
     )
@@ -24,7 +24,7 @@ def link_commit_to_conversation(
             VALUES (?, ?, ?)
             ON CONFLICT(commit_sha, conversation_id) DO UPDATE SET
                 relevance_score = excluded.relevance_score,
-                created_at = datetime('now')
+                created_at = CURRENT_TIMESTAMP
             """,
             (commit_sha, conversation_id, float(relevance_score)),
         )
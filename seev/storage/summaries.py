@@ -1,4 +1,4 @@
-from .db import get_connection
+from .db import _fetch_dicts, get_connection
 from .types import ConversationSummary, ConversationSummaryQuery
 
 
@@ -27,7 +27,13 @@ def list_summaries(
     *,
     db_path: str | None = None,
 ) -> list[ConversationSummary]:
-    """Query summaries by optional date and/or conversation_id with limit/offset."""
+    """Query summaries by optional date (or date range) and/or conversation_id.
+
+    ``date`` is an exact match; ``date_from``/``date_until`` bound a half-open range
+    ``[date_from, date_until)``. Both compare the raw column so idx_conv_summaries_date
+    is used. Prefer ``date`` for a single day: equality walks the index in id order,
+    while a range needs a sort for ``ORDER BY id``.
+    """
     f = filters or {}
     sql = (
         "SELECT id, date, conversation_id, title, summary, created_at "
@@ -40,6 +46,14 @@ def list_summaries(
         if d:
             sql += " AND date = ?"
             params.append(d)
+        d_from = f.get("date_from")
+        if d_from:
+            sql += " AND date >= ?"
+            params.append(d_from)
+        d_until = f.get("date_until")
+        if d_until:
+            sql += " AND date < ?"
+            params.append(d_until)
         cid = f.get("conversation_id")
         if cid:
             sql += " AND conversation_id = ?"
@@ -56,5 +70,4 @@ def list_summaries(
             sql += " ORDER BY id DESC"
 
     with get_connection(db_path) as conn:
-        rows = conn.execute(sql, params).fetchall()
-        return [ConversationSummary(**dict(r)) for r in rows]
+        return _fetch_dicts(conn.execute(sql, params))  # type: ignore[return-value]
@@ -87,6 +87,7 @@ class Conversation(TypedDict, total=False):
     title: NotRequired[str]
     created_at: NotRequired[str]
     updated_at: NotRequired[str]
+    message_count: NotRequired[int]  # maintained by triggers on messages (migration V8)
 
 
 class ConversationQuery(TypedDict, total=False):
@@ -117,6 +118,8 @@ class ConversationSummary(TypedDict, total=False):
 
 class ConversationSummaryQuery(TypedDict, total=False):
     date: str
+    date_from: str  # inclusive YYYY-MM-DD
+    date_until: str  # exclusive YYYY-MM-DD
     conversation_id: int
     limit: int
     offset: int
@@ -1,3 +1,7 @@
+import asyncio
+import heapq
+import io
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, TypedDict
 
@@ -52,6 +56,16 @@ except Exception:  # pragma: no cover
     query_conversations = _fallback_query_conversations  # type: ignore[assignment]
 
 
+# Section headers of the rich worklog, shared by every render
+_H_GOALS = "### 🎯 Goals & Context\n"
+_H_TECH = "### 💻 Technical Work\n"
+_H_METRICS = "### 📊 Metrics\n"
+_H_IMPACT = "### ⚠️ Impact Assessment\n"
+_H_DECISIONS = "### 🔍 Key Decisions\n\n"
+_H_OPEN = "### 🚧 Open Items\n\n"
+_H_LEARN = "### 📚 Learnings\n\n"
+
+
 class GenerateWorklogMetadata(TypedDict, total=False):
     commit_count: int
     conversation_count: int
@@ -62,16 +76,27 @@ class GenerateWorklogMetadata(TypedDict, total=False):
 def _first_user_message_excerpt(messages: list[dict], limit: int = 100) -> str | None:
     try:
         for m in messages:
-            if str(m.get("role")) == "user" and m.get("content"):
-                text = str(m["content"]).strip()
-                if not text:
-                    continue
+            # Roles are plain strings; compare directly instead of casting every message
+            if m.get("role") != "user" or not (content := m.get("content")):
+                continue
+            text = (content if isinstance(content, str) else str(content)).strip()
+            if text:
                 return (text[: limit - 3] + "...") if len(text) > limit else text
     except Exception:
         pass
     return None
 
 
+def _language_additions(item: tuple[str, Any]) -> int:
+    """Sort key for heatmap ``languages`` items: additions of the language, 0 when absent."""
+    return int((item[1] or {}).get("additions", 0))
+
+
+def _count_commits(commits: list[dict]) -> int:
+    """Count commit dicts that carry a hash, without building an intermediate list."""
+    return sum(1 for c in commits if isinstance(c, dict) and c.get("hash"))
+
+
 def generate_rich_worklog(
     date: str,
     commits: list[dict],
@@ -79,6 +104,8 @@ def generate_rich_worklog(
     enriched_data: dict | EnrichedResult | None = None,
     heatmap: dict | None = None,
     sessions: WorkSessionsResult | dict | None = None,
+    *,
+    commit_count: int | None = None,
 ) -> str:
     """Generate structured markdown worklog content for a given date.
 
@@ -90,16 +117,25 @@ def generate_rich_worklog(
     - Impact Assessment
     - Open Items
     - Learnings
+
+    ``commit_count`` may be passed when the caller has already counted ``commits``.
     """
 
-    sections: list[str] = []
+    # Normalize optional inputs once so the sections below only test for content
+    enriched_data = enriched_data if isinstance(enriched_data, dict) else {}
+    heatmap = heatmap if isinstance(heatmap, dict) else {}
+    session_list = sessions.get("sessions") if isinstance(sessions, dict) else None
+
+    # Fragments go straight into one growable buffer instead of a list of small strings
+    buf = io.StringIO()
+    write = buf.write
 
     # Header
-    sections.append(f"## {date}\n\n")
+    write(f"## {date}\n\n")
 
     # Context from conversations (up to 3 snippets)
     if conversations:
-        sections.append("### 🎯 Goals & Context\n")
+        write(_H_GOALS)
         shown = 0
         for conv in conversations:
             if shown >= 3:
@@ -108,37 +144,32 @@ def generate_rich_worklog(
             msgs = conv.get("messages") or []
             excerpt = _first_user_message_excerpt(msgs) if isinstance(msgs, list) else None
             if excerpt:
-                sections.append(f'- **{title}:** "{excerpt}"\n')
+                write(f'- **{title}:** "{excerpt}"\n')
                 shown += 1
-        sections.append("\n")
+        write("\n")
 
     # Technical Work
-    sections.append("### 💻 Technical Work\n")
+    write(_H_TECH)
 
     # Prefer sessions view if provided
-    if (
-        sessions
-        and isinstance(sessions, dict)
-        and isinstance(sessions.get("sessions"), list)
-        and sessions["sessions"]
-    ):
-        for sess in sessions["sessions"]:
+    if isinstance(session_list, list) and session_list:
+        for sess in session_list:
             try:
                 start = str(sess.get("start_time", ""))
                 end = str(sess.get("end_time", ""))
                 dur = int(sess.get("duration_minutes", 0))
                 theme = str(sess.get("theme", "Work session"))
-                sections.append(
+                write(
                     f"\n**Session: {start[11:16] if len(start) >= 16 else start}"
                     f"-{end[11:16] if len(end) >= 16 else end}** ({dur}m)\n"
                 )
                 if theme:
-                    sections.append(f"*{theme}*\n")
+                    write(f"*{theme}*\n")
                 for c in sess.get("commits") or []:
                     msg = str(c.get("message", "")).strip()
                     sha = str(c.get("hash", ""))[:7]
                     if msg:
-                        sections.append(f"- {msg} ({sha})\n")
+                        write(f"- {msg} ({sha})\n")
             except Exception:
                 # Be resilient; continue rendering remaining sessions
                 continue
@@ -151,62 +182,70 @@ def generate_rich_worklog(
             if not msg:
                 continue
             sha = str(c.get("hash", ""))[:7]
-            sections.append(f"- {msg} ({sha})\n")
-    sections.append("\n")
+            write(f"- {msg} ({sha})\n")
+    write("\n")
 
     # Metrics
-    sections.append("### 📊 Metrics\n")
-    total_commits = len([c for c in commits if isinstance(c, dict) and c.get("hash")])
-    sections.append(f"- **{total_commits} commits**\n")
+    write(_H_METRICS)
+    total_commits = commit_count if commit_count is not None else _count_commits(commits)
+    write(f"- **{total_commits} commits**\n")
 
-    if enriched_data and isinstance(enriched_data, dict):
+    if enriched_data:
         totals = enriched_data.get("totals")
         if isinstance(totals, dict):
             adds = int(totals.get("additions", 0))
             dels = int(totals.get("deletions", 0))
-            sections.append(f"- **{adds} additions, {dels} deletions**\n")
+            write(f"- **{adds} additions, {dels} deletions**\n")
 
-    if heatmap and isinstance(heatmap, dict):
+    if heatmap:
         langs = heatmap.get("languages")
         if isinstance(langs, dict) and langs:
             # Show top 3 by additions when present
             try:
-                top = sorted(
-                    langs.items(),
-                    key=lambda kv: int((kv[1] or {}).get("additions", 0)),
-                    reverse=True,
-                )[:3]
+                top = heapq.nlargest(3, langs.items(), key=_language_additions)
                 lang_summary = ", ".join(f"{k} ({(v or {}).get('additions', 0)}+)" for k, v in top)
                 if lang_summary:
-                    sections.append(f"- **Languages:** {lang_summary}\n")
+                    write(f"- **Languages:** {lang_summary}\n")
             except Exception:
                 pass
-        files = heatmap.get("files") if isinstance(heatmap, dict) else None
+        files = heatmap.get("files")
         if isinstance(files, list) and files:
             top_file = files[0]
             try:
                 path = top_file.get("path")
                 chg = top_file.get("changes")
                 if path is not None and chg is not None:
-                    sections.append(f"- **Hot file:** {path} ({chg} changes)\n")
+                    write(f"- **Hot file:** {path} ({chg} changes)\n")
             except Exception:
                 pass
-    sections.append("\n")
+    write("\n")
 
     # Impact Assessment (placeholder text; intended for LLM augmentation)
-    sections.append("### ⚠️ Impact Assessment\n")
-    sections.append("*Analysis based on changed files and commit messages*\n\n")
+    write(_H_IMPACT)
+    write("*Analysis based on changed files and commit messages*\n\n")
 
     # Key Decisions
-    sections.append("### 🔍 Key Decisions\n\n")
+    write(_H_DECISIONS)
 
     # Open Items
-    sections.append("### 🚧 Open Items\n\n")
+    write(_H_OPEN)
 
     # Learnings
-    sections.append("### 📚 Learnings\n\n")
+    write(_H_LEARN)
+
+    return buf.getvalue()
+
+
+def _empty_sessions() -> dict[str, Any]:
+    return {"sessions": [], "commit_count": 0, "generated_at": datetime.now().isoformat()}
+
 
-    return "".join(sections)
+def _safe(fallback: Callable[[], Any], fn: Callable[..., Any], *args: Any) -> Any:
+    """Call ``fn(*args)``; on any error return ``fallback()`` instead (best-effort inputs)."""
+    try:
+        return fn(*args)
+    except Exception:
+        return fallback()
 
 
 class GenerateWorklogResponse(TypedDict):
@@ -225,55 +264,48 @@ class GenerateWorklogResponse(TypedDict):
 async def _tool_generate_rich_worklog(
     date: str, ctx: Context | None = None
 ) -> GenerateWorklogResponse:  # type: ignore[name-defined]
-    # Gather inputs
+    # Gather inputs. The sources are independent (git subprocesses and SQLite reads), so
+    # they run concurrently in worker threads instead of one after another on the loop.
     since = date
     until = date
 
-    commits = get_commits_by_date(since, until)
-
-    enriched: Any = get_enriched_commits(since, until)
-
-    sessions: Any
-    try:
-        sessions = get_work_sessions(since, until)
-    except Exception:
-        sessions = {"sessions": [], "commit_count": 0, "generated_at": datetime.now().isoformat()}
-
-    # Heatmap is optional; may not be available in this codebase
-    try:
-        heatmap = get_file_heatmap(since, until)
-    except Exception:
-        heatmap = {}
-
-    # Conversations (best-effort)
-    conversations: list[dict] = []
-    try:
-        conversations = query_conversations(
+    commits, enriched, sessions, heatmap, conversations = await asyncio.gather(
+        asyncio.to_thread(get_commits_by_date, since, until),
+        asyncio.to_thread(get_enriched_commits, since, until),
+        asyncio.to_thread(_safe, _empty_sessions, get_work_sessions, since, until),
+        # Heatmap is optional; may not be available in this codebase
+        asyncio.to_thread(_safe, dict, get_file_heatmap, since, until),
+        # Conversations (best-effort)
+        asyncio.to_thread(
+            _safe,
+            list,
+            query_conversations,
             {
                 "created_from": f"{date} 00:00:00",
                 "created_until": f"{date} 23:59:59",
                 "order_by": "updated_at",
                 "order": "desc",
-            }
-        )
-    except Exception:
-        conversations = []
+            },
+        ),
+    )
 
+    commit_list = commits if isinstance(commits, list) else []
+    heatmap = heatmap if isinstance(heatmap, dict) else {}
+    commit_count = _count_commits(commit_list)
     markdown = generate_rich_worklog(
         date=date,
-        commits=commits if isinstance(commits, list) else [],
+        commits=commit_list,
         conversations=conversations,
-        enriched_data=enriched if isinstance(enriched, dict) else None,
-        heatmap=heatmap if isinstance(heatmap, dict) else None,
-        sessions=sessions if isinstance(sessions, dict) else None,
+        enriched_data=enriched,
+        heatmap=heatmap,
+        sessions=sessions,
+        commit_count=commit_count,
     )
 
     meta: GenerateWorklogMetadata = {
-        "commit_count": len([c for c in (commits or []) if isinstance(c, dict) and c.get("hash")]),
+        "commit_count": commit_count,
         "conversation_count": len(conversations or []),
-        "files_touched": int((heatmap or {}).get("total_files_touched", 0))
-        if isinstance(heatmap, dict)
-        else 0,
+        "files_touched": int(heatmap.get("total_files_touched", 0)),
         "generated_at": datetime.now().isoformat(),
     }
 
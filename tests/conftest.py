@@ -1,7 +1,34 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure project root is importable when running tests directly
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_caches():
+    """Start every test with empty process-wide caches and no git workers running."""
+    from seev.config import _clear_caches
+    from seev.git_tools.analysis import clear_commit_cache
+    from seev.git_tools.commits import clear_git_log_cache
+    from seev.git_tools.config_tools import clear_git_config_cache
+    from seev.git_tools.git_daemon import close_workers
+    from seev.git_tools.utils import clear_repo_root_cache
+
+    _clear_caches()
+    clear_git_log_cache()
+    clear_repo_root_cache()
+    clear_commit_cache()
+    clear_git_config_cache()
+    close_workers()
+    yield
+    _clear_caches()
+    clear_git_log_cache()
+    clear_repo_root_cache()
+    clear_commit_cache()
+    clear_git_config_cache()
+    close_workers()
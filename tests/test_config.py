@@ -3,12 +3,14 @@
 import os
 import subprocess
 import tempfile
+import tomllib
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from seev.config import (
     _get_config_file_emails,
     _get_git_author_pattern,
+    clear_config_lookup_cache,
     create_config_file,
     get_tracked_emails,
     set_tracked_emails_env,
@@ -142,43 +144,124 @@ class TestCreateConfigFile:
 
 class TestGitAuthorPattern:
     def test_prefers_email_over_name(self):
-        """Should prefer git user.email over user.name."""
+        """Should prefer git user.email over user.name, reading both in one git call."""
         with patch("subprocess.run") as mock_run:
-            # First call (email) succeeds
-            mock_run.return_value.stdout = "user@example.com\n"
+            mock_run.return_value.stdout = "user.name John Doe\nuser.email user@example.com\n"
 
             result = _get_git_author_pattern()
             assert result == "user@example.com"
 
-            # Should only call git config for email, not name
             mock_run.assert_called_once_with(
-                ["git", "config", "--get", "user.email"],
+                ["git", "config", "--get-regexp", r"^user\.(email|name)$"],
                 capture_output=True,
                 text=True,
                 check=True,
             )
 
     def test_falls_back_to_name(self):
-        """Should fall back to git user.name when email fails."""
+        """Should fall back to git user.name when no email is configured."""
         with patch("subprocess.run") as mock_run:
-
-            def side_effect(cmd, **kwargs):
-                if "user.email" in cmd:
-                    raise subprocess.CalledProcessError(1, cmd)
-                else:  # user.name
-                    mock_result = Mock()
-                    mock_result.stdout = "John Doe\n"
-                    return mock_result
-
-            mock_run.side_effect = side_effect
+            mock_run.return_value.stdout = "user.name John Doe\n"
 
             result = _get_git_author_pattern()
             assert result == "John Doe"
 
+    def test_last_value_wins(self):
+        """A more specific config scope listed later overrides earlier values."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.stdout = (
+                "user.email global@example.com\nuser.email repo@example.com\n"
+            )
+
+            assert _get_git_author_pattern() == "repo@example.com"
+
     def test_returns_none_when_both_fail(self):
-        """Should return None when both email and name fail."""
+        """Should return None when neither key is set (git exits with status 1)."""
         with patch("subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, ["git"])
 
             result = _get_git_author_pattern()
             assert result is None
+
+    def test_result_is_cached_for_a_few_seconds(self):
+        """Lookups within the TTL reuse the answer; a later one asks git again."""
+        with patch("subprocess.run") as mock_run, patch("seev.config.time.monotonic") as clock:
+            clock.return_value = 100.0
+            mock_run.return_value.stdout = "user.email user@example.com\n"
+
+            assert _get_git_author_pattern() == "user@example.com"
+            assert _get_git_author_pattern() == "user@example.com"
+            assert mock_run.call_count == 1
+
+            mock_run.return_value.stdout = "user.email changed@example.com\n"
+            clock.return_value = 106.0
+            assert _get_git_author_pattern() == "changed@example.com"
+            assert mock_run.call_count == 2
+
+
+class TestConfigFileCache:
+    def test_reparses_only_after_file_changes(self):
+        """Parsed config is reused until the file's mtime/size change."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "seev.toml"
+            config_path.write_text('track_emails = ["a@example.com"]')
+
+            with patch("pathlib.Path.cwd", return_value=Path(tmpdir)):
+                with patch("pathlib.Path.home", return_value=Path(tmpdir) / "nonexistent"):
+                    with patch("seev.config.tomllib.load", wraps=tomllib.load) as load:
+                        assert _get_config_file_emails() == ["a@example.com"]
+                        assert _get_config_file_emails() == ["a@example.com"]
+                        assert load.call_count == 1
+
+                        config_path.write_text('track_emails = ["changed@example.com"]')
+                        # Lookups are reused for a few seconds; let that TTL lapse
+                        clear_config_lookup_cache()
+                        assert _get_config_file_emails() == ["changed@example.com"]
+                        assert load.call_count == 2
+
+    def test_merged_config_takes_first_non_empty_value_per_key(self):
+        """Keys missing from an earlier file are served from a later one."""
+        from seev.config import _get_config_file_repositories, _get_config_file_value
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cwd = Path(tmpdir) / "work"
+            cwd.mkdir()
+            (cwd / "seev.toml").write_text('db_path = "local.db"\ntrack_emails = []')
+            (Path(tmpdir) / ".seev.toml").write_text(
+                'db_path = "home.db"\ntrack_emails = ["home@example.com"]\n'
+                'track_repositories = ["owner/repo"]'
+            )
+
+            with patch("pathlib.Path.cwd", return_value=cwd):
+                with patch("pathlib.Path.home", return_value=Path(tmpdir)):
+                    assert _get_config_file_value("db_path") == "local.db"
+                    assert _get_config_file_emails() == ["home@example.com"]
+                    assert _get_config_file_repositories() == ["owner/repo"]
+                    assert _get_config_file_value("markdown_path") is None
+
+    def test_lookup_stats_each_location_once(self):
+        """A malformed file still counts as found, without a second existence check."""
+        from seev.config import _find_config_file
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / ".glin.toml"
+            config_path.write_text("not = [valid")
+
+            with patch("pathlib.Path.cwd", return_value=Path(tmpdir) / "work"):
+                with patch("pathlib.Path.home", return_value=Path(tmpdir)):
+                    with patch("seev.config.os.stat", wraps=os.stat) as stat:
+                        assert _find_config_file() == config_path
+                        assert stat.call_count == 6
+
+
+class TestResolveMarkdownPath:
+    def test_reports_env_source(self, monkeypatch):
+        """The env flag is only set when SEEV_MD_PATH actually supplied the path."""
+        from seev.config import _resolve_markdown_path
+
+        monkeypatch.setenv("SEEV_MD_PATH", " notes/LOG.md ")
+        assert _resolve_markdown_path() == ("notes/LOG.md", True)
+
+        monkeypatch.setenv("SEEV_MD_PATH", "   ")
+        with patch("seev.config._get_config_file_value", return_value=None):
+            assert _resolve_markdown_path() == ("WORKLOG.md", False)
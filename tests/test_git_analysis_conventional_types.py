@@ -22,3 +22,49 @@ def test_categorize_accepts_extended_types_case_insensitive():
         res = categorize_commit(msg)
         assert res["conventional"] is True, msg
         assert res["type"] == expected_type, msg
+
+
+def test_infer_language_uses_final_extension():
+    from seev.git_tools.analysis import _infer_language
+
+    assert _infer_language("src/App.TSX") == "TypeScript"
+    assert _infer_language("include/vec.hpp") == "C++"
+    assert _infer_language("lib.d/readme.md") == "Markdown"
+    assert _infer_language("pkg.py/Makefile") == "Other"
+    assert _infer_language("archive.tar.gz") == "Other"
+
+
+def test_combined_subject_regex_matches_separate_checks():
+    from seev.git_tools.analysis import _SUBJECT_RE, _categorize_subject, _merge_info
+
+    for subject in [
+        "Merge pull request #12 from me/side",
+        "fix(ci): Merge pull request #3 follow-up",
+        "feat!: breaking",
+        "Merge branch 'main'",
+        "plain subject",
+        "",
+    ]:
+        m = _SUBJECT_RE.match(subject)
+        assert _categorize_subject(subject, "h", m) == _categorize_subject(subject, "h")
+        parents = ["p1", "p2"]
+        assert _merge_info("h", parents, subject, m) == _merge_info("h", parents, subject)
+
+
+def test_known_type_regex_agrees_with_type_set():
+    from seev.git_tools.analysis import _CONVENTIONAL_RE, _CONVENTIONAL_TYPES
+
+    for subject in [
+        "fixed: longer type first",
+        "fix(parser): shorter type",
+        "FIXES: not a known type",
+        "testing: prefix of a type word",
+        "wibble(x): unknown type",
+        "Investigation!: loud",
+        "Update README",
+    ]:
+        res = categorize_commit(subject)
+        m = _CONVENTIONAL_RE.match(subject)
+        expected = bool(m) and m.group("type").lower() in _CONVENTIONAL_TYPES
+        assert res["conventional"] is expected
+        assert res["type"] == (m.group("type").lower() if m else "other")
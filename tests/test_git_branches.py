@@ -12,6 +12,11 @@ class Completed:
         self.stderr = stderr
 
 
+def git_log_output(*rows: str) -> str:
+    """Render ``hash|author|date|subject`` rows the way ``git log -z`` prints them."""
+    return "\x00".join(row.replace("|", "\x1f", 3) for row in rows)
+
+
 def make_run(outputs: list[tuple[list[str], Completed | Exception]]):
     """Return a fake subprocess.run that matches by command prefix."""
 
@@ -26,6 +31,25 @@ def make_run(outputs: list[tuple[list[str], Completed | Exception]]):
     return run
 
 
+def make_stream(outputs: list[tuple[list[str], Completed | Exception]]):
+    """Return a fake ``run_git_streaming`` that matches by command prefix, like ``make_run``."""
+
+    def run_git_streaming(args: list[str], repo_root: str | None = None, sep: str = "\n"):
+        cmd = ["git", "-C", repo_root, *args] if repo_root else ["git", *args]
+        for prefix, result in outputs:
+            if cmd[: len(prefix)] == prefix:
+                if isinstance(result, Exception):
+                    raise result
+                *records, tail = result.stdout.split(sep)
+                yield from records
+                if tail:
+                    yield tail
+                return
+        raise AssertionError(f"Unexpected command: {cmd}")
+
+    return run_git_streaming
+
+
 def test_get_current_branch_basic(monkeypatch):
     import subprocess
 
@@ -103,25 +127,18 @@ def test_list_branches_two(monkeypatch):
 
 
 def test_get_branch_commits_filtered(monkeypatch):
-    import subprocess
     from unittest.mock import patch
 
     log_ok = Completed(
-        stdout=(
-            "deadbeef|Alice|2024-01-01 12:00:00 +0000|on feature\n"
-            "cafebabe|Alice|2024-01-02 12:00:00 +0000|second\n"
+        stdout=git_log_output(
+            "deadbeef|Alice|2024-01-01 12:00:00 +0000|on feature",
+            "cafebabe|Alice|2024-01-02 12:00:00 +0000|second",
         )
     )
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["alice@example.com"]):
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (["git", "log"], log_ok),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming", make_stream([(["git", "log"], log_ok)])
         )
         commits = get_branch_commits("feature", count=2)
         assert len(commits) == 2
@@ -238,27 +255,21 @@ def test_list_branches_with_workdir(monkeypatch):
 
 
 def test_get_branch_commits_with_workdir(monkeypatch):
-    import subprocess
     from unittest.mock import patch
 
     monkeypatch.setattr("seev.git_tools.commits.resolve_repo_root", lambda p: {"path": "/repo"})
 
     log_ok = Completed(
-        stdout=(
-            "deadbeef|Alice|2024-01-01 12:00:00 +0000|on feature\n"
-            "cafebabe|Alice|2024-01-02 12:00:00 +0000|second\n"
+        stdout=git_log_output(
+            "deadbeef|Alice|2024-01-01 12:00:00 +0000|on feature",
+            "cafebabe|Alice|2024-01-02 12:00:00 +0000|second",
         )
     )
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["alice@example.com"]):
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (["git", "-C", "/repo", "log"], log_ok),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming",
+            make_stream([(["git", "-C", "/repo", "log"], log_ok)]),
         )
         from seev.git_tools.commits import get_branch_commits as _gbc
 
@@ -0,0 +1,69 @@
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from seev.git_tools import git_daemon
+
+
+def _git(repo, *args):
+    ident = ["-c", "user.name=T", "-c", "user.email=t@example.com"]
+    return subprocess.run(
+        ["git", "-C", str(repo), *ident, *args], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_read_commit_matches_git_log(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "root")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "--cleanup=verbatim", "-m", "\nfirst  \nsecond")
+    expected = _git(tmp_path, "log", "-1", "--format=%H %P%n%s").splitlines()
+
+    commit = git_daemon.read_commit(str(tmp_path), "HEAD")
+    assert [f"{commit.hash} {' '.join(commit.parents)}", commit.subject] == expected
+    assert commit.subject == "first second"
+
+    # Lookups reuse one process per repository, whichever thread makes them
+    (worker,) = git_daemon._workers.values()
+    assert git_daemon.read_commit(str(tmp_path), "HEAD~1").parents == []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        subjects = list(pool.map(lambda _: git_daemon.read_commit(str(tmp_path), "HEAD"), range(8)))
+    assert [c.subject for c in subjects] == ["first second"] * 8
+    assert list(git_daemon._workers.values()) == [worker]
+
+
+def test_read_commit_defers_to_git_when_unsure(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "root")
+    _git(tmp_path, "tag", "-a", "v1", "-m", "tag")
+    root = str(tmp_path)
+
+    assert git_daemon.read_commit(root, "f" * 40) is None
+    assert git_daemon.read_commit(root, "v1") is None  # an annotated tag object
+    assert git_daemon.read_commit(None, "HEAD") is None
+
+    # A dead worker is replaced on the next lookup
+    dead = git_daemon._workers[root]
+    dead.proc.kill()
+    dead.proc.wait()
+    assert git_daemon.read_commit(root, "HEAD") is None
+    assert git_daemon.read_commit(root, "HEAD").subject == "root"
+    worker = git_daemon._workers[root]
+    assert worker is not dead
+
+    git_daemon.close_workers()
+    assert not git_daemon._workers
+    assert worker.proc.poll() is not None
+
+
+def test_least_recently_used_worker_is_closed(tmp_path, monkeypatch):
+    monkeypatch.setattr(git_daemon, "_MAX_WORKERS", 1)
+    repos = [tmp_path / "a", tmp_path / "b"]
+    for repo in repos:
+        _git(tmp_path, "init", "-q", str(repo))
+        _git(repo, "commit", "-q", "--allow-empty", "-m", repo.name)
+
+    assert git_daemon.read_commit(str(repos[0]), "HEAD").subject == "a"
+    first = git_daemon._workers[str(repos[0])]
+    assert git_daemon.read_commit(str(repos[1]), "HEAD").subject == "b"
+
+    assert list(git_daemon._workers) == [str(repos[1])]
+    assert first.proc.poll() is not None
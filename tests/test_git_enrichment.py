@@ -62,9 +62,19 @@ def test_get_enriched_commits_success_with_workdir(monkeypatch):
         return {"is_merge": False, "parents": [commit_hash]}
 
     monkeypatch.setattr("seev.git_tools.enrichment.get_commits_by_date", fake_get_commits_by_date)
-    monkeypatch.setattr("seev.git_tools.enrichment.get_commit_statistics", fake_stats)
-    monkeypatch.setattr("seev.git_tools.enrichment.categorize_commit", fake_category)
-    monkeypatch.setattr("seev.git_tools.enrichment.detect_merge_info", fake_merge_info)
+
+    def fake_analyze_commits(hashes: list[str], workdir: str | None = None):
+        return [
+            {
+                "hash": sha,
+                "statistics": fake_stats(sha, workdir),
+                "category": fake_category(sha, True, workdir),
+                "merge_info": fake_merge_info(sha, workdir),
+            }
+            for sha in hashes
+        ]
+
+    monkeypatch.setattr("seev.git_tools.enrichment.analyze_commits", fake_analyze_commits)
 
     res = get_enriched_commits("/work/repo", "yesterday", "now")
     # Expect a structured EnrichedResult object
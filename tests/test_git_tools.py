@@ -16,14 +16,45 @@ from seev.git_tools.diffs import get_commit_diff
 from seev.git_tools.files import get_commit_files
 
 
+def git_log_output(*rows: str) -> str:
+    """Render ``hash|author|date|subject`` rows the way ``git log -z`` prints them."""
+    return "\x00".join(row.replace("|", "\x1f", 3) for row in rows)
+
+
+def git_show_output(metadata: "Completed", statuses: "Completed", numstats: "Completed"):
+    """Render metadata, ``--name-status`` and ``--numstat`` outputs as one ``git show -z``.
+
+    Matches ``git show -z --raw --numstat`` with the unit-separated pretty format.
+    """
+    raw = ""
+    renames: dict[str, str] = {}
+    for line in filter(None, statuses.stdout.splitlines()):
+        status, *paths = line.split("\t")
+        raw += f":100644 100644 0000000 1111111 {status}\0" + "".join(p + "\0" for p in paths)
+        if len(paths) == 2:
+            renames[paths[1]] = paths[0]
+    numstat = ""
+    for line in filter(None, numstats.stdout.splitlines()):
+        added, deleted, path = line.split("\t")
+        if path in renames:
+            numstat += f"{added}\t{deleted}\t\0{renames[path]}\0{path}\0"
+        else:
+            numstat += line + "\0"
+    header = metadata.stdout.replace("|", "\x1f", 4)
+    if not (raw or numstat):
+        return Completed(stdout=header)
+    return Completed(stdout=header + ("\n" + raw if raw else "\0") + numstat)
+
+
 class FakeCPError(Exception):
     pass
 
 
 class Completed:
-    def __init__(self, stdout: str = "", stderr: str = "") -> None:
+    def __init__(self, stdout: str = "", stderr: str = "", returncode: int = 0) -> None:
         self.stdout = stdout
         self.stderr = stderr
+        self.returncode = returncode
 
 
 def make_run(outputs: list[tuple[list[str], Completed | Exception]]):
@@ -45,6 +76,34 @@ def make_run(outputs: list[tuple[list[str], Completed | Exception]]):
     return run
 
 
+def make_stream(outputs: list[tuple[list[str], Completed | Exception]]):
+    """Return a fake ``run_git_streaming`` that matches by command prefix, like ``make_run``.
+
+    A ``Completed`` with a non-zero ``returncode`` yields its records and then raises
+    ``CalledProcessError``, as git failing after writing some output would.
+    """
+    import subprocess
+
+    def run_git_streaming(args: list[str], repo_root: str | None = None, sep: str = "\n"):
+        cmd = ["git", "-C", repo_root, *args] if repo_root else ["git", *args]
+        for prefix, result in outputs:
+            if cmd[: len(prefix)] == prefix:
+                if isinstance(result, Exception):
+                    raise result
+                *records, tail = result.stdout.split(sep)
+                yield from records
+                if tail:
+                    yield tail
+                if result.returncode:
+                    raise subprocess.CalledProcessError(
+                        result.returncode, cmd, stderr=result.stderr
+                    )
+                return
+        raise AssertionError(f"Unexpected command: {cmd}")
+
+    return run_git_streaming
+
+
 def test_get_author_filters_from_config(monkeypatch):
     """Test that _get_author_filters uses the configuration system."""
     from unittest.mock import patch
@@ -66,25 +125,18 @@ def test_get_author_filters_empty_when_no_config(monkeypatch):
 
 
 def test_get_recent_commits_parses_output(monkeypatch):
-    import subprocess
     from unittest.mock import patch
 
     log_ok = Completed(
-        stdout=(
-            "deadbeef|Alice|2024-01-01 12:00:00 +0000|msg1\n"
-            "cafebabe|Bob|2024-01-02 13:00:00 +0000|feat: add stuff\n"
+        stdout=git_log_output(
+            "deadbeef|Alice|2024-01-01 12:00:00 +0000|msg1",
+            "cafebabe|Bob|2024-01-02 13:00:00 +0000|feat: add stuff",
         )
     )
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (["git", "log"], log_ok),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming", make_stream([(["git", "log"], log_ok)])
         )
 
         commits = get_recent_commits(2)
@@ -103,38 +155,27 @@ def test_get_recent_commits_no_author_config(monkeypatch):
 
 
 def test_get_commits_by_date_parses_and_empty_info(monkeypatch):
-    import subprocess
     from unittest.mock import patch
 
     # First run: no commits; Second run: two commits
     log_empty = Completed(stdout="\n")
     log_two = Completed(
-        stdout=("a1|A|2024-01-01 00:00:00 +0000|one\nb2|B|2024-01-02 00:00:00 +0000|two\n")
+        stdout=git_log_output(
+            "a1|A|2024-01-01 00:00:00 +0000|one", "b2|B|2024-01-02 00:00:00 +0000|two"
+        )
     )
 
     # Empty result case
     with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (["git", "log"], log_empty),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming", make_stream([(["git", "log"], log_empty)])
         )
         res_empty = get_commits_by_date("", "yesterday", "now")
         assert res_empty and res_empty[0].get("info") == "No commits found in date range"
 
         # Success case with two commits
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (["git", "log"], log_two),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming", make_stream([(["git", "log"], log_two)])
         )
         res = get_commits_by_date("", "1 week ago", "now")
         assert len(res) == 2
@@ -152,13 +193,7 @@ def test_get_commits_handles_subprocess_error(monkeypatch):
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (["git", "log"], cp_err),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming", make_stream([(["git", "log"], cp_err)])
         )
 
         res = get_recent_commits(3)
@@ -166,14 +201,12 @@ def test_get_commits_handles_subprocess_error(monkeypatch):
 
 
 def test_get_recent_commits_handles_general_exception(monkeypatch):
-    import subprocess
     from unittest.mock import patch
 
-    def failing_run(*args, **kwargs):
-        raise RuntimeError("Something went wrong")
+    failing_stream = make_stream([(["git"], RuntimeError("Something went wrong"))])
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
-        monkeypatch.setattr(subprocess, "run", failing_run)
+        monkeypatch.setattr("seev.git_tools.commits.run_git_streaming", failing_stream)
 
         res = get_recent_commits(3)
         assert res and "error" in res[0]
@@ -190,28 +223,44 @@ def test_get_commits_by_date_handles_subprocess_error(monkeypatch):
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (["git", "log"], cp_err),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming", make_stream([(["git", "log"], cp_err)])
         )
 
         res = get_commits_by_date("", "yesterday", "now")
         assert res and "error" in res[0]
 
 
+def test_get_recent_commits_reports_git_failing_after_partial_output(monkeypatch):
+    from unittest.mock import patch
+
+    partial = Completed(
+        stdout=git_log_output("deadbeef|Alice|2024-01-01 12:00:00 +0000|msg1") + "\x00",
+        stderr="fatal: bad object",
+        returncode=128,
+    )
+    ok = Completed(stdout=git_log_output("deadbeef|Alice|2024-01-01 12:00:00 +0000|msg1"))
+
+    with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
+        monkeypatch.setattr(
+            "seev.git_tools.commits.run_git_streaming", make_stream([(["git", "log"], partial)])
+        )
+        res = get_recent_commits(3)
+        assert res == [{"error": "Git command failed: fatal: bad object"}]
+
+        # The records git wrote before failing were not cached as the result
+        monkeypatch.setattr(
+            "seev.git_tools.commits.run_git_streaming", make_stream([(["git", "log"], ok)])
+        )
+        assert get_recent_commits(3)[0]["hash"] == "deadbeef"
+
+
 def test_get_commits_by_date_handles_general_exception(monkeypatch):
-    import subprocess
     from unittest.mock import patch
 
-    def failing_run(*args, **kwargs):
-        raise RuntimeError("Something went wrong")
+    failing_stream = make_stream([(["git"], RuntimeError("Something went wrong"))])
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
-        monkeypatch.setattr(subprocess, "run", failing_run)
+        monkeypatch.setattr("seev.git_tools.commits.run_git_streaming", failing_stream)
 
         res = get_commits_by_date("", "yesterday", "now")
         assert res and "error" in res[0]
@@ -542,9 +591,10 @@ D\told_file.py
         "run",
         make_run(
             [
-                (["git", "show", "--no-patch"], metadata_output),
-                (["git", "show", "--name-status"], status_output),
-                (["git", "show", "--numstat"], numstat_output),
+                (
+                    ["git", "show", "-z", "--raw", "--numstat"],
+                    git_show_output(metadata_output, status_output, numstat_output),
+                ),
             ]
         ),
     )
@@ -601,9 +651,10 @@ def test_get_commit_files_with_rename(monkeypatch):
         "run",
         make_run(
             [
-                (["git", "show", "--no-patch"], metadata_output),
-                (["git", "show", "--name-status"], status_output),
-                (["git", "show", "--numstat"], numstat_output),
+                (
+                    ["git", "show", "-z", "--raw", "--numstat"],
+                    git_show_output(metadata_output, status_output, numstat_output),
+                ),
             ]
         ),
     )
@@ -638,9 +689,10 @@ def test_get_commit_files_with_binary(monkeypatch):
         "run",
         make_run(
             [
-                (["git", "show", "--no-patch"], metadata_output),
-                (["git", "show", "--name-status"], status_output),
-                (["git", "show", "--numstat"], numstat_output),
+                (
+                    ["git", "show", "-z", "--raw", "--numstat"],
+                    git_show_output(metadata_output, status_output, numstat_output),
+                ),
             ]
         ),
     )
@@ -669,9 +721,10 @@ def test_get_commit_files_with_workdir(monkeypatch):
         "run",
         make_run(
             [
-                (["git", "-C", "/repo", "show", "--no-patch"], metadata_output),
-                (["git", "-C", "/repo", "show", "--name-status"], status_output),
-                (["git", "-C", "/repo", "show", "--numstat"], numstat_output),
+                (
+                    ["git", "-C", "/repo", "show", "-z", "--raw", "--numstat"],
+                    git_show_output(metadata_output, status_output, numstat_output),
+                ),
             ]
         ),
     )
@@ -696,9 +749,10 @@ def test_get_commit_files_with_workdir(monkeypatch):
         "run",
         make_run(
             [
-                (["git", "show", "--no-patch"], metadata_output),
-                (["git", "show", "--name-status"], status_output),
-                (["git", "show", "--numstat"], numstat_output),
+                (
+                    ["git", "show", "-z", "--raw", "--numstat"],
+                    git_show_output(metadata_output, status_output, numstat_output),
+                ),
             ]
         ),
     )
@@ -717,18 +771,48 @@ def test_get_commit_files_with_workdir(monkeypatch):
     assert binary_file["deletions"] == 0
 
 
+def test_get_commit_files_real_repo_renames_and_odd_paths(tmp_path):
+    """One `git show -z` call reports renames and unquoted paths from a real repository."""
+    import subprocess
+
+    def git(*args):
+        ident = ["-c", "user.name=Pat", "-c", "user.email=p|q@example.com"]
+        return subprocess.run(
+            ["git", "-C", str(tmp_path), *ident, *args], check=True, capture_output=True, text=True
+        ).stdout
+
+    git("init", "-q")
+    (tmp_path / "old.txt").write_text("a\nb\nc\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "root")
+    git("mv", "old.txt", "new.txt")
+    (tmp_path / "tab\tname.py").write_text("x\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "move | add")
+
+    result = get_commit_files("HEAD", workdir=str(tmp_path))
+
+    assert (result["author"], result["email"]) == ("Pat", "p|q@example.com")
+    assert result["message"] == "move | add"
+    assert sorted((f["path"], f["status"], f["old_path"]) for f in result["files"]) == [
+        ("new.txt", "R", "old.txt"),
+        ("tab\tname.py", "A", None),
+    ]
+    assert result["total_additions"] == 1
+
+
 def test_get_commit_files_not_found(monkeypatch):
     """Test commit files when commit doesn't exist."""
     import subprocess
 
-    metadata_output = Completed(stdout="")
+    show_output = Completed(stdout="")
 
     monkeypatch.setattr(
         subprocess,
         "run",
         make_run(
             [
-                (["git", "show", "--no-patch"], metadata_output),
+                (["git", "show", "-z"], show_output),
             ]
         ),
     )
@@ -768,14 +852,14 @@ def test_get_commit_files_parse_error(monkeypatch):
     import subprocess
 
     # Malformed metadata (missing fields)
-    metadata_output = Completed(stdout="abc123|Alice")
+    show_output = Completed(stdout="abc123\x1fAlice")
 
     monkeypatch.setattr(
         subprocess,
         "run",
         make_run(
             [
-                (["git", "show", "--no-patch"], metadata_output),
+                (["git", "show", "-z"], show_output),
             ]
         ),
     )
@@ -813,7 +897,11 @@ def test_build_git_log_command_basic():
         "log",
         "-10",
         "--author=user@example.com",
-        "--pretty=format:%H|%an|%ai|%s",
+        "--no-color",
+        "--no-decorate",
+        "--no-notes",
+        "-z",
+        "--pretty=format:%H%x1f%an%x1f%ai%x1f%s",
     ]
 
 
@@ -829,10 +917,69 @@ def test_build_git_log_command_multiple_authors():
         "log",
         "--since=yesterday",
         "--until=now",
-        "--author=user1@example.com",
-        "--author=user2@example.com",
-        "--pretty=format:%H|%an|%ai|%s",
+        "--extended-regexp",
+        "--author=user1@example.com|user2@example.com",
+        "--no-color",
+        "--no-decorate",
+        "--no-notes",
+        "-z",
+        "--pretty=format:%H%x1f%an%x1f%ai%x1f%s",
+    ]
+
+
+def test_split_log_result_buckets_by_first_entry():
+    from seev.git_tools.commits import _split_log_result
+
+    commits = [{"hash": "a", "author": "A", "date": "d", "message": "m"}]
+    assert _split_log_result(commits) == (commits, None)
+    assert _split_log_result([{"error": "boom"}]) == ([], "boom")
+    assert _split_log_result([{"info": "nothing"}]) == ([], None)
+    assert _split_log_result([]) == ([], None)
+
+
+def test_build_git_log_command_keeps_author_patterns_separate():
+    """Values written as regex patterns keep their own --author (basic regex syntax)."""
+    from seev.git_tools.commits import _redacted_author_args
+
+    cmd = _build_git_log_command(["-5"], ["^Jane", "a+b@example.com"])
+    assert cmd[3:5] == ["--author=^Jane", "--author=a+b@example.com"]
+
+    authors = ["a+b@example.com", "Jo (dev)"]
+    assert _build_git_log_command(["-5"], authors)[3:5] == [
+        "--extended-regexp",
+        "--author=a\\+b@example.com|Jo \\(dev\\)",
     ]
+    assert _redacted_author_args(authors) == ["--extended-regexp", "--author=<2 authors>"]
+    assert _redacted_author_args(["^Jane", "x"]) == ["--author=^Jane", "--author=<2 authors>"]
+
+
+def test_combined_author_filter_matches_separate_flags(tmp_path):
+    """The single extended-regex --author selects the same commits as one flag per value."""
+    import subprocess
+
+    def git(*args):
+        return subprocess.run(
+            ["git", "-C", str(tmp_path), *args], check=True, capture_output=True, text=True
+        ).stdout
+
+    git("init", "-q")
+    people = [
+        ("A", "a.b+x@example.com"),
+        ("B", "aXb+x@example.com"),
+        ("Jo (dev)", "jo@x.io"),
+        ("C", "c|d@x.io"),
+        ("D", "d@x.io"),
+    ]
+    for name, email in people:
+        ident = ["-c", f"user.name={name}", "-c", f"user.email={email}"]
+        git(*ident, "commit", "-q", "--allow-empty", "-m", name)
+
+    for authors in (["a.b+x@example.com", "Jo (dev)"], ["c|d@x.io", "B"], ["{1}", "D"]):
+        separate = git("log", "--format=%an", *[f"--author={a}" for a in authors])
+        cmd = _build_git_log_command([], authors)
+        assert cmd[2] == "--extended-regexp"
+        combined = git("log", "--format=%an", *cmd[2:-2])
+        assert combined == separate != ""
 
 
 def test_build_git_log_command_no_authors():
@@ -842,12 +989,21 @@ def test_build_git_log_command_no_authors():
 
     cmd = _build_git_log_command(base_args, author_filters)
 
-    assert cmd == ["git", "log", "-5", "--pretty=format:%H|%an|%ai|%s"]
+    assert cmd == [
+        "git",
+        "log",
+        "-5",
+        "--no-color",
+        "--no-decorate",
+        "--no-notes",
+        "-z",
+        "--pretty=format:%H%x1f%an%x1f%ai%x1f%s",
+    ]
 
 
 def test_parse_commit_lines_single():
     """Test parsing single commit line."""
-    output = "abc123|Alice Author|2024-01-01 12:00:00 +0000|feat: add feature"
+    output = git_log_output("abc123|Alice Author|2024-01-01 12:00:00 +0000|feat: add feature")
 
     commits = _parse_commit_lines(output)
 
@@ -860,10 +1016,10 @@ def test_parse_commit_lines_single():
 
 def test_parse_commit_lines_multiple():
     """Test parsing multiple commit lines."""
-    output = (
-        "abc123|Alice|2024-01-01 12:00:00 +0000|feat: add feature\n"
-        "def456|Bob|2024-01-02 13:00:00 +0000|fix: bug fix\n"
-        "ghi789|Charlie|2024-01-03 14:00:00 +0000|docs: update readme"
+    output = git_log_output(
+        "abc123|Alice|2024-01-01 12:00:00 +0000|feat: add feature",
+        "def456|Bob|2024-01-02 13:00:00 +0000|fix: bug fix",
+        "ghi789|Charlie|2024-01-03 14:00:00 +0000|docs: update readme",
     )
 
     commits = _parse_commit_lines(output)
@@ -876,7 +1032,7 @@ def test_parse_commit_lines_multiple():
 
 def test_parse_commit_lines_with_pipe_in_message():
     """Test parsing commit with pipe character in message."""
-    output = "abc123|Alice|2024-01-01 12:00:00 +0000|feat: add feature | with pipe"
+    output = git_log_output("abc123|Alice|2024-01-01 12:00:00 +0000|feat: add feature | with pipe")
 
     commits = _parse_commit_lines(output)
 
@@ -884,6 +1040,26 @@ def test_parse_commit_lines_with_pipe_in_message():
     assert commits[0]["message"] == "feat: add feature | with pipe"
 
 
+def test_parse_commit_lines_skips_empty_records():
+    """Empty records and a trailing separator do not produce commits."""
+    output = git_log_output("abc123|Alice|2024-01-01 12:00:00 +0000|feat: one", "") + (
+        "\x00def456\x1fBob\x1f2024-01-02\x1ffix: two\x00"
+    )
+
+    commits = _parse_commit_lines(output)
+
+    assert [c["hash"] for c in commits] == ["abc123", "def456"]
+    assert commits[1]["message"] == "fix: two"
+
+
+def test_parse_commit_lines_rejects_malformed_line():
+    """A line without all four fields is reported instead of half-parsed."""
+    import pytest
+
+    with pytest.raises(ValueError):
+        _parse_commit_lines(git_log_output("abc123|Alice|only-three-fields"))
+
+
 def test_parse_commit_lines_empty():
     """Test parsing empty output."""
     output = ""
@@ -962,6 +1138,41 @@ def test_check_git_config_not_exists(monkeypatch):
     assert result is False
 
 
+def test_check_git_config_reuses_recent_answers(monkeypatch):
+    """Repeated checks of the same key within the TTL spawn git once."""
+    import subprocess
+
+    calls = []
+
+    def mock_run(cmd, **kwargs):
+        calls.append(cmd)
+        return Completed(stdout="user@example.com\n")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    assert _check_git_config("user.email") and _check_git_config("user.email")
+    assert _check_git_config("user.name")
+    assert len(calls) == 2
+
+
+def test_configure_file_is_seen_by_cached_lookups(monkeypatch, tmp_path):
+    """Writing a config file through the tool invalidates the cached lookup."""
+    from pathlib import Path
+
+    from seev.config import get_tracked_emails
+    from seev.git_tools.config_tools import configure_tracked_emails
+
+    monkeypatch.delenv("SEEV_TRACK_EMAILS", raising=False)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    monkeypatch.setattr("seev.config._get_git_author_pattern", lambda: None)
+
+    assert get_tracked_emails() == []
+    assert configure_tracked_emails(["new@example.com"], method="file")["success"]
+    assert get_tracked_emails() == ["new@example.com"]
+    assert _get_config_source().startswith("config_file")
+
+
 def test_get_config_source_environment(monkeypatch):
     """Test config source detection from environment variable."""
     monkeypatch.setenv("SEEV_TRACK_EMAILS", "user@example.com")
@@ -1068,9 +1279,10 @@ def test_get_commit_files_empty_commit(monkeypatch):
         "run",
         make_run(
             [
-                (["git", "show", "--no-patch"], metadata_output),
-                (["git", "show", "--name-status"], status_output),
-                (["git", "show", "--numstat"], numstat_output),
+                (
+                    ["git", "show", "-z", "--raw", "--numstat"],
+                    git_show_output(metadata_output, status_output, numstat_output),
+                ),
             ]
         ),
     )
@@ -1086,7 +1298,6 @@ def test_get_commit_files_empty_commit(monkeypatch):
 
 def test_get_commits_by_date_normalizes_single_iso_date(monkeypatch):
     """When since is an ISO date and until is default, normalize to previous day.."""
-    import subprocess
     from unittest.mock import patch
 
     # Expectation: since=2025-10-10, until=2025-10-11 when input is since="2025-10-11"
@@ -1094,21 +1305,8 @@ def test_get_commits_by_date_normalizes_single_iso_date(monkeypatch):
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (
-                        [
-                            "git",
-                            "log",
-                            "--since=2025-10-10",
-                            "--until=2025-10-11",
-                        ],
-                        log_empty,
-                    ),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming",
+            make_stream([(["git", "log", "--since=2025-10-10", "--until=2025-10-11"], log_empty)]),
         )
         res = get_commits_by_date("", "2025-10-11")
         assert res and res[0].get("info") == "No commits found in date range"
@@ -1116,28 +1314,546 @@ def test_get_commits_by_date_normalizes_single_iso_date(monkeypatch):
 
 def test_get_commits_by_date_no_normalize_with_explicit_until(monkeypatch):
     """If until is provided explicitly, do not shift dates."""
-    import subprocess
     from unittest.mock import patch
 
     log_empty = Completed(stdout="\n")
 
     with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
         monkeypatch.setattr(
-            subprocess,
-            "run",
-            make_run(
-                [
-                    (
-                        [
-                            "git",
-                            "log",
-                            "--since=2025-10-11",
-                            "--until=2025-10-12",
-                        ],
-                        log_empty,
-                    ),
-                ]
-            ),
+            "seev.git_tools.commits.run_git_streaming",
+            make_stream([(["git", "log", "--since=2025-10-11", "--until=2025-10-12"], log_empty)]),
         )
         res = get_commits_by_date("", "2025-10-11", "2025-10-12")
         assert res and res[0].get("info") == "No commits found in date range"
+
+
+def test_parse_commit_date_reads_git_author_dates():
+    from datetime import datetime, timedelta, timezone
+
+    import pytest
+
+    from seev.git_tools import parse_commit_date
+
+    tz = timezone(timedelta(hours=2))
+    assert parse_commit_date("2025-10-09 12:00:00 +0200") == datetime(2025, 10, 9, 12, tzinfo=tz)
+    assert parse_commit_date("2025-10-09T12:00:00").tzinfo is None
+    with pytest.raises(ValueError):
+        parse_commit_date("yesterday")
+
+
+def test_degenerate_queries_skip_git(monkeypatch):
+    """A zero count or an inverted ISO date range answers without running git."""
+    import subprocess
+    from unittest.mock import patch
+
+    monkeypatch.setattr(subprocess, "run", make_run([]))
+    with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
+        assert get_recent_commits(0) == [{"info": "No recent commits found"}]
+        res = get_commits_by_date("", "2025-10-12", "2025-10-11")
+        assert res == [{"info": "No commits found in date range"}]
+        # Each response gets its own entry, so annotating one leaves later ones intact
+        first = get_recent_commits(0)[0]
+        first["repository"] = "annotated"
+        assert get_recent_commits(0) == [{"info": "No recent commits found"}]
+    # Configuration problems are still reported first
+    with patch("seev.git_tools.get_tracked_emails", return_value=[]):
+        assert "error" in get_recent_commits(0)[0]
+
+
+def test_git_log_results_cached_until_repo_changes(monkeypatch, tmp_path):
+    import os
+    from unittest.mock import patch
+
+    git_dir = tmp_path / ".git"
+    (git_dir / "logs").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    reflog = git_dir / "logs" / "HEAD"
+    reflog.write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    calls = []
+    log_ok = Completed(stdout=git_log_output("deadbeef|Alice|2024-01-01 12:00:00 +0000|msg1"))
+    stream = make_stream([(["git", "log"], log_ok)])
+
+    def run_git_streaming(args, **kwargs):
+        calls.append(args)
+        return stream(args, **kwargs)
+
+    with patch("seev.git_tools.get_tracked_emails", return_value=["me@example.com"]):
+        monkeypatch.setattr("seev.git_tools.commits.run_git_streaming", run_git_streaming)
+
+        first = get_recent_commits(1)
+        first[0]["message"] = "mutated by caller"
+        second = get_recent_commits(1)
+        assert len(calls) == 1
+        assert second[0]["message"] == "msg1"
+
+        # A new commit touches the HEAD reflog and invalidates the cached result
+        st = reflog.stat()
+        os.utime(reflog, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        get_recent_commits(1)
+        assert len(calls) == 2
+
+
+def test_branch_queries_see_refs_that_move_without_head(monkeypatch, tmp_path):
+    import subprocess
+
+    from seev.git_tools.commits import get_branch_commits
+
+    def git(*args):
+        ident = ["-c", "user.name=Dev", "-c", "user.email=dev@example.com"]
+        subprocess.run(["git", "-C", str(tmp_path), *ident, *args], check=True, capture_output=True)
+
+    git("init", "-q")
+    git("commit", "-q", "--allow-empty", "-m", "first")
+    git("branch", "other")
+    git("commit", "-q", "--allow-empty", "-m", "second")
+    monkeypatch.setenv("SEEV_TRACK_EMAILS", "dev@example.com")
+
+    assert get_branch_commits("other", 1, workdir=str(tmp_path))[0]["message"] == "first"
+    # Moves refs/heads/other only; HEAD and its reflog are untouched
+    git("branch", "-f", "other", "HEAD")
+    assert get_branch_commits("other", 1, workdir=str(tmp_path))[0]["message"] == "second"
+
+
+def test_author_matcher_falls_back_to_literal():
+    from seev.git_tools.commits import _author_matcher
+
+    assert _author_matcher("me@example.com").search("Me <me@example.com>")
+    # Invalid regex (as configured by a user) is matched literally instead of raising
+    assert _author_matcher("c++[").search("c++[ <x@y>")
+
+
+def test_pygit2_backend_matches_git_log(monkeypatch, tmp_path):
+    import os
+    import subprocess
+
+    import pytest
+
+    pytest.importorskip("pygit2")
+    import seev.git_tools.commits as commits_mod
+    from seev.git_tools.commits import clear_git_log_cache, get_branch_commits
+
+    def git(*args, when=None):
+        ident = ["-c", "user.name=T", "-c", "user.email=t@example.com"]
+        env = {**os.environ, "GIT_AUTHOR_DATE": when, "GIT_COMMITTER_DATE": when} if when else None
+        subprocess.run(
+            ["git", "-C", str(tmp_path), *ident, *args], check=True, capture_output=True, env=env
+        )
+
+    authors = ["Alice <alice+git@example.com>", "Bob <b@example.com>", "Carol <c@example.org>"]
+    messages = ["fix  two spaces", "\nleading blank\nwrapped  ", "subject\n\nbody", "tab\there"]
+    git("init", "-q", "-b", "main")
+    for i in range(8):
+        git(
+            "commit", "-q", "--allow-empty", "--cleanup=verbatim", f"--author={authors[i % 3]}",
+            "-m", messages[i % 4], when=f"2024-01-0{i + 1}T12:00:00+05:30",
+        )  # fmt: skip
+    # A side branch whose tip is older (in UTC) than its parent, merged back into main
+    git("checkout", "-q", "-b", "side", "HEAD~3")
+    git("commit", "-q", "--allow-empty", "-m", "side work", when="2024-01-04T18:00:00-0800")
+    git("checkout", "-q", "main")
+    git("merge", "-q", "--no-ff", "-m", "merge side", "side", when="2024-01-10T09:00:00+0000")
+
+    def run_queries():
+        clear_git_log_cache()
+        return [
+            get_recent_commits(5, workdir=str(tmp_path)),
+            get_recent_commits(50, workdir=str(tmp_path)),
+            get_branch_commits("side", 3, workdir=str(tmp_path)),
+            get_commits_by_date(str(tmp_path), "2024-01-01", "2024-01-31"),
+        ]
+
+    run_git_log = commits_mod._run_git_log
+    git_calls = []
+
+    def spy(cmd, repo_root):
+        git_calls.append(cmd)
+        return run_git_log(cmd, repo_root)
+
+    monkeypatch.setattr(commits_mod, "_run_git_log", spy)
+    for emails in (
+        ["alice+git@example.com"],
+        ["alice+git@example.com", "b@example.com"],
+        ["C", "t@example"],
+    ):
+        monkeypatch.setattr("seev.git_tools.get_tracked_emails", lambda emails=emails: emails)
+        monkeypatch.delenv("SEEV_GIT_BACKEND", raising=False)
+        expected = run_queries()
+        assert all(len(result) > 1 and "hash" in result[0] for result in expected)
+
+        monkeypatch.setenv("SEEV_GIT_BACKEND", "pygit2")
+        git_calls.clear()
+        assert run_queries() == expected
+        # Only the date-range query, which the backend doesn't handle, runs git
+        assert len(git_calls) == 1 and any(a.startswith("--since=") for a in git_calls[0])
+
+
+def test_recent_commits_for_repositories_merges_newest_first(monkeypatch, tmp_path):
+    import os
+    import subprocess
+
+    from seev.git_tools import get_recent_commits_for_repositories
+
+    def make_repo(name, dates):
+        repo = tmp_path / name
+        repo.mkdir()
+        ident = ["-c", "user.name=T", "-c", "user.email=t@example.com"]
+        subprocess.run(["git", "-C", str(repo), "init", "-q"], check=True, capture_output=True)
+        for i, when in enumerate(dates):
+            subprocess.run(
+                ["git", "-C", str(repo), *ident, "commit", "-q", "--allow-empty"]
+                + [f"--date={when}", "-m", f"{name}{i}"],
+                check=True,
+                capture_output=True,
+                env={**os.environ, "GIT_COMMITTER_DATE": when},
+            )
+        return str(repo)
+
+    a = make_repo("a", ["2024-01-01T10:00:00+00:00", "2024-01-03T10:00:00+00:00"])
+    b = make_repo("b", ["2024-01-02T10:00:00+00:00"])
+
+    monkeypatch.setattr("seev.git_tools.get_tracked_emails", lambda: ["t@example.com"])
+    monkeypatch.setattr(
+        "seev.git_tools.get_tracked_repositories", lambda: [a, b, "owner/remote-only"]
+    )
+
+    result = get_recent_commits_for_repositories(count=2)
+    assert [(c["message"], c["repository"]) for c in result] == [("a1", a), ("b0", b)]
+
+    assert get_recent_commits_for_repositories(repositories=["owner/remote-only"]) == [
+        {"info": "No local tracked repositories configured"}
+    ]
+
+
+def test_commit_statistics_streams_numstat(tmp_path):
+    import subprocess
+
+    from seev.git_tools.analysis import get_commit_statistics
+
+    def git(*args):
+        ident = ["-c", "user.name=T", "-c", "user.email=t@example.com"]
+        return subprocess.run(
+            ["git", "-C", str(tmp_path), *ident, *args], check=True, capture_output=True, text=True
+        ).stdout
+
+    git("init", "-q")
+    (tmp_path / "a.py").write_text("x = 1\ny = 2\n")
+    (tmp_path / "notes.md").write_text("hi\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "add files")
+    sha = git("rev-parse", "HEAD").strip()
+
+    stats = get_commit_statistics(sha, workdir=str(tmp_path))
+    assert stats["additions"] == 3 and stats["files_changed"] == 2
+    assert stats["by_language"]["Python"] == {"additions": 2, "deletions": 0, "files": 1}
+
+    missing = get_commit_statistics("0" * 40, workdir=str(tmp_path))
+    assert missing["error"].startswith("Git command failed: fatal:")
+
+
+def test_blame_file_parses_line_porcelain(tmp_path):
+    import subprocess
+
+    from seev.git_tools.analysis import blame_file
+
+    ident = ["-c", "user.name=Ann", "-c", "user.email=ann@example.com"]
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    (tmp_path / "f.py").write_text("a = 1\n\tb = 2\n")
+    subprocess.run(["git", "-C", str(tmp_path), "add", "f.py"], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), *ident, "commit", "-q", "-m", "first"], check=True)
+
+    res = blame_file("f.py", workdir=str(tmp_path))
+    entries = res["entries"]
+    assert [e["code"] for e in entries] == ["a = 1", "\tb = 2"]
+    assert entries[1]["final_line"] == 2
+    assert {e["author"] for e in entries} == {"Ann"}
+    assert entries[0]["author_mail"] == "ann@example.com"
+    assert entries[0]["summary"] == "first"
+    assert isinstance(entries[0]["author_time"], int)
+
+
+def test_blame_file_chunk_pages_through_lines(tmp_path):
+    import subprocess
+
+    from seev.git_tools.analysis import blame_file, blame_file_chunk
+
+    ident = ["-c", "user.name=Ann", "-c", "user.email=ann@example.com"]
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    (tmp_path / "f.py").write_text("".join(f"line{i}\n" for i in range(1, 6)))
+    subprocess.run(["git", "-C", str(tmp_path), "add", "f.py"], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), *ident, "commit", "-q", "-m", "first"], check=True)
+    wd = str(tmp_path)
+
+    chunks, offset = [], 0
+    while offset is not None:
+        chunk = blame_file_chunk("f.py", offset=offset, limit=2, workdir=wd)
+        chunks.append(chunk["entries"])
+        offset = chunk["next_offset"]
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert [e for c in chunks for e in c] == blame_file("f.py", workdir=wd)["entries"]
+
+    # The requested range bounds the chunks too
+    ranged = blame_file_chunk("f.py", offset=1, limit=5, start_line=2, end_line=4, workdir=wd)
+    assert [e["code"] for e in ranged["entries"]] == ["line3", "line4"]
+    assert ranged["next_offset"] is None
+    assert "error" in blame_file_chunk("f.py", limit=0, workdir=wd)
+
+
+def test_blame_file_tolerates_non_utf8_source(tmp_path):
+    import subprocess
+
+    from seev.git_tools.analysis import blame_file
+
+    ident = ["-c", "user.name=Jos\u00e9", "-c", "user.email=j@example.com"]
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    (tmp_path / "legacy.py").write_bytes("caf\u00e9 = 1\n".encode("latin-1"))
+    subprocess.run(["git", "-C", str(tmp_path), "add", "."], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), *ident, "commit", "-q", "-m", "latin"], check=True)
+
+    (entry,) = blame_file("legacy.py", workdir=str(tmp_path))["entries"]
+    assert entry["code"] == "caf\ufffd = 1"
+    assert entry["author"] == "Jos\u00e9"
+
+
+def test_analyze_commits_matches_per_commit_helpers(tmp_path):
+    import subprocess
+
+    from seev.git_tools.analysis import (
+        analyze_commits,
+        categorize_commit,
+        detect_merge_info,
+        get_commit_statistics,
+    )
+
+    def git(*args):
+        ident = ["-c", "user.name=T", "-c", "user.email=t@example.com"]
+        return subprocess.run(
+            ["git", "-C", str(tmp_path), *ident, *args], check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    git("init", "-q", "-b", "main")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "feat(core): add a")
+    git("checkout", "-q", "-b", "side")
+    (tmp_path / "b.md").write_text("b\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "docs: b")
+    git("checkout", "-q", "main")
+    git("mv", "a.py", "c.py")
+    git("commit", "-q", "-m", "refactor: rename")
+    git("merge", "-q", "--no-ff", "side", "-m", "Merge pull request #12 from me/side")
+    shas = git("log", "--format=%H").split()
+    wd = str(tmp_path)
+
+    hashes = [shas[0], shas[2][:10], shas[-1], shas[0]]
+    result = analyze_commits(hashes, workdir=wd)
+    assert [r["hash"] for r in result] == hashes
+    for r in result:
+        h = r["hash"]
+        assert r["statistics"] == get_commit_statistics(h, workdir=wd)
+        assert r["category"] == categorize_commit(h, is_hash=True, workdir=wd)
+        assert r["merge_info"] == detect_merge_info(h, workdir=wd)
+    assert result[0]["merge_info"]["pr_number"] == 12
+
+    # An unknown hash fails the batch; every commit is then analyzed on its own
+    mixed = analyze_commits([shas[-1], "f" * 40], workdir=wd)
+    assert mixed[0]["category"]["type"] == "feat"
+    assert "error" in mixed[1]["statistics"]
+
+
+def test_commit_statistics_read_raw_paths_and_renames(tmp_path):
+    import subprocess
+
+    from seev.git_tools.analysis import analyze_commits, get_commit_statistics
+
+    def git(*args):
+        ident = ["-c", "user.name=T", "-c", "user.email=t@example.com"]
+        return subprocess.run(
+            ["git", "-C", str(tmp_path), *ident, *args], check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    git("init", "-q")
+    (tmp_path / "tab\tname.py").write_text("x = 1\n")
+    (tmp_path / "notes.txt").write_text("n\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "odd path")
+    git("mv", "notes.txt", "notes.rs")
+    git("commit", "-q", "-m", "rename")
+    git("commit", "-q", "--allow-empty", "-m", "empty")
+    shas = git("log", "--format=%H").split()
+    wd = str(tmp_path)
+
+    # Without -z the tab would be C-quoted and the .py suffix hidden behind a quote
+    odd = get_commit_statistics(shas[2], workdir=wd)
+    assert odd["by_language"]["Python"] == {"additions": 1, "deletions": 0, "files": 1}
+    renamed = get_commit_statistics(shas[1], workdir=wd)
+    assert renamed["files_changed"] == 1 and "Rust" in renamed["by_language"]
+    assert get_commit_statistics(shas[0], workdir=wd)["files_changed"] == 0
+
+    batch = analyze_commits(shas, workdir=wd)
+    assert [r["statistics"] for r in batch] == [get_commit_statistics(h, workdir=wd) for h in shas]
+
+
+def test_resolve_repo_root_caches_successes_only(monkeypatch, tmp_path):
+    import subprocess
+
+    from seev.git_tools.utils import resolve_repo_root
+
+    assert "error" in resolve_repo_root(str(tmp_path))
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    # The earlier failure was not cached
+    assert resolve_repo_root(str(tmp_path)) == {"path": str(tmp_path.resolve())}
+
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(cmd, **kwargs):
+        calls.append(cmd)
+        return real_run(cmd, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", counting_run)
+    monkeypatch.chdir(tmp_path)
+    assert resolve_repo_root(".") == {"path": str(tmp_path.resolve())}
+    assert resolve_repo_root(str(tmp_path))["path"] == str(tmp_path.resolve())
+    assert calls == []
+
+
+def test_categorize_commit_caches_subjects_of_full_hashes(monkeypatch, tmp_path):
+    import subprocess
+
+    from seev.git_tools.analysis import categorize_commit
+
+    ident = ["-c", "user.name=T", "-c", "user.email=t@example.com"]
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    subprocess.run(
+        ["git", "-C", str(tmp_path), *ident, "commit", "-q", "--allow-empty", "-m", "fix: x"],
+        check=True,
+    )
+    sha = subprocess.run(
+        ["git", "-C", str(tmp_path), "rev-parse", "HEAD"], capture_output=True, text=True
+    ).stdout.strip()
+
+    from seev.git_tools import analysis
+
+    shows = []
+    real_read = analysis.read_commit
+
+    def counting_read(repo_root, rev):
+        shows.append(rev)
+        return real_read(repo_root, rev)
+
+    monkeypatch.setattr(analysis, "read_commit", counting_read)
+    for _ in range(3):
+        assert categorize_commit(sha, is_hash=True, workdir=str(tmp_path))["type"] == "fix"
+    assert len(shows) == 1
+
+    # Movable names are resolved every time
+    categorize_commit("HEAD", is_hash=True, workdir=str(tmp_path))
+    categorize_commit("HEAD", is_hash=True, workdir=str(tmp_path))
+    assert len(shows) == 3
+
+
+def test_git_log_records_are_parsed_while_streaming(monkeypatch, tmp_path):
+    import subprocess
+
+    from seev.git_tools import utils
+    from seev.git_tools.commits import get_recent_commits
+
+    ident = ["-c", "user.name=Dev", "-c", "user.email=dev@example.com"]
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    for i in range(5):
+        subprocess.run(
+            ["git", "-C", str(tmp_path), *ident, "commit", "-q", "--allow-empty", "-m", f"c{i}|x"],
+            check=True,
+        )
+    monkeypatch.setenv("SEEV_TRACK_EMAILS", "dev@example.com")
+    # Tiny reads so records straddle chunk boundaries
+    monkeypatch.setattr(utils, "_STREAM_CHUNK_SIZE", 7)
+
+    commits = get_recent_commits(count=10, workdir=str(tmp_path))
+    assert [c["message"] for c in commits] == [f"c{i}|x" for i in reversed(range(5))]
+    assert all(c["author"] == "Dev" and len(c["hash"]) == 40 for c in commits)
+
+
+def test_split_stream_joins_records_across_chunks_and_keeps_the_tail():
+    import io
+
+    from seev.git_tools import utils
+
+    # The first record ends just past the first 64 KiB read; the last has no separator
+    head = "a" * (utils._STREAM_CHUNK_SIZE + 5)
+    stream = io.StringIO(f"{head}\0b\0\0tail")
+
+    assert list(utils._split_stream(stream, "\0")) == [head, "b", "", "tail"]
+    assert list(utils._split_stream(io.StringIO(""), "\0")) == []
+
+
+def test_run_git_streaming_reads_records_larger_than_a_chunk(tmp_path):
+    import subprocess
+
+    from seev.git_tools.utils import run_git_streaming
+
+    ident = ["-c", "user.name=Dev", "-c", "user.email=dev@example.com"]
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    subjects = ["x" * 70_000, "y" * 40_000]
+    for subject in subjects:
+        subprocess.run(
+            ["git", "-C", str(tmp_path), *ident, "commit", "-q", "--allow-empty", "-m", subject],
+            check=True,
+        )
+
+    records = run_git_streaming(["log", "-z", "--format=%s"], repo_root=str(tmp_path), sep="\0")
+    assert list(records) == subjects[::-1]
+    lines = run_git_streaming(["log", "--format=%s"], repo_root=str(tmp_path))
+    assert list(lines) == subjects[::-1]
+
+
+def test_run_git_streaming_raises_with_stderr_when_git_fails(tmp_path):
+    import subprocess
+
+    import pytest
+
+    from seev.git_tools.utils import run_git_streaming
+
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        list(run_git_streaming(["log", "no-such-ref"], repo_root=str(tmp_path)))
+    assert excinfo.value.returncode != 0
+    assert "no-such-ref" in excinfo.value.stderr
+
+
+def test_run_git_streaming_kills_git_when_closed_early(monkeypatch, tmp_path):
+    import signal
+    import subprocess
+
+    from seev.git_tools.utils import run_git_streaming
+
+    subprocess.run(["git", "-C", str(tmp_path), "init", "-q"], check=True)
+    big = tmp_path / "big.txt"
+    # Far more than a pipe buffer holds, so git is still writing when the reader stops
+    big.write_text("line\n" * 500_000)
+    oid = subprocess.run(
+        ["git", "-C", str(tmp_path), "hash-object", "-w", str(big)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+    procs = []
+    real_popen = subprocess.Popen
+
+    def spy(*args, **kwargs):
+        procs.append(real_popen(*args, **kwargs))
+        return procs[-1]
+
+    monkeypatch.setattr(subprocess, "Popen", spy)
+
+    lines = run_git_streaming(["cat-file", "blob", oid], repo_root=str(tmp_path))
+    assert next(lines) == "line"
+    lines.close()
+
+    (proc,) = procs
+    assert proc.returncode == -signal.SIGKILL
@@ -1,9 +1,18 @@
-import subprocess
+def make_git_output(commits):
+    # Helper to create `git log -z` records (unit-separated fields, NUL-separated records)
+    return "\x00".join(
+        "\x1f".join((c["hash"], c["author"], c["date"], c["message"])) for c in commits
+    )
 
 
-def make_git_output(commits):
-    # Helper to create git log-like lines
-    return "\n".join(f"{c['hash']}|{c['author']}|{c['date']}|{c['message']}" for c in commits)
+def fake_git_log(monkeypatch, output):
+    """Answer the streamed ``git log`` reads of the commit tools with ``output()``."""
+
+    def run_git_streaming(args, repo_root=None, sep="\n"):  # noqa: ARG001
+        assert args[0] == "log"
+        yield from filter(None, output().split(sep))
+
+    monkeypatch.setattr("seev.git_tools.commits.run_git_streaming", run_git_streaming)
 
 
 def test_default_no_db_autowrite(monkeypatch, tmp_path):
@@ -13,7 +22,7 @@ def test_default_no_db_autowrite(monkeypatch, tmp_path):
     # Configure tracked emails so git_tools runs
     monkeypatch.setenv("SEEV_TRACK_EMAILS", "dev@example.com")
 
-    # Stub subprocess.run for git log
+    # Stub the git log output
     commits = [
         {
             "hash": "abc",
@@ -23,13 +32,7 @@ def test_default_no_db_autowrite(monkeypatch, tmp_path):
         }
     ]
 
-    def fake_run(cmd, capture_output, text, check):  # noqa: ARG001
-        class R:
-            stdout = make_git_output(commits)
-
-        return R()
-
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    fake_git_log(monkeypatch, lambda: make_git_output(commits))
 
     calls = {"count": 0}
 
@@ -67,13 +70,7 @@ def test_db_autowrite_enabled(monkeypatch, tmp_path):
         }
     ]
 
-    def fake_run(cmd, capture_output, text, check):  # noqa: ARG001
-        class R:
-            stdout = make_git_output(commits)
-
-        return R()
-
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    fake_git_log(monkeypatch, lambda: make_git_output(commits))
 
     from seev.git_tools.commits import get_recent_commits
     from seev.storage import commits as sc, db as sdb
@@ -84,7 +81,103 @@ def test_db_autowrite_enabled(monkeypatch, tmp_path):
     out = get_recent_commits(count=1)
     assert isinstance(out, list) and len(out) == 1
 
-    # The commit should be persisted
+    # The commit should be persisted once the background writer has caught up
+    from seev.storage.commit_writer import flush_commit_writes
+
+    flush_commit_writes()
     rec = sc.get_commit_by_sha("def", db_path=str(db_file))
     assert rec is not None
     assert rec["sha"] == "def"
+
+
+def test_db_autowrite_runs_on_the_writer_thread(monkeypatch):
+    import threading
+
+    monkeypatch.setenv("SEEV_DB_AUTOWRITE", "1")
+    monkeypatch.setenv("SEEV_TRACK_EMAILS", "dev@example.com")
+    commits = [
+        {"hash": "f00", "author": "Dev", "date": "2025-10-09 14:00:00 +0000", "message": "m"}
+    ]
+
+    fake_git_log(monkeypatch, lambda: make_git_output(commits))
+    writes = []
+
+    def fake_bulk_upsert(payload, db_path=None):  # noqa: ARG001
+        writes.append((threading.current_thread(), [c["sha"] for c in payload]))
+        return len(payload)
+
+    import seev.storage.commits as storage_commits
+    from seev.git_tools.commits import get_recent_commits
+    from seev.storage.commit_writer import flush_commit_writes
+
+    monkeypatch.setattr(storage_commits, "bulk_upsert_commits", fake_bulk_upsert)
+
+    assert len(get_recent_commits(count=1)) == 1
+    flush_commit_writes()
+    assert [shas for _t, shas in writes] == [["f00"]]
+    assert writes[0][0] is not threading.current_thread()
+
+
+def test_db_autowrite_skips_commits_already_written(monkeypatch):
+    monkeypatch.setenv("SEEV_DB_AUTOWRITE", "1")
+    monkeypatch.setenv("SEEV_DB_PATH", "poll.sqlite3")
+    monkeypatch.setenv("SEEV_TRACK_EMAILS", "dev@example.com")
+    commits = [
+        {"hash": "b2", "author": "Dev", "date": "2025-10-09 15:00:00 +0000", "message": "two"},
+        {"hash": "a1", "author": "Dev", "date": "2025-10-09 14:00:00 +0000", "message": "one"},
+    ]
+    visible = {"count": 1}
+
+    fake_git_log(monkeypatch, lambda: make_git_output(commits[-visible["count"] :]))
+    writes = []
+
+    def fake_bulk_upsert(payload, db_path=None):  # noqa: ARG001
+        writes.append([c["sha"] for c in payload])
+        return len(payload)
+
+    import seev.storage.commits as storage_commits
+    from seev.git_tools.commits import get_recent_commits
+    from seev.storage.commit_writer import flush_commit_writes
+
+    monkeypatch.setattr(storage_commits, "bulk_upsert_commits", fake_bulk_upsert)
+
+    # Poll, a new commit lands, poll again with a different page size (no log cache hit)
+    assert len(get_recent_commits(count=5)) == 1
+    flush_commit_writes()
+    visible["count"] = 2
+    assert len(get_recent_commits(count=10)) == 2
+    flush_commit_writes()
+    assert writes == [["a1"], ["b2"]]
+
+
+def test_db_autowrite_requeues_commits_after_a_failed_write(monkeypatch):
+    import sqlite3
+
+    monkeypatch.setenv("SEEV_DB_AUTOWRITE", "1")
+    monkeypatch.setenv("SEEV_DB_PATH", "flaky.sqlite3")
+    monkeypatch.setenv("SEEV_TRACK_EMAILS", "dev@example.com")
+    commits = [
+        {"hash": "a1", "author": "Dev", "date": "2025-10-09 14:00:00 +0000", "message": "one"}
+    ]
+
+    fake_git_log(monkeypatch, lambda: make_git_output(commits))
+    writes = []
+
+    def flaky_bulk_upsert(payload, db_path=None):  # noqa: ARG001
+        writes.append([c["sha"] for c in payload])
+        if len(writes) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        return len(writes[-1])
+
+    import seev.storage.commits as storage_commits
+    from seev.git_tools.commits import get_recent_commits
+    from seev.storage.commit_writer import flush_commit_writes
+
+    monkeypatch.setattr(storage_commits, "bulk_upsert_commits", flaky_bulk_upsert)
+
+    # The first write fails, so the next query queues the commit again; once it is
+    # stored, later queries leave it alone
+    for count in (5, 10, 15):
+        assert len(get_recent_commits(count=count)) == 1
+        flush_commit_writes()
+    assert writes == [["a1"], ["a1"]]
@@ -19,10 +19,12 @@ def test_append_creates_file_and_heading(tmp_path, monkeypatch):
     target = tmp_path / "WORKLOG.md"
     cwd = tmp_path
     monkeypatch.chdir(cwd)
-    # Mock get_markdown_path to return default relative path
+    # Mock the worklog path resolution to return the default relative path
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
 
     res = append_to_markdown("first line\nsecond line")
 
@@ -46,7 +48,9 @@ def test_append_to_existing_heading_appends_below(tmp_path, monkeypatch):
     monkeypatch.chdir(cwd)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
 
     # First append creates file and heading
     res1 = append_to_markdown("a")
@@ -62,6 +66,116 @@ def test_append_to_existing_heading_appends_below(tmp_path, monkeypatch):
     assert f"{res1['heading']}\n\n- a\n- b\n- c\n" in content
 
 
+def test_append_to_last_section_appends_without_rewrite(tmp_path):
+    from unittest.mock import patch
+
+    import seev.markdown_tools
+
+    target = tmp_path / "WORKLOG.md"
+    target.write_text("# Worklog\n\n## 2024-01-01\n\n- a\n", encoding="utf-8")
+
+    with patch.object(
+        seev.markdown_tools, "_write_doc_lines", wraps=seev.markdown_tools._write_doc_lines
+    ) as rewrite:
+        res = append_to_markdown("b", file_path=str(target), date_str="2024-01-01")
+        assert rewrite.call_count == 0
+
+        # A CRLF file still goes through the normalizing rewrite
+        target.write_bytes(b"## 2024-01-01\r\n\r\n- a\r\n")
+        append_to_markdown("c", file_path=str(target), date_str="2024-01-01")
+        assert rewrite.call_count == 1
+
+    assert res["line_numbers_added"] == [6]
+    assert target.read_bytes() == b"## 2024-01-01\n\n- a\n- c\n"
+
+
+def test_append_to_last_section_skips_full_parse(tmp_path):
+    from unittest.mock import patch
+
+    import seev.markdown_tools
+
+    target = tmp_path / "WORKLOG.md"
+    history = "".join(f"## 2023-01-{d:02d}\n\n- old {d}\n\n" for d in range(1, 29))
+    target.write_text(history + "## 2024-01-01\n- a\n", encoding="utf-8")
+
+    with patch.object(
+        seev.markdown_tools, "_read_doc_lines", wraps=seev.markdown_tools._read_doc_lines
+    ) as full_read:
+        res = append_to_markdown("b", file_path=str(target), date_str="2024-01-01")
+        assert full_read.call_count == 0
+
+        # A second copy of the heading earlier in the file sends it down the full path
+        target.write_text("## 2024-01-01\n\n" + history + "## 2024-01-01\n", encoding="utf-8")
+        append_to_markdown("c", file_path=str(target), date_str="2024-01-01")
+        assert full_read.call_count == 1
+
+    # The section's first line is not blank, so a blank line separates the new bullet
+    assert res["line_numbers_added"] == [28 * 4 + 4]
+    assert res["heading_added"] is False
+    assert read(target).startswith("## 2024-01-01\n\n- c\n\n## 2023-01-01\n")
+
+
+def test_append_to_last_section_opens_file_once(tmp_path):
+    from unittest.mock import patch
+
+    target = tmp_path / "WORKLOG.md"
+    target.write_text("## 2024-01-01\n\n- a\n", encoding="utf-8")
+
+    with patch.object(Path, "open", autospec=True, side_effect=Path.open) as opened:
+        res = append_to_markdown("b", file_path=str(target), date_str="2024-01-01")
+
+    assert opened.call_count == 1
+    assert res["line_numbers_added"] == [4]
+    assert read(target) == "## 2024-01-01\n\n- a\n- b\n"
+
+
+def test_rewrite_keeps_symlink_and_permissions(tmp_path):
+    real = tmp_path / "real.md"
+    real.write_text("## 2024-01-02\n\n- later\n", encoding="utf-8")
+    real.chmod(0o640)
+    link = tmp_path / "WORKLOG.md"
+    link.symlink_to(real)
+
+    # Inserting an earlier date forces a full rewrite
+    res = append_to_markdown("earlier", file_path=str(link), date_str="2024-01-01")
+
+    assert res["ok"] is True
+    assert link.is_symlink()
+    assert (real.stat().st_mode & 0o777) == 0o640
+    assert read(real).startswith("## 2024-01-01\n\n- earlier\n")
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_rewrite_in_place_when_directory_is_not_writable(tmp_path, monkeypatch):
+    import tempfile
+
+    target = tmp_path / "WORKLOG.md"
+    target.write_text("## 2024-01-02\n\n- later\n", encoding="utf-8")
+    inode = target.stat().st_ino
+
+    def read_only_dir(*args, **kwargs):  # noqa: ARG001
+        raise PermissionError(13, "Permission denied")
+
+    monkeypatch.setattr(tempfile, "mkstemp", read_only_dir)
+    res = append_to_markdown("earlier", file_path=str(target), date_str="2024-01-01")
+
+    assert res["ok"] is True
+    assert target.stat().st_ino == inode
+    assert read(target).startswith("## 2024-01-01\n\n- earlier\n")
+
+
+def test_rewrite_keeps_hard_links(tmp_path):
+    target = tmp_path / "WORKLOG.md"
+    target.write_text("## 2024-01-02\n\n- later\n", encoding="utf-8")
+    other = tmp_path / "linked.md"
+    other.hardlink_to(target)
+
+    append_to_markdown("earlier", file_path=str(target), date_str="2024-01-01")
+
+    assert other.stat().st_ino == target.stat().st_ino
+    assert read(other).startswith("## 2024-01-01\n\n- earlier\n")
+
+
 def test_respects_file_path_argument_over_env(tmp_path, monkeypatch):
     file_arg = tmp_path / "custom.md"
     env_file = tmp_path / "env.md"
@@ -103,7 +217,9 @@ def test_handles_file_without_trailing_newline(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create file without trailing newline
@@ -210,7 +326,9 @@ def test_inserts_heading_in_middle_of_document(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create file with existing headings
@@ -240,7 +358,9 @@ def test_handles_file_ending_without_newline_edge_case(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create file that doesn't end with newline and has content at the end
@@ -257,12 +377,13 @@ def test_handles_file_ending_without_newline_edge_case(tmp_path, monkeypatch):
 def test_handles_general_exception(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
-    # Mock Path.write_text to raise an exception
+    # Make the worklog write raise an exception
     from unittest.mock import patch
 
-    with patch("seev.markdown_tools.Path.write_text") as mock_write:
-        mock_write.side_effect = OSError("Disk full")
-
+    with (
+        patch("seev.markdown_tools._write_doc_lines", side_effect=OSError("Disk full")),
+        patch("seev.markdown_tools._append_doc_lines", side_effect=OSError("Disk full")),
+    ):
         res = append_to_markdown("test content")
         assert "error" in res
         assert "Failed to append to markdown" in res["error"]
@@ -272,7 +393,9 @@ def test_heading_fallback_when_missing_after_insert(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create a scenario where heading might go missing (edge case)
@@ -1139,7 +1262,9 @@ def test_append_to_markdown_update_mode_false(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create initial content
@@ -1167,7 +1292,9 @@ def test_append_to_markdown_update_mode_true_no_existing(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create file without the target date
@@ -1203,7 +1330,9 @@ def test_append_to_markdown_update_mode_true_with_duplicates(tmp_path, monkeypat
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create initial content
@@ -1258,7 +1387,9 @@ def test_append_to_markdown_update_mode_preserves_other_dates(tmp_path, monkeypa
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create content with multiple dates
@@ -1300,7 +1431,9 @@ def test_append_to_markdown_update_mode_metrics_replacement(tmp_path, monkeypatc
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create initial content with metrics
@@ -1336,7 +1469,9 @@ def test_append_to_markdown_update_mode_return_structure(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create initial content
@@ -1370,7 +1505,9 @@ def test_append_to_markdown_backward_compatibility(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create initial content
@@ -1401,7 +1538,9 @@ def test_append_older_date_before_newer_date(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create file with a newer date
@@ -1437,7 +1576,9 @@ def test_append_newer_date_after_older_date(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create file with an older date
@@ -1473,7 +1614,9 @@ def test_append_date_in_middle_of_sequence(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create file with dates on 10th and 20th
@@ -1517,7 +1660,9 @@ def test_append_multiple_dates_maintains_order(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Start with empty file
@@ -1555,7 +1700,9 @@ def test_append_to_empty_file_with_date(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # File doesn't exist yet
@@ -1573,7 +1720,9 @@ def test_append_with_non_date_headings(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Create file with non-date headings and date headings
@@ -1620,7 +1769,9 @@ def test_append_across_months_and_years(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     import seev.markdown_tools
 
-    monkeypatch.setattr(seev.markdown_tools, "get_markdown_path", lambda: "WORKLOG.md")
+    monkeypatch.setattr(
+        seev.markdown_tools, "_resolve_markdown_path", lambda: ("WORKLOG.md", False)
+    )
     target = tmp_path / "WORKLOG.md"
 
     # Start with empty file
@@ -1654,3 +1805,23 @@ def test_append_across_months_and_years(tmp_path, monkeypatch):
         < positions["2024-12"]
         < positions["2025-02"]
     ), "Dates should be in ascending order across years"
+
+
+def test_today_iso_is_cached_until_local_midnight(monkeypatch):
+    from datetime import datetime
+
+    import seev.markdown_tools as mt
+
+    monkeypatch.setattr(mt, "_TODAY_CACHE", (0.0, ""))
+    late = datetime(2024, 3, 9, 23, 59, 58).timestamp()
+    clock = [late]
+    monkeypatch.setattr(mt.time, "time", lambda: clock[0])
+
+    assert mt._today_iso() == "2024-03-09"
+    cached = mt._TODAY_CACHE
+    clock[0] = late + 1
+    assert mt._today_iso() == "2024-03-09"
+    assert mt._TODAY_CACHE is cached
+
+    clock[0] = late + 2
+    assert mt._today_iso() == "2024-03-10"
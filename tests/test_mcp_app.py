@@ -45,3 +45,18 @@ def test_run_with_none_argv_default():
         mock_sys.argv = ["script.py"]
         run(None)
         mock_mcp.run.assert_called_once_with()
+
+
+def test_run_defaults_git_optional_locks_off(monkeypatch):
+    """The server's git subprocesses skip optional locks unless told otherwise."""
+    import os
+
+    monkeypatch.setenv("GIT_OPTIONAL_LOCKS", "1")
+    with patch("seev.mcp_app.mcp"):
+        run(["script.py"])
+    assert os.environ["GIT_OPTIONAL_LOCKS"] == "1"
+
+    monkeypatch.delenv("GIT_OPTIONAL_LOCKS")
+    with patch("seev.mcp_app.mcp"):
+        run(["script.py"])
+    assert os.environ["GIT_OPTIONAL_LOCKS"] == "0"
@@ -6,3 +6,43 @@ def test_prompts_are_registered_in_stub():
     prompts = getattr(mcp, "_prompts", [])
     # We expect at least one prompt to be registered
     assert any(p.get("name") == "worklog_entry" for p in prompts)
+
+
+def test_prompts_are_registered_once():
+    # Guard against duplicate module copies/imports double-registering prompts
+    names = [p.get("name") for p in getattr(mcp, "_prompts", [])]
+    assert names
+    assert len(names) == len(set(names))
+
+
+def test_nonempty_helper():
+    from seev.prompts import _nonempty
+
+    assert _nonempty("2025-01-01")
+    assert _nonempty("  x ")
+    assert not _nonempty("")
+    assert not _nonempty("   \n\t")
+    assert not _nonempty(None)
+
+
+def test_render_prompts_batch():
+    import asyncio
+
+    from seev.prompts import render_prompts
+
+    results = asyncio.run(
+        render_prompts(
+            [
+                {"name": "worklog_entry", "args": {"date": "2025-10-01"}},
+                {"name": "conversation_summary", "args": {"date": "2025-10-02"}},
+                {"name": "does_not_exist"},
+                {"name": "worklog_entry", "args": {"bogus": 1}},
+            ]
+        )
+    )
+    assert len(results) == 4
+    assert [m["role"] for m in results[0]] == ["system", "user"]
+    assert "2025-10-01" in results[0][1]["content"]
+    assert "2025-10-02" in results[1][1]["content"]
+    assert results[2] == {"name": "does_not_exist", "error": "Unknown prompt: does_not_exist"}
+    assert results[3]["name"] == "worklog_entry" and "error" in results[3]
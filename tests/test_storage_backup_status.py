@@ -26,3 +26,54 @@ def test_create_backup_and_status(tmp_path):
     assert len(day) == 8 and day.isdigit()
     assert len(hms) == 6 and hms.isdigit()
     assert fname == db_file.name
+
+
+def test_status_counts_rows_per_table(tmp_path):
+    db_file = str(tmp_path / "counts.sqlite3")
+    sdb.init_db(db_file)
+    with sdb.get_connection(db_file) as conn:
+        conn.executemany("INSERT INTO conversations(title) VALUES (?)", [("a",), ("b",)])
+
+    status = sdb.get_db_status(db_file)
+    assert status["ok"] is True
+    rows = {t["table"]: t["rows"] for t in status["tables"]}
+    assert [t["table"] for t in status["tables"]] == list(sdb._STATUS_TABLES)
+    assert rows["conversations"] == 2
+    assert rows["schema_version"] == 1
+    assert rows["commits"] == 0
+
+
+def test_status_flags_missing_table(tmp_path):
+    db_file = str(tmp_path / "missing.sqlite3")
+    sdb.init_db(db_file)
+    with sdb.get_connection(db_file) as conn:
+        conn.execute("DROP TABLE commit_conversations")
+
+    status = sdb.get_db_status(db_file)
+    assert status["ok"] is False
+    rows = {t["table"]: t["rows"] for t in status["tables"]}
+    assert rows["commit_conversations"] == 0
+    assert status["schema_version"] >= 1
+
+
+def test_backup_includes_uncheckpointed_wal_writes(tmp_path):
+    import sqlite3
+
+    db_file = str(tmp_path / "wal.sqlite3")
+    sdb.init_db(db_file)
+    writer = sqlite3.connect(db_file)
+    try:
+        writer.execute("PRAGMA journal_mode = WAL")
+        writer.execute("PRAGMA wal_autocheckpoint = 0")
+        writer.execute("INSERT INTO conversations (title) VALUES ('in-wal')")
+        writer.commit()
+
+        backup_path = sdb.create_backup(db_file, backups_root=str(tmp_path / "backups"))
+    finally:
+        writer.close()
+
+    copy = sqlite3.connect(str(backup_path))
+    try:
+        assert copy.execute("SELECT title FROM conversations").fetchall() == [("in-wal",)]
+    finally:
+        copy.close()
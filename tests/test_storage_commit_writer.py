@@ -0,0 +1,72 @@
+import threading
+
+from seev.storage import commit_writer, commits as sc, db as sdb
+
+
+def _commit(sha: str, message: str) -> dict:
+    return {"sha": sha, "author_date": "2025-10-09 12:00:00 +0000", "message": message}
+
+
+def test_writer_coalesces_batches_into_one_write_per_db(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def fake_bulk_upsert(payload, db_path=None):
+        release.wait(5)
+        calls.append((db_path, [(c["sha"], c["message"]) for c in payload]))
+        return len(payload)
+
+    monkeypatch.setattr(sc, "bulk_upsert_commits", fake_bulk_upsert)
+    writer = commit_writer.CommitWriter(flush_interval=0.5)
+    try:
+        writer.put([_commit("a", "1"), _commit("b", "1")], "one.db")
+        writer.put([_commit("a", "2")], "one.db")
+        writer.put([_commit("c", "1")], "two.db")
+        writer.put([], "one.db")
+        release.set()
+        writer.flush()
+    finally:
+        writer.close()
+
+    # One tick: the last version of each SHA, one call per database
+    assert sorted(calls) == [
+        ("one.db", [("b", "1"), ("a", "2")]),
+        ("two.db", [("c", "1")]),
+    ]
+
+
+def test_writer_persists_and_survives_write_errors(tmp_path, monkeypatch):
+    db = str(tmp_path / "w.sqlite3")
+    sdb.init_db(db)
+    dropped = []
+    writer = commit_writer.CommitWriter(flush_interval=0.01)
+    try:
+        bad_db = str(tmp_path / "missing" / "dir" / "\0.db")
+        writer.put([_commit("bad", "x")], bad_db, on_failure=dropped.append)
+        writer.put([_commit("abc", "hello")], db, on_failure=dropped.append)
+        writer.flush()
+    finally:
+        writer.close()
+
+    assert sc.get_commit_by_sha("abc", db_path=db)["message"] == "hello"
+    assert dropped == [["bad"]]
+
+
+def test_writer_thread_closes_its_connections_when_stopped(tmp_path, monkeypatch):
+    db = str(tmp_path / "w.sqlite3")
+    sdb.init_db(db)
+    closed_on = []
+    close_connection = sdb.close_connection
+
+    def spy(conn):
+        closed_on.append(threading.current_thread().name)
+        close_connection(conn)
+
+    monkeypatch.setattr(sdb, "close_connection", spy)
+    writer = commit_writer.CommitWriter(flush_interval=0.01)
+    writer.put([_commit("abc", "hello")], db)
+    writer.flush()
+    assert closed_on == []
+    writer.close()
+
+    assert closed_on == ["seev-commit-writer"]
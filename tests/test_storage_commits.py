@@ -43,3 +43,64 @@ def test_insert_and_get_commit_roundtrip(tmp_path):
     assert s["date"] == "2025-10-09T12:00:00Z"
     assert s["title"] == "Add feature X"
     assert s["stats"] == {"insertions": 10, "deletions": 2, "files": 3}
+
+
+def test_query_commits_by_date_filters(tmp_path):
+    db_file = str(tmp_path / "commits.sqlite3")
+    sdb.init_db(db_file)
+    for sha, email, name, when in [
+        ("a1", "alice@example.com", "Alice", "2025-10-01T09:00:00Z"),
+        ("b2", "bob@example.com", "Bob", "2025-10-02T09:00:00Z"),
+        ("c3", "carol@example.com", "Carol", "2025-10-05T09:00:00Z"),
+    ]:
+        sc.insert_commit(
+            sha=sha,
+            author_email=email,
+            author_name=name,
+            author_date=when,
+            message=f"work by {name}",
+            db_path=db_file,
+        )
+
+    in_range = sc.query_commits_by_date("2025-10-01", "2025-10-03", db_path=db_file)
+    assert [c["hash"] for c in in_range] == ["b2", "a1"]
+
+    one_author = sc.query_commits_by_date("2025-10-01", "", authors=["alice"], db_path=db_file)
+    assert [c["hash"] for c in one_author] == ["a1"]
+
+    two_authors = sc.query_commits_by_date(
+        "2025-10-01", "", authors=["alice", "carol@"], db_path=db_file
+    )
+    assert [c["hash"] for c in two_authors] == ["c3", "a1"]
+
+    empty = sc.query_commits_by_date("2024-01-01", "2024-01-02", db_path=db_file)
+    assert empty == [{"info": "No commits found in date range"}]
+
+
+def test_bulk_insert_helpers_skip_existing_rows(tmp_path, monkeypatch):
+    db_file = str(tmp_path / "bulk.sqlite3")
+    sdb.init_db(db_file)
+    # Small batches so the generator is consumed across several executemany calls
+    monkeypatch.setattr(sdb, "_BULK_BATCH_SIZE", 2)
+
+    def gen():
+        for i in range(5):
+            yield {"sha": f"s{i}", "author_date": f"2024-01-0{i + 1}T00:00:00", "message": "m"}
+
+    assert sc.insert_commits_many(gen(), db_path=db_file) == 5
+    # Re-inserting existing SHAs is a no-op
+    assert sc.insert_commits_many(gen(), db_path=db_file) == 0
+    assert len(sc.list_commits(db_path=db_file)) == 5
+
+    cid = sc.get_commit_by_sha("s0", db_path=db_file)["id"]
+    files = [
+        {"file_path": "a.py", "status": "added", "additions": 3},
+        {"file_path": "b.py", "status": "modified"},
+        {"file_path": "a.py", "status": "modified"},
+    ]
+    assert sc.insert_commit_files_many(cid, files, db_path=db_file) == 2
+    with sdb.get_connection(db_file) as conn:
+        rows = conn.execute(
+            "SELECT file_path, status, additions, deletions FROM commit_files ORDER BY file_path"
+        ).fetchall()
+    assert [tuple(r) for r in rows] == [("a.py", "added", 3, 0), ("b.py", "modified", 0, 0)]
@@ -39,3 +39,73 @@ def test_add_and_list_summaries(tmp_path):
     )
     assert len(rows2) == 1
     assert rows2[0]["id"] == sid2
+
+
+def test_list_summaries_date_range(tmp_path):
+    db = str(tmp_path / "conv.sqlite3")
+    sdb.init_db(db)
+    cid = conv.add_conversation("Range", db_path=db)
+    ids = {
+        d: summ.add_summary(date=d, conversation_id=cid, title=None, summary=d, db_path=db)
+        for d in ("2025-10-25", "2025-10-26", "2025-10-27")
+    }
+
+    rows = summ.list_summaries({"date_from": "2025-10-26", "date_until": "2025-10-27"}, db_path=db)
+    assert [r["id"] for r in rows] == [ids["2025-10-26"]]
+
+    rows = summ.list_summaries({"date_until": "2025-10-27"}, db_path=db)
+    assert [r["date"] for r in rows] == ["2025-10-26", "2025-10-25"]
+
+
+def test_recent_conversations_until_is_inclusive(monkeypatch):
+    import asyncio
+
+    from seev import conversation_tools
+
+    captured = {}
+
+    def fake_list(filters):
+        captured.update(filters)
+        return []
+
+    monkeypatch.setattr(conversation_tools, "list_summaries", fake_list)
+    tool = getattr(conversation_tools.get_recent_conversations, "fn", None)
+    tool = tool or conversation_tools.get_recent_conversations
+    asyncio.run(tool(date="2025-10-26", until="2025-10-31"))
+    assert captured == {"limit": 10, "date_from": "2025-10-26", "date_until": "2025-11-01"}
+
+
+def test_recent_conversations_previews_only_on_request(tmp_path, monkeypatch):
+    import asyncio
+
+    from seev import conversation_tools
+
+    db = str(tmp_path / "db.sqlite3")
+    monkeypatch.setenv("SEEV_DB_PATH", db)
+    with_msg = conv.add_conversation(title="a", db_path=db)
+    conv.add_message(with_msg, "user", "  first question  ", db_path=db)
+    silent = conv.add_conversation(title="b", db_path=db)
+    for cid in (with_msg, silent):
+        summ.add_summary(date="2025-10-26", conversation_id=cid, title="t", summary="s", db_path=db)
+
+    calls = []
+    real = conversation_tools.first_user_message_previews
+
+    def spy(ids):
+        ids = list(ids)
+        calls.append(ids)
+        return real(ids)
+
+    monkeypatch.setattr(conversation_tools, "first_user_message_previews", spy)
+    tool = getattr(conversation_tools.get_recent_conversations, "fn", None)
+    tool = tool or conversation_tools.get_recent_conversations
+
+    plain = asyncio.run(tool(date="2025-10-26"))
+    assert calls == [] and all("first_message" not in r for r in plain)
+
+    rows = asyncio.run(tool(date="2025-10-26", include_preview=True))
+    assert len(calls) == 1
+    assert {r["conversation_id"]: r["first_message"] for r in rows} == {
+        with_msg: "first question",
+        silent: None,
+    }
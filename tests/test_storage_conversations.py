@@ -20,3 +20,132 @@ def test_create_conversation_and_messages(tmp_path):
     assert convo is not None
     assert convo.get("title") == "Test Chat"
     assert "created_at" in convo and "updated_at" in convo
+
+
+def test_list_messages_uses_index_order_without_sort(tmp_path):
+    db_file = tmp_path / "conv.sqlite3"
+    sdb.init_db(str(db_file))
+
+    with sdb.get_connection(str(db_file)) as conn:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {conv._LIST_MESSAGES_SQL}", (1,)).fetchall()
+    details = " | ".join(str(r[3]) for r in plan)
+    assert "USING INDEX idx_messages_conversation" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_add_messages_batch_touches_conversation(tmp_path):
+    db_file = tmp_path / "conv.sqlite3"
+    sdb.init_db(str(db_file))
+
+    cid = conv.create_conversation("Batch", db_path=str(db_file))
+    with sdb.get_connection(str(db_file)) as conn:
+        conn.execute(
+            "UPDATE conversations SET updated_at = ? WHERE id = ?", ("2000-01-01 00:00:00", cid)
+        )
+
+    inserted = conv.add_messages(
+        cid, [("user", "one"), ("assistant", "two"), ("user", "three")], db_path=str(db_file)
+    )
+    assert inserted == 3
+    assert [m["content"] for m in conv.list_messages(cid, db_path=str(db_file))] == [
+        "one",
+        "two",
+        "three",
+    ]
+
+    # The messages trigger refreshes updated_at without an explicit UPDATE
+    convo = conv.get_conversation(cid, db_path=str(db_file))
+    assert convo is not None
+    assert convo["updated_at"] != "2000-01-01 00:00:00"
+
+
+def test_insert_messages_many_spans_conversations(tmp_path):
+    db_file = str(tmp_path / "msgs.sqlite3")
+    sdb.init_db(db_file)
+    a = conv.create_conversation("a", db_path=db_file)
+    b = conv.create_conversation("b", db_path=db_file)
+
+    msgs = (
+        {"conversation_id": cid, "role": "user", "content": f"m{i}"}
+        for i, cid in enumerate([a, b, a])
+    )
+    assert conv.insert_messages_many(msgs, db_path=db_file) == 3
+    assert [m["content"] for m in conv.list_messages(a, db_path=db_file)] == ["m0", "m2"]
+    assert [m["content"] for m in conv.list_messages(b, db_path=db_file)] == ["m1"]
+
+
+def test_first_user_message_previews_use_partial_index(tmp_path):
+    db_file = str(tmp_path / "first.sqlite3")
+    sdb.init_db(db_file)
+    cid = conv.create_conversation("t", db_path=db_file)
+
+    with sdb.get_connection(db_file) as conn:
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN {conv._FIRST_USER_PREVIEW_SQL.format('?')}", (cid,)
+        )
+        details = " | ".join(str(r[3]) for r in plan)
+        assert "idx_messages_first_user" in details
+        assert "TEMP B-TREE" not in details
+
+        links_plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT commit_sha FROM commit_conversations "
+            "WHERE conversation_id = ? ORDER BY created_at DESC",
+            (cid,),
+        )
+        details = " | ".join(str(r[3]) for r in links_plan)
+        assert "idx_commit_conversations_conv_created" in details
+        assert "TEMP B-TREE" not in details
+
+
+def test_conversations_carry_message_count(tmp_path):
+    db = str(tmp_path / "conv.sqlite3")
+    sdb.init_db(db)
+    a = conv.add_conversation("A", db_path=db)
+    empty = conv.add_conversation("Empty", db_path=db)
+    conv.add_messages(a, [("system", "setup"), ("user", "first"), ("user", "second")], db_path=db)
+
+    assert conv.get_conversation(a, db_path=db)["message_count"] == 3
+    listed = conv.query_conversations({"ids": [a, empty]}, db_path=db)
+    assert {c["id"]: c["message_count"] for c in listed} == {a: 3, empty: 0}
+
+
+def test_first_user_message_previews(tmp_path):
+    db = str(tmp_path / "conv.sqlite3")
+    sdb.init_db(db)
+    short = conv.add_conversation("short", db_path=db)
+    long = conv.add_conversation("long", db_path=db)
+    blank = conv.add_conversation("blank", db_path=db)
+    conv.add_messages(
+        short, [("assistant", "hi"), ("user", "  fix the bug \n"), ("user", "x")], db_path=db
+    )
+    conv.add_messages(long, [("user", "a" * 150)], db_path=db)
+    conv.add_messages(blank, [("user", " \n ")], db_path=db)
+
+    previews = conv.first_user_message_previews([short, long, blank], db_path=db)
+
+    assert previews == {short: "fix the bug", long: "a" * 97 + "..."}
+
+
+def test_first_user_message_previews_skip_blank_first_message(tmp_path):
+    db = str(tmp_path / "conv.sqlite3")
+    sdb.init_db(db)
+    ascii_blank = conv.add_conversation("ascii", db_path=db)
+    unicode_blank = conv.add_conversation("unicode", db_path=db)
+    conv.add_messages(ascii_blank, [("user", " \t\n"), ("user", "real ask")], db_path=db)
+    conv.add_messages(
+        unicode_blank, [("user", "\u00a0\u3000"), ("user", "\u2003"), ("user", "later")], db_path=db
+    )
+
+    previews = conv.first_user_message_previews([ascii_blank, unicode_blank], db_path=db)
+
+    assert previews == {ascii_blank: "real ask", unicode_blank: "later"}
+
+
+def test_first_user_message_previews_strip_non_ascii_whitespace(tmp_path):
+    db = str(tmp_path / "conv.sqlite3")
+    sdb.init_db(db)
+    cid = conv.add_conversation("nbsp", db_path=db)
+    conv.add_messages(cid, [("user", "\u00a0 \u2003 fix it\u3000")], db_path=db)
+
+    assert conv.first_user_message_previews([cid], db_path=db) == {cid: "fix it"}
+    assert conv.first_user_message_previews([cid], limit=5, db_path=db) == {cid: "fi..."}
@@ -46,3 +46,15 @@ def test_query_conversations_basic_filters(tmp_path):
     page1 = conv.query_conversations({"limit": 1}, db_path=str(db_file))
     page2 = conv.query_conversations({"limit": 1, "offset": 1}, db_path=str(db_file))
     assert page1[0]["id"] != page2[0]["id"]
+
+
+def test_query_conversations_breaks_timestamp_ties_by_id(tmp_path):
+    db = str(tmp_path / "conv.sqlite3")
+    sdb.init_db(db)
+    ids = [conv.add_conversation(f"c{i}", db_path=db) for i in range(3)]
+    with sdb.get_connection(db) as conn:
+        conn.execute("UPDATE conversations SET updated_at = '2025-01-01 00:00:00'")
+
+    assert [c["id"] for c in conv.query_conversations(db_path=db)] == ids[::-1]
+    asc = conv.query_conversations({"order": "asc"}, db_path=db)
+    assert [c["id"] for c in asc] == ids
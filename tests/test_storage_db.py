@@ -33,3 +33,267 @@ def test_memory_db_creates_schema():
         assert isinstance(conn, sqlite3.Connection)
         fk = conn.execute("PRAGMA foreign_keys").fetchone()[0]
         assert fk == 1
+
+
+def test_get_connection_reuses_connection_per_thread(tmp_path):
+    import threading
+
+    db_file = str(tmp_path / "shared.sqlite3")
+    conn1 = sdb.get_connection(db_file)
+    conn2 = sdb.get_connection(db_file)
+    assert conn1 is conn2
+
+    # Context manager use commits but keeps the connection open
+    with sdb.get_connection(db_file) as conn:
+        conn.execute("INSERT INTO conversations (title) VALUES ('x')")
+    assert conn1.execute("SELECT COUNT(*) FROM conversations").fetchone()[0] == 1
+
+    # Other threads get their own connection
+    other: list[sqlite3.Connection] = []
+    t = threading.Thread(target=lambda: other.append(sdb.get_connection(db_file)))
+    t.start()
+    t.join()
+    assert other and other[0] is not conn1
+
+    sdb.close_all()
+    conn3 = sdb.get_connection(db_file)
+    assert conn3 is not conn1
+    sdb.close_all()
+
+
+def test_close_all_closes_connections_of_worker_threads(tmp_path):
+    import threading
+
+    import pytest
+
+    db_file = str(tmp_path / "workers.sqlite3")
+    opened = threading.Event()
+    closed = threading.Event()
+    seen: list[sqlite3.Connection] = []
+
+    def worker():
+        seen.append(sdb.get_connection(db_file))
+        opened.set()
+        closed.wait(5)
+        # The next lookup on this thread opens a fresh connection
+        seen.append(sdb.get_connection(db_file))
+
+    t = threading.Thread(target=worker)
+    t.start()
+    assert opened.wait(5)
+    sdb.close_all()
+    closed.set()
+    t.join()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        seen[0].execute("SELECT 1")
+    assert seen[1] is not seen[0]
+    sdb.close_all()
+    assert not any(sdb._all_caches.values())
+
+
+def test_file_connection_uses_wal_and_tuned_pragmas(tmp_path):
+    db_file = str(tmp_path / "wal.sqlite3")
+    conn = sdb.get_connection(db_file)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    sdb.close_all()
+
+
+def test_cached_connection_is_periodically_optimized(tmp_path):
+    from unittest.mock import MagicMock
+
+    db_file = str(tmp_path / "opt.sqlite3")
+    real = sdb.get_connection(db_file)
+    real.close()
+    key = str(tmp_path / "opt.sqlite3")
+
+    fake = MagicMock()
+    sdb._thread_connections()[key] = fake
+    # Within the interval the cached connection is returned untouched
+    assert sdb.get_connection(db_file) is fake
+    fake.execute.assert_not_called()
+
+    # Once the interval elapses, PRAGMA optimize runs before handing it out
+    sdb._tls.optimized_at[key] -= sdb._OPTIMIZE_INTERVAL_SECONDS
+    assert sdb.get_connection(db_file) is fake
+    fake.execute.assert_called_once_with("PRAGMA optimize;")
+
+    # close_all optimizes and closes
+    fake.reset_mock()
+    sdb.close_all()
+    fake.execute.assert_called_once_with("PRAGMA optimize;")
+    fake.close.assert_called_once_with()
+
+
+def test_schema_version_mirrored_to_user_version_for_readonly_fast_path(tmp_path):
+    db_file = tmp_path / "ro.sqlite3"
+    version = sdb.init_db(str(db_file))
+    assert version == max(sdb.MIGRATIONS)
+
+    ro = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+    try:
+        assert ro.execute("PRAGMA user_version").fetchone()[0] == version
+        # Up-to-date read-only database: no schema_version probe or write is attempted
+        assert sdb.migrate_conn(ro) == version
+    finally:
+        ro.close()
+
+
+def test_legacy_database_gets_user_version_synced(tmp_path):
+    db_file = str(tmp_path / "legacy.sqlite3")
+    version = sdb.init_db(db_file)
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+    try:
+        assert sdb.migrate_conn(conn) == version
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == version
+    finally:
+        conn.close()
+
+
+def test_version_cache_is_invalidated_when_file_is_recreated(tmp_path):
+    import os
+
+    db_file = tmp_path / "recreated.sqlite3"
+    sdb.init_db(str(db_file))
+    assert sdb._cached_version(str(db_file)) == max(sdb.MIGRATIONS)
+
+    os.remove(db_file)
+    sqlite3.connect(str(db_file)).close()  # empty file, new inode
+    assert sdb._cached_version(str(db_file)) is None
+    conn = sdb._open_connection(str(db_file))
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def test_failed_migration_rolls_back_as_a_unit(tmp_path, monkeypatch):
+    import pytest
+
+    db_file = str(tmp_path / "rollback.sqlite3")
+    latest = sdb.init_db(db_file)
+
+    def _bad(conn):
+        sdb._execute_statements(
+            conn,
+            """
+            CREATE TABLE half_done (id INTEGER PRIMARY KEY);
+            CREATE TABLE half_done (id INTEGER PRIMARY KEY);
+            """,
+        )
+
+    monkeypatch.setitem(sdb.MIGRATIONS, latest + 1, _bad)
+    conn = sqlite3.connect(db_file)
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            sdb.migrate_conn(conn)
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master")}
+        assert "half_done" not in tables
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == latest
+        row = conn.execute("SELECT current_version FROM schema_version").fetchone()
+        assert row[0] == latest
+    finally:
+        conn.close()
+
+
+def test_v5_rebuild_keeps_rows_and_switches_defaults(tmp_path):
+    db_file = str(tmp_path / "v5.sqlite3")
+    assert sdb.migrate(db_file, target=4) == 4
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        conn.execute("INSERT INTO conversations (id, title) VALUES (7, 'c')")
+        conn.execute("INSERT INTO conversations (id, title) VALUES (9, 'gone')")
+        conn.execute("DELETE FROM conversations WHERE id = 9")
+        conn.execute(
+            "INSERT INTO messages (conversation_id, role, content) VALUES (7, 'user', 'hi')"
+        )
+        conn.execute(
+            "INSERT INTO conversation_summaries (date, conversation_id, summary) "
+            "VALUES ('2024-01-01', 7, 's')"
+        )
+        conn.commit()
+
+        assert sdb.migrate_conn(conn, 5) == 5
+        # Foreign key enforcement is restored after the rebuild
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        # Child rows survived dropping and recreating the parent table
+        assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM conversation_summaries").fetchone()[0] == 1
+        # AUTOINCREMENT counter is preserved, so deleted ids are not reused
+        new_id = conn.execute("INSERT INTO conversations (title) VALUES ('n')").lastrowid
+        assert new_id == 10
+
+        schema = "\n".join(r[0] for r in conn.execute("SELECT sql FROM sqlite_master") if r[0])
+        assert "datetime('now')" not in schema
+        assert "CURRENT_TIMESTAMP" in schema
+        indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        assert {"idx_messages_conversation", "idx_commits_author_date"} <= indexes
+
+        # The touch trigger is back
+        conn.execute("UPDATE conversations SET updated_at = '2000-01-01 00:00:00' WHERE id = 7")
+        conn.execute(
+            "INSERT INTO messages (conversation_id, role, content) VALUES (7, 'user', 'x')"
+        )
+        touched = conn.execute("SELECT updated_at FROM conversations WHERE id = 7").fetchone()[0]
+        assert touched > "2000-01-01 00:00:00"
+    finally:
+        conn.close()
+
+
+def test_conversation_listing_is_served_by_index(tmp_path):
+    db_file = str(tmp_path / "plan.sqlite3")
+    sdb.init_db(db_file)
+    with sdb.get_connection(db_file) as conn:
+        plan = " ".join(
+            r[3]
+            for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM conversations "
+                "ORDER BY updated_at DESC, id DESC LIMIT 10"
+            )
+        )
+    assert "idx_conversations_updated" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_v8_message_count_backfilled_and_maintained(tmp_path):
+    db_file = str(tmp_path / "v8.sqlite3")
+    assert sdb.migrate(db_file, target=7) == 7
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.execute("INSERT INTO conversations (id, title) VALUES (1, 'a'), (2, 'b')")
+        conn.execute(
+            "INSERT INTO messages (conversation_id, role, content) "
+            "VALUES (1, 'user', 'x'), (1, 'assistant', 'y')"
+        )
+        conn.commit()
+        assert sdb.migrate_conn(conn, 8) == 8
+
+        def counts():
+            return dict(conn.execute("SELECT id, message_count FROM conversations").fetchall())
+
+        assert counts() == {1: 2, 2: 0}
+        conn.execute(
+            "INSERT INTO messages (conversation_id, role, content) VALUES (2, 'user', 'z')"
+        )
+        conn.execute("UPDATE messages SET conversation_id = 2 WHERE content = 'y'")
+        assert counts() == {1: 1, 2: 2}
+        conn.execute("DELETE FROM messages WHERE conversation_id = 2")
+        assert counts() == {1: 1, 2: 0}
+    finally:
+        conn.close()
+
+
+def test_now_is_memoized_per_second(monkeypatch):
+    monkeypatch.setattr(sdb, "_NOW_CACHE", (-1, ""))
+    monkeypatch.setattr(sdb.time, "time", lambda: 86400.25)
+    first = sdb._now()
+    assert first == "1970-01-02T00:00:00Z"
+    assert sdb._now() is first
+    monkeypatch.setattr(sdb.time, "time", lambda: 86401.0)
+    assert sdb._now() == "1970-01-02T00:00:01Z"